@@ -1,4 +1,6 @@
 import time
+# Taken before the remaining imports so the start-up benchmark includes them
+_START_TIME = time.perf_counter()
 import csv
 import tkinter as tk
 import os
@@ -8,28 +10,145 @@ import subprocess
 import threading
 import queue
 import random
+import socket
+import socketserver
 import re
+import json
+import sqlite3
+import hashlib
+import math
+import tempfile
+import shutil
+from array import array
+from collections import deque
 from datetime import datetime
-from tkinter import ttk, filedialog, messagebox, font
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from tkinter import ttk, messagebox, font
+
+# Selenium is only imported when a scrape starts, see load_selenium()
+webdriver = None
+Service = None
+Options = None
+By = None
+Keys = None
+WebDriverWait = None
+EC = None
+
+
+def load_selenium():
+    """Import selenium on first use to keep it off the start-up path"""
+    global webdriver, Service, Options, By, Keys, WebDriverWait, EC
+    if webdriver is not None:
+        return
+    from selenium import webdriver as selenium_webdriver
+    from selenium.webdriver.chrome.service import Service as ChromeService
+    from selenium.webdriver.chrome.options import Options as ChromeOptions
+    from selenium.webdriver.common.by import By as SeleniumBy
+    from selenium.webdriver.common.keys import Keys as SeleniumKeys
+    from selenium.webdriver.support.ui import WebDriverWait as SeleniumWebDriverWait
+    from selenium.webdriver.support import expected_conditions
+    Service, Options, By, Keys = ChromeService, ChromeOptions, SeleniumBy, SeleniumKeys
+    WebDriverWait, EC = SeleniumWebDriverWait, expected_conditions
+    webdriver = selenium_webdriver
+
+
+def application_dir():
+    """Return the directory holding the application and its bundled files"""
+    if getattr(sys, 'frozen', False):
+        # If the application is run as a bundle
+        return sys._MEIPASS
+    # If run as a normal Python script
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def parse_field_list(text):
+    """Parse a comma separated list of lead fields, returning None if one is unknown"""
+    fields = [field.strip().lower() for field in text.split(",") if field.strip()]
+    if any(field not in Lead.CORE_FIELDS for field in fields):
+        return None
+    return fields
+
 
 class ScraperThread(threading.Thread):
     """Thread class for running the scraping process in the background"""
-    def __init__(self, scraper, params):
+    # Runs of at least this many results keep leads in a LeadColumnStore
+    COLUMNAR_THRESHOLD = 500
+    
+    def __init__(self, locator, params, sink=None):
         threading.Thread.__init__(self)
-        self.scraper = scraper
+        self.locator = locator
         self.params = params
         self.queue = queue.Queue()
         self.stop_event = threading.Event()
+        self.sink = sink
+        self.driver = None
+        self.results_url = None
+        self.selectors = None
+        self.enricher = None
+        self.review_sink = None
+        self.dead_letters = None
+        self.profile = None
+        self.tracer = None
+        self.delta = None
+        self.gave_up = 0
+        # Set when the results list was cut at num_results and may hold more places
+        self.results_cut = False
+        # Committed leads in their final form, large runs keep them in the compact columnar store
+        target = len(params.get('place_urls') or ()) or int(params.get('num_results') or 0)
+        self.leads = LeadColumnStore() if target >= self.COLUMNAR_THRESHOLD else []
+        self.leads_lock = threading.Lock()
+        self.started = None
+        self.watchdog = CommandWatchdog(self.stop_event, params.get('lead_timeout'))
+        self.memory_watchdog = BrowserMemoryWatchdog(
+            max_browser_mb=params.get('max_browser_mb', BrowserMemoryWatchdog.MAX_BROWSER_MB),
+            max_heap_mb=params.get('max_heap_mb', BrowserMemoryWatchdog.MAX_HEAP_MB),
+            recycle_every=params.get('recycle_every', BrowserMemoryWatchdog.RECYCLE_EVERY))
         self.daemon = True  # Thread will exit when main program exits
         
     def run(self):
+        self.started = time.monotonic()
+        self.watchdog.start()
+        # cProfile only sees the thread it is enabled in
+        profiler = None
+        if self.params.get('profile'):
+            import cProfile
+            profiler = cProfile.Profile()
+            profiler.enable()
+        try:
+            self._run()
+        finally:
+            self.watchdog.close()
+            if profiler:
+                profiler.disable()
+            if self.tracer or profiler:
+                self.save_diagnostics(profiler)
+                
+    def save_diagnostics(self, profiler):
+        """Write the command trace report and the Python profile beside the output file"""
+        output_file = self.params.get('output_file') or "google_maps_leads.csv"
+        report = {}
+        try:
+            if self.tracer:
+                self.tracer.close()
+                report = self.tracer.report()
+                self.queue.put(('status', self.tracer.summary()))
+            if profiler:
+                import pstats
+                profile_path = CommandTracer.filename_for(output_file, "_profile.prof")
+                profiler.dump_stats(profile_path)
+                stats = pstats.Stats(profiler)
+                functions = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:CommandTracer.TOP]
+                report["python"] = [{"function": f"{path}:{line}({name})", "calls": calls, "seconds": round(own, 4),
+                                     "cumulative_seconds": round(cumulative, 4)}
+                                    for (path, line, name), (primitive, calls, own, cumulative, callers) in functions]
+                self.queue.put(('status', f"Saved the Python profile to {profile_path}"))
+            report_path = CommandTracer.filename_for(output_file, "_trace.json")
+            with open(report_path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            self.queue.put(('status', f"Saved the diagnostics report to {report_path}"))
+        except Exception as e:
+            self.queue.put(('status', f"Could not save diagnostics: {str(e)}"))
+            
+    def _run(self):
         try:
             # Extract parameters
             method = self.params.get('method')
@@ -40,12 +159,28 @@ class ScraperThread(threading.Thread):
             output_file = self.params.get('output_file')
             headless = self.params.get('headless')
             delay = self.params.get('delay')
+            place_urls = self.params.get('place_urls')
+            self.metric('target', total=len(place_urls) if place_urls else num_results)
             
+            # Import selenium on first use
+            try:
+                load_selenium()
+            except ImportError as e:
+                self.queue.put(('error', f"Selenium is required for scraping. Install it with 'pip install selenium'. ({str(e)})"))
+                return
+                
+            # Load the selector registry and its statistics from earlier runs
+            try:
+                self.selectors = SelectorRegistry(stats_path=os.path.join(self.locator.config.directory, "selector_stats.json"))
+            except (OSError, ValueError) as e:
+                self.queue.put(('error', f"Could not load {SelectorRegistry.DATA_FILE}: {str(e)}"))
+                return
+                
             # Update status
             self.queue.put(('status', f"Starting Chrome browser..."))
             
             # Setup Chrome
-            chrome_binary = self.scraper.find_chrome_binary()
+            chrome_binary = self.locator.find_chrome_binary(self.params.get('chrome_path'))
             if not chrome_binary:
                 self.queue.put(('error', "Chrome browser not found"))
                 return
@@ -71,84 +206,303 @@ class ScraperThread(threading.Thread):
                 "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
             ]
             chrome_options.add_argument(f"--user-agent={random.choice(user_agents)}")
+            if (self.params.get('tabs') or 1) > 1:
+                for flag in TabPool.CHROME_FLAGS:
+                    chrome_options.add_argument(flag)
+            
+            # Start from a copy of the warm profile, with a disk cache earlier sessions filled
+            if self.params.get('warm_profile', True):
+                self.profile = BrowserProfile(self.locator.config.directory, tmpfs=self.params.get('profile_tmpfs'))
+                try:
+                    for argument in self.profile.prepare():
+                        chrome_options.add_argument(argument)
+                    if self.profile.warm:
+                        self.queue.put(('status', "Using the warm browser profile"))
+                    else:
+                        self.queue.put(('status', "No warm browser profile yet, this session will create one"))
+                except OSError as e:
+                    self.queue.put(('status', f"Could not prepare the browser profile, using a fresh one: {str(e)}"))
+                    self.profile.close()
+                    self.profile = None
+            
+            # Trace WebDriver commands when asked, the browser is wrapped as it starts
+            if self.params.get('trace_commands'):
+                self.tracer = CommandTracer(CommandTracer.filename_for(output_file, "_trace.jsonl"))
             
             # Get ChromeDriver path
-            driver_path = self.scraper.get_chromedriver_path()
+            driver_path = self.locator.get_chromedriver_path(self.params.get('driver_path'))
+            if not driver_path:
+                self.queue.put(('status', "ChromeDriver not found next to the application, using the system PATH"))
             
-            # Set up the WebDriver
-            try:
-                if driver_path and os.path.exists(driver_path):
-                    service = Service(executable_path=driver_path)
-                    driver = webdriver.Chrome(service=service, options=chrome_options)
-                else:
-                    # Fall back to system PATH
-                    driver = webdriver.Chrome(options=chrome_options)
+            # Keep the browser setup so the browser can be restarted mid-run
+            self.chrome_options = chrome_options
+            self.driver_path = driver_path
+            
+            # Set up the WebDriver, unless place pages are read over HTTP first
+            driver = wait = None
+            if not (place_urls and self.params.get('http_fetch')):
+                try:
+                    driver, wait = self.start_browser()
+                    self.queue.put(('status', "Chrome browser started successfully"))
                     
-                wait = WebDriverWait(driver, 10)
-                self.queue.put(('status', "Chrome browser started successfully"))
-                
-            except Exception as e:
-                error_msg = str(e)
-                self.queue.put(('status', f"Error starting Chrome: {error_msg}"))
-                self.queue.put(('error', f"Failed to start Chrome browser: {error_msg}"))
-                return
+                except Exception as e:
+                    error_msg = str(e)
+                    self.queue.put(('status', f"Error starting Chrome: {error_msg}"))
+                    self.queue.put(('error', f"Failed to start Chrome browser: {error_msg}"))
+                    if self.profile:
+                        self.profile.close()
+                    return
             
             # Continue with scraping process
             try:
-                if method == "Search by Keywords":
-                    # Open Google Maps and perform search
-                    driver.get("https://www.google.com/maps")
-                    self.queue.put(('status', "Opening Google Maps..."))
-                    time.sleep(delay)
+                # Open the output file, leads are written to it as they are scraped
+                try:
+                    if self.sink is None:
+                        self.sink = LeadSink.open_for(output_file)
+                    # Reviews stream to a sink of their own
+                    if self.params.get('reviews_per_place'):
+                        reviews_file = self.params.get('reviews_file') or ReviewSink.filename_for(output_file)
+                        self.review_sink = ReviewSink.open_for(reviews_file)
+                        self.queue.put(('status', f"Saving up to {self.params['reviews_per_place']} reviews per place to {reviews_file}"))
+                    # Delta runs compare every place with the previous run of the same search
+                    if self.params.get('delta'):
+                        snapshot_file, delta_file = DeltaTracker.filenames_for(output_file)
+                        self.delta = DeltaTracker(snapshot_file, delta_file, DeltaTracker.scope_for(self.params),
+                                                  enriched=self.params.get('enrich_websites'))
+                        self.queue.put(('status', f"Delta run: comparing with {self.delta.previous_count()} places "
+                                                  f"from the last run, changes go to {delta_file}"))
+                except Exception as e:
+                    self.queue.put(('status', f"Error opening output file: {str(e)}"))
+                    self.queue.put(('error', f"Could not save results to file: {str(e)}"))
+                    return
+                    
+                # Website enrichment runs behind the browser and commits leads when done
+                if self.params.get('enrich_websites'):
+                    self.start_enricher()
                     
-                    # Search for query
-                    query = f"{business_type} in {location}"
-                    self.search_google_maps(driver, wait, query, delay)
-                    self.queue.put(('status', f"Searching for: {query}"))
+                if place_urls:
+                    leads = []
+                    if self.params.get('http_fetch'):
+                        # Only the pages that cannot be parsed are opened in the browser
+                        place_urls = self.fetch_place_pages(place_urls, leads)
+                        if place_urls and driver is None and not self.stop_event.is_set():
+                            driver, wait = self.start_browser()
+                            self.queue.put(('status', "Chrome browser started successfully"))
+                    if place_urls and driver is not None:
+                        # Visit a batch of place pages directly, no search needed
+                        leads.extend(self.scrape_place_urls(driver, place_urls, delay))
                 else:
-                    # Go directly to the URL
-                    driver.get(direct_url)
-                    self.queue.put(('status', "Navigating to the provided URL..."))
-                    time.sleep(delay + 2)
-                
-                # Extract business info with proper error handling
-                leads = self.extract_business_info(driver, wait, num_results, delay)
+                    # Search and navigation get a budget of their own, scrolling re-arms it per pass
+                    self.watchdog.arm()
+                    if method == "Search by Keywords":
+                        # Open Google Maps and perform search
+                        driver.get("https://www.google.com/maps")
+                        self.queue.put(('status', "Opening Google Maps..."))
+                        self.pause(delay)
+                        
+                        # Search for query
+                        query = f"{business_type} in {location}"
+                        self.browser_state('searching')
+                        self.search_google_maps(driver, wait, query, delay)
+                        self.queue.put(('status', f"Searching for: {query}"))
+                    else:
+                        # Go directly to the URL
+                        driver.get(direct_url)
+                        self.queue.put(('status', "Navigating to the provided URL..."))
+                        self.pause(delay + 2)
+                        
+                    # Extract business info with proper error handling
+                    leads = self.extract_business_info(driver, wait, num_results, delay)
+                    self.watchdog.disarm()
+                self.close_enricher(0 if self.stop_event.is_set() else None)
+                if self.delta:
+                    self.finish_delta()
+                self.sink.close()
+                if self.review_sink:
+                    self.review_sink.close()
                 
-                if not leads:
+                if not self.leads:
                     self.queue.put(('status', "No results found or error occurred during scraping."))
                     self.queue.put(('info', "No results found or could not extract data."))
                     return
                 
-                # Save to CSV
-                try:
-                    with open(output_file, "w", newline="", encoding="utf-8") as file:
-                        writer = csv.writer(file)
-                        writer.writerow(["Name", "Address", "Phone", "Website", "Rating", "Reviews", "Categories"])
-                        writer.writerows(leads)
-                        
-                    self.queue.put(('status', f"Successfully saved {len(leads)} leads to {output_file}"))
-                    self.queue.put(('success', f"Successfully scraped {len(leads)} leads!"))
-                except Exception as e:
-                    self.queue.put(('status', f"Error saving CSV file: {str(e)}"))
-                    self.queue.put(('error', f"Could not save results to file: {str(e)}"))
+                self.queue.put(('status', f"Successfully saved {len(self.leads)} leads to {output_file}"))
+                self.queue.put(('success', f"Successfully scraped {len(self.leads)} leads!"))
                 
             except Exception as e:
                 self.queue.put(('status', f"Error during scraping: {str(e)}"))
                 self.queue.put(('error', f"An error occurred during scraping: {str(e)}"))
                 
             finally:
-                # Clean up
-                if driver:
+                # Clean up, the watchdog must not kill the browser while it is shut down
+                self.watchdog.watch(None)
+                self.selectors.save()
+                self.close_enricher(0)
+                if self.delta:
+                    try:
+                        self.delta.close()
+                    except Exception as e:
+                        self.queue.put(('status', f"Error saving the delta snapshot: {str(e)}"))
+                for sink in (self.sink, self.review_sink, self.dead_letters):
+                    if sink:
+                        try:
+                            sink.close()
+                        except Exception as e:
+                            self.queue.put(('status', f"Error saving results: {str(e)}"))
+                closed_cleanly = False
+                if self.driver:
                     try:
-                        driver.quit()
+                        self.driver.quit()
+                        closed_cleanly = True
+                        self.browser_state('closed')
                         self.queue.put(('status', "Browser closed."))
                     except:
                         pass
+                if self.profile:
+                    # Only a browser that exited normally leaves a profile worth keeping
+                    try:
+                        self.profile.close(save=closed_cleanly)
+                    except OSError as e:
+                        self.queue.put(('status', f"Could not save the browser profile: {str(e)}"))
                         
         except Exception as e:
             self.queue.put(('status', f"Thread error: {str(e)}"))
             self.queue.put(('error', f"An unexpected error occurred: {str(e)}"))
     
+    def metric(self, kind, **fields):
+        """Send a structured metric event to the dashboard, safe to call from any thread"""
+        fields['kind'] = kind
+        fields['time'] = time.time()
+        self.queue.put(('metric', fields))
+        
+    def browser_state(self, state):
+        """Report what the browser is doing"""
+        self.metric('browser', browser=self.name, state=state)
+        
+    def start_browser(self):
+        """Start Chrome with the options prepared in run()"""
+        self.browser_state('starting')
+        if self.driver_path and os.path.exists(self.driver_path):
+            service = Service(executable_path=self.driver_path)
+            driver = webdriver.Chrome(service=service, options=self.chrome_options)
+        else:
+            # Fall back to system PATH
+            driver = webdriver.Chrome(options=self.chrome_options)
+        self.driver = driver
+        if self.tracer:
+            self.tracer.attach(driver)
+        self.watchdog.watch(driver)
+        self.memory_watchdog.reset()
+        self.browser_state('ready')
+        return driver, WebDriverWait(driver, 10)
+        
+    def recycle_browser(self, action, driver):
+        """Replace the current tab or the whole browser to release memory"""
+        self.browser_state('recycling')
+        # A restart and the reload after it are not part of the lead's time budget
+        self.watchdog.disarm()
+        if action == 'tab':
+            try:
+                old_handle = driver.current_window_handle
+                driver.switch_to.new_window('tab')
+                new_handle = driver.current_window_handle
+                driver.switch_to.window(old_handle)
+                driver.close()
+                driver.switch_to.window(new_handle)
+                self.memory_watchdog.reset()
+                self.browser_state('ready')
+                self.queue.put(('status', "Recycled browser tab to release memory"))
+                return driver, WebDriverWait(driver, 10)
+            except Exception as e:
+                self.queue.put(('status', f"Could not recycle tab, restarting browser: {str(e)}"))
+                
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        driver, wait = self.start_browser()
+        self.queue.put(('status', "Restarted browser to release memory"))
+        return driver, wait
+        
+    def restore_results(self, driver, wait, result_selectors, needed, delay):
+        """Reopen the results list after a recycle and load at least the given number of cards"""
+        # A budget of its own, the lead's was disarmed for the restart
+        self.watchdog.arm()
+        driver.get(self.results_url)
+        self.pause(delay + 2)
+        for selector in result_selectors:
+            try:
+                if wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector))):
+                    break
+            except Exception:
+                continue
+        self.scroll_to_load_more_results(driver, needed, delay)
+        
+        business_cards = []
+        for selector in result_selectors:
+            try:
+                cards = driver.find_elements(By.CSS_SELECTOR, selector)
+                if cards and len(cards) > len(business_cards):
+                    business_cards = cards
+            except Exception:
+                continue
+        return business_cards
+        
+    def describe_failure(self, error):
+        """Describe why a place failed, naming the watchdog when it killed the browser"""
+        if self.watchdog.fired == 'timeout':
+            return f"took longer than {self.watchdog.timeout} seconds"
+        return str(error).strip().splitlines()[0] if str(error).strip() else type(error).__name__
+        
+    def retry_later(self, retries, item, error, label, record):
+        """Queue a failed place for a later retry, or dead-letter it once it has used its attempts"""
+        if retries.fail(item, error, record):
+            self.metric('retry', phase='place')
+            self.queue.put(('status', f"{label} failed ({error}), it will be retried later"))
+        else:
+            self.metric('error', phase='place')
+            self.dead_letter(dict(record, attempts=retries.attempts[item], error=error))
+            
+    def dead_letter_waiting(self, retries):
+        """Dead-letter the places still waiting for a retry"""
+        for item in retries.items():
+            self.dead_letter(dict(retries.records.get(item, {}), attempts=retries.attempts[item],
+                                  error=retries.errors[item]))
+        retries.waiting = []
+        
+    def dead_letter(self, record):
+        """Hand a place that kept failing to another worker, or write it to the dead-letter file"""
+        record['time'] = datetime.now().isoformat(timespec='seconds')
+        self.gave_up += 1
+        if record.get('url') and self.params.get('handoff_failed'):
+            self.queue.put(('dead', record))
+            self.queue.put(('status', f"Giving {record.get('name') or record['url']} to another worker "
+                                      f"after {record['attempts']} attempts"))
+            return
+        if self.dead_letters is None:
+            output_file = self.params.get('output_file') or "google_maps_leads.csv"
+            self.dead_letters = DeadLetterSink(self.params.get('dead_letter_file') or DeadLetterSink.filename_for(output_file))
+        self.dead_letters.write(record)
+        self.queue.put(('status', f"Gave up on {record.get('name') or record.get('url') or 'a place'} after "
+                                  f"{record['attempts']} attempts, saved to {self.dead_letters.filename}"))
+        
+    def pause(self, seconds):
+        """Sleep, waking up early when Stop is pressed"""
+        self.stop_event.wait(seconds)
+        
+    def out_of_time(self):
+        """Check whether the run has used up its time budget"""
+        budget = self.params.get('time_budget')
+        return bool(budget) and time.monotonic() - self.started > budget * 60
+        
+    def is_browser_alive(self, driver):
+        """Check whether the browser still responds to commands"""
+        try:
+            driver.current_window_handle
+            return True
+        except Exception:
+            return False
+            
     def search_google_maps(self, driver, wait, query, delay):
         """Search Google Maps with the given query"""
         max_attempts = 3
@@ -159,15 +513,15 @@ class ScraperThread(threading.Thread):
                 search_box.clear()
                 search_box.send_keys(query)
                 search_box.send_keys(Keys.RETURN)
-                time.sleep(delay + 2)  # Wait for results to load
+                self.pause(delay + 2)  # Wait for results to load
                 return True
             except Exception as e:
                 if attempt < max_attempts - 1:
                     self.queue.put(('status', f"Search attempt {attempt+1} failed, retrying..."))
-                    time.sleep(delay)
+                    self.pause(delay)
                     try:
                         driver.refresh()
-                        time.sleep(delay)
+                        self.pause(delay)
                     except:
                         pass
                 else:
@@ -211,6 +565,8 @@ class ScraperThread(threading.Thread):
                     return
                     
                 previous_results = current_results
+                # Each pass gets a fresh budget, so only a stuck scroll is killed
+                self.watchdog.arm()
                 
                 # Scroll the results panel
                 try:
@@ -224,7 +580,7 @@ class ScraperThread(threading.Thread):
                         break
                 
                 # Wait for new results to load
-                time.sleep(delay)
+                self.pause(delay)
                 
                 # Count the results with multiple selectors
                 result_selectors = [
@@ -250,7 +606,7 @@ class ScraperThread(threading.Thread):
                 attempt += 1
                 
                 # Add random delay variation to avoid detection
-                time.sleep(random.uniform(0.5, 1.5))
+                self.pause(random.uniform(0.5, 1.5))
             
             if current_results >= max_results:
                 self.queue.put(('status', f"Successfully loaded {current_results} results"))
@@ -266,6 +622,7 @@ class ScraperThread(threading.Thread):
     def extract_business_info(self, driver, wait, max_results, delay):
         """Extract business information from Google Maps results"""
         leads = []
+        retries = None
         try:
             # Wait for business cards to load with retry mechanism
             attempts = 0
@@ -303,7 +660,7 @@ class ScraperThread(threading.Thread):
                     if attempts >= max_attempts:
                         self.queue.put(('status', f"Failed to find results after {max_attempts} attempts: {str(e)}"))
                         return leads
-                    time.sleep(delay)
+                    self.pause(delay)
             
             if not business_cards:
                 self.queue.put(('status', "No results found."))
@@ -313,7 +670,10 @@ class ScraperThread(threading.Thread):
             initial_count = len(business_cards)
             if max_results > initial_count:
                 self.queue.put(('status', f"Initially found {initial_count} results, need to scroll for more..."))
+                self.browser_state('scrolling')
+                started = time.perf_counter()
                 self.scroll_to_load_more_results(driver, max_results, delay)
+                self.metric('phase', phase='scroll', seconds=time.perf_counter() - started)
                 
                 # Re-fetch business cards after scrolling
                 for selector in result_selectors:
@@ -325,120 +685,188 @@ class ScraperThread(threading.Thread):
                         continue
             
             total_cards = min(len(business_cards), max_results)
+            self.results_cut = len(business_cards) >= max_results
             self.queue.put(('status', f"Found {total_cards} results to process..."))
+            if total_cards < max_results:
+                self.metric('target', total=total_cards)
+            
+            # Remember the results page so a recycled browser can find its way back
+            self.results_url = driver.current_url
+            # Place URLs of all cards in one call, they carry coordinates and IDs
+            card_links = self.card_links(driver, business_cards)
+            
+            # Cards that need no detail visit
+            done = set()
+            
+            # Card previews feed the filters, fast mode and the visit order
+            priority = self.params.get('priority') or VisitPriority.FEED
+            lead_filter = LeadFilter.from_params(self.params.get('filters'))
+            previews = []
+            if self.params.get('card_preview') or priority != VisitPriority.FEED or lead_filter:
+                reader = CardPreviewReader(self.selectors.card_preview)
+                started = time.perf_counter()
+                self.watchdog.arm()
+                previews = reader.read(driver, business_cards[:total_cards])
+                self.metric('phase', phase='cards', seconds=time.perf_counter() - started)
+                
+            # The results are loaded, from here on each place is armed on its own
+            self.watchdog.disarm()
+            
+            # Places the filters reject are never opened
+            skipped = {}
+            if lead_filter:
+                for index, preview in enumerate(previews):
+                    reason = lead_filter.rejects(preview, reader.closed[index]) if preview is not None else None
+                    if reason:
+                        done.add(index)
+                        skipped[reason] = skipped.get(reason, 0) + 1
+                        if self.delta:
+                            self.delta.touch(preview)
+                self.report_skipped(skipped)
+                self.metric('skip', count=sum(skipped.values()))
+                
+            # In fast mode, leads whose card shows every required field are taken from the card
+            if self.params.get('card_preview'):
+                required = self.params.get('required_fields') or ()
+                for index, preview in enumerate(previews):
+                    if index not in done and preview is not None and not preview.missing(required):
+                        done.add(index)
+                        self.emit_lead(preview, leads)
+                from_cards = len(done) - sum(skipped.values())
+                self.queue.put(('status', f"Read {from_cards} leads from the result cards, "
+                                          f"{total_cards - len(done)} need a detail visit"))
+                
+            def accept(index, lead):
+                """Merge the card preview into a visited place and apply the filters, returning True to keep it"""
+                if index < len(previews) and previews[index] is not None:
+                    lead.merge(previews[index])
+                # Cards without a preview are only checked once their details are known
+                reason = lead_filter.rejects(lead) if lead_filter else None
+                if reason:
+                    skipped[reason] = skipped.get(reason, 0) + 1
+                    self.metric('skip')
+                    self.queue.put(('status', f"Skipped {lead.name or Lead.MISSING}, filtered out by {reason}"))
+                    if self.delta:
+                        self.delta.touch(lead)
+                return reason is None
+                
+            # Read the place pages over HTTP, only cards whose page could not be parsed are clicked
+            if self.params.get('http_fetch'):
+                urls = [link for index, link in enumerate(card_links[:total_cards]) if link and index not in done]
+                positions = {link: index for index, link in enumerate(card_links[:total_cards]) if link}
+                fetched = set(urls) - set(self.fetch_place_pages(urls, leads, lambda url, lead: accept(positions[url], lead)))
+                done.update(index for index, link in enumerate(card_links[:total_cards]) if link in fetched)
+            leads_since_recycle = 0
+            
+            # Visit the remaining cards, most valuable first
+            order = VisitPriority.order([index for index in range(total_cards) if index not in done], previews, priority)
+            if priority != VisitPriority.FEED:
+                self.queue.put(('status', f"Visiting {len(order)} places ordered by {priority}"))
+                
+            # With several tabs, places with a link load side by side and only the rest are clicked
+            linked = [index for index in order if index < len(card_links) and card_links[index]]
+            if (self.params.get('tabs') or 1) > 1 and linked:
+                entries = {index: {'url': card_links[index], 'label': f"Result {index + 1}", 'record': {
+                    'url': card_links[index],
+                    'name': previews[index].name if index < len(previews) and previews[index] is not None else None,
+                    'results_url': self.results_url,
+                    'position': index + 1,
+                }} for index in linked}
+                self.queue.put(('status', f"Loading {len(linked)} places in {self.params['tabs']} tabs"))
+                tab_driver = self.visit_in_tabs(driver, entries, leads, delay, total_cards, accept)
+                order = [index for index in order if index not in entries]
+                if tab_driver is not driver:
+                    driver, wait = tab_driver, WebDriverWait(tab_driver, 10)
+                    if order:
+                        business_cards = self.restore_results(driver, wait, result_selectors, max(order) + 1, delay)
+                        card_links = self.card_links(driver, business_cards)
+            self.browser_state('visiting')
+                
+            # Process each business card. Failed places wait in the retry queue and are
+            # visited again after the others, places that keep failing are dead-lettered
+            pending = deque(order)
+            retries = RetryQueue(backoff=self.params.get('retry_backoff'))
+            visited = 0
             
-            # Process each business card
-            for index, card in enumerate(business_cards[:max_results]):
+            def record(index):
+                """Describe a result for the retry queue and the dead-letter file"""
+                preview = previews[index] if index < len(previews) else None
+                return {
+                    'url': card_links[index] if index < len(card_links) else None,
+                    'name': preview.name if preview is not None else None,
+                    'results_url': self.results_url,
+                    'position': index + 1,
+                }
+                
+            while pending or retries:
                 if self.stop_event.is_set():
                     self.queue.put(('status', "Scraping stopped by user."))
                     return leads
                     
+                if self.out_of_time():
+                    self.queue.put(('status', f"Time budget used up, {len(pending) + len(retries)} places were not visited."))
+                    return leads
+                    
+                if pending:
+                    index = pending.popleft()
+                else:
+                    index = retries.pop_ready()
+                    if index is None:
+                        # Nothing else to do until the next backoff ends
+                        self.pause(min(retries.wait_time(), 1))
+                        continue
+                visited += 1
+                    
+                if index >= len(business_cards):
+                    # The result list came back shorter after a restart, the place waits for the next reload
+                    self.retry_later(retries, index, "could not reload the result after restarting the browser",
+                                     f"Result {index + 1}", record(index))
+                    continue
+                card = business_cards[index]
+                    
+                lead = None
+                opened = False
+                if self.tracer:
+                    self.tracer.begin_lead(f"result {index + 1}")
                 try:
+                    self.watchdog.arm()
+                    started = time.perf_counter()
                     # Update progress
-                    progress = 50 + (index + 1) / total_cards * 50  # Second 50% of progress bar
+                    progress = 50 + visited / (visited + len(pending) + len(retries)) * 50  # Second 50% of progress bar
                     self.queue.put(('progress', int(progress)))
                     
                     # Scroll to the card with more reliable scrolling
                     try:
                         driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", card)
-                        time.sleep(1)
+                        self.pause(1)
                     except:
                         # Alternative scrolling method
                         try:
                             y_position = driver.execute_script("return arguments[0].getBoundingClientRect().top;", card)
                             driver.execute_script(f"window.scrollBy(0, {y_position});")
-                            time.sleep(1)
+                            self.pause(1)
                         except:
                             pass
                     
-                    # Click on the card with retry mechanism
-                    click_success = False
-                    click_attempts = 0
-                    while not click_success and click_attempts < 3:
-                        try:
-                            card.click()
-                            click_success = True
-                        except:
-                            click_attempts += 1
-                            try:
-                                # Alternative click method
-                                driver.execute_script("arguments[0].click();", card)
-                                click_success = True
-                            except:
-                                time.sleep(1)
-                    
-                    if not click_success:
-                        self.queue.put(('status', f"Could not click on result {index + 1}, skipping..."))
-                        continue
+                    # Click on the card, a place that cannot be clicked is retried later rather than here
+                    try:
+                        card.click()
+                    except Exception:
+                        driver.execute_script("arguments[0].click();", card)
+                    opened = True
                         
-                    time.sleep(delay)  # Allow details to load
-                    
-                    # Extract business details with improved selectors and fallbacks
-                    name = self.extract_element_text(driver, [
-                        (By.CLASS_NAME, "DUwDvf"),
-                        (By.CSS_SELECTOR, "h1.fontHeadlineLarge"),
-                        (By.XPATH, "//h1[contains(@class, 'header-title')]"),
-                        (By.XPATH, "//div[contains(@class, 'section-hero-header-title')]")
-                    ])
-                    
-                    address = self.extract_element_text(driver, [
-                        (By.CSS_SELECTOR, "button[data-item-id='address']"),
-                        (By.XPATH, "//button[contains(@aria-label, 'Address')]"),
-                        (By.XPATH, "//button[contains(@data-item-id, 'address')]"),
-                        (By.XPATH, "//div[contains(@class, 'section-info-line')]/div[contains(@class, 'widget-pane-link')]")
-                    ])
-                    
-                    phone = self.extract_element_text(driver, [
-                        (By.CSS_SELECTOR, "button[data-item-id='phone:tel']"),
-                        (By.XPATH, "//button[contains(@aria-label, 'Phone')]"),
-                        (By.XPATH, "//button[contains(@data-item-id, 'phone')]"),
-                        (By.XPATH, "//div[contains(@class, 'section-info-line')]/div[contains(@class, 'widget-pane-link')]")
-                    ])
-                    
-                    website = self.extract_element_attribute(driver, [
-                        (By.CSS_SELECTOR, "a[data-item-id='authority']"),
-                        (By.XPATH, "//a[contains(@aria-label, 'Website')]"),
-                        (By.XPATH, "//a[contains(@data-item-id, 'authority')]"),
-                        (By.XPATH, "//div[contains(@class, 'section-info-line')]/div[contains(@class, 'widget-pane-link')]/a")
-                    ], "href")
-                    
-                    # Extract additional information
-                    rating = self.extract_element_text(driver, [
-                        (By.CSS_SELECTOR, "div.F7nice"),
-                        (By.XPATH, "//span[contains(@aria-label, 'stars')]"),
-                        (By.XPATH, "//div[contains(@class, 'section-star-display')]")
-                    ])
-                    
-                    # Clean up rating (extract just the number)
-                    if rating != "N/A":
-                        rating_match = re.search(r'(\d+\.\d+)', rating)
-                        if rating_match:
-                            rating = rating_match.group(1)
-                    
-                    reviews = self.extract_element_text(driver, [
-                        (By.CSS_SELECTOR, "span.F7nice"),
-                        (By.XPATH, "//span[contains(@aria-label, 'reviews')]"),
-                        (By.XPATH, "//span[contains(text(), 'reviews')]")
-                    ])
-                    
-                    # Clean up reviews (extract just the number)
-                    if reviews != "N/A":
-                        reviews_match = re.search(r'(\d+(?:,\d+)*)', reviews)
-                        if reviews_match:
-                            reviews = reviews_match.group(1)
+                    self.pause(delay)  # Allow details to load
                     
-                    categories = self.extract_element_text(driver, [
-                        (By.CSS_SELECTOR, "button[jsaction='pane.rating.category']"),
-                        (By.XPATH, "//button[contains(@jsaction, 'pane.rating.category')]"),
-                        (By.XPATH, "//span[contains(@class, 'section-rating-term')]")
-                    ])
-
-                    # Store details
-                    leads.append([name, address, phone, website, rating, reviews, categories])
-                    self.queue.put(('status', f"Scraped {index + 1}/{total_cards}: {name}"))
+                    # Extract business details from the open place panel
+                    lead = self.extract_lead_details(driver, card_links[index] if index < len(card_links) else None)
+                    self.metric('phase', phase='detail', seconds=time.perf_counter() - started)
+                    if accept(index, lead):
+                        self.emit_lead(lead, leads)
+                        self.queue.put(('status', f"Scraped {len(leads)}/{total_cards}: {lead.name or Lead.MISSING}"))
+                        self.harvest_reviews(driver, lead)
                     
                     # Add random delay variation to avoid detection
-                    time.sleep(random.uniform(0.5, 1.0))
+                    self.pause(random.uniform(0.5, 1.0))
                     
                     # Go back to results
                     back_success = False
@@ -465,7 +893,7 @@ class ScraperThread(threading.Thread):
                         except:
                             pass
                             
-                    time.sleep(delay)
+                    self.pause(delay)
                     
                     # Ensure we're back at results page by checking for presence of business cards
                     try:
@@ -480,59 +908,3717 @@ class ScraperThread(threading.Thread):
                         # If we can't find business cards, we might need to refresh or navigate again
                         self.queue.put(('status', "Lost results page. Attempting to recover..."))
                         driver.execute_script("history.go(-1)")
-                        time.sleep(delay + 1)
+                        self.pause(delay + 1)
+                        
+                    # Recycle the tab or browser before memory growth slows the run down
+                    leads_since_recycle += 1
+                    action = self.memory_watchdog.check(driver, leads_since_recycle)
+                    if action and (pending or retries):
+                        driver, wait = self.recycle_browser(action, driver)
+                        business_cards = self.restore_results(driver, wait, result_selectors,
+                                                              max([*pending, *retries.items()]) + 1, delay)
+                        card_links = self.card_links(driver, business_cards)
+                        leads_since_recycle = 0
 
                 except Exception as e:
-                    self.queue.put(('status', f"Error processing result {index + 1}: {str(e)}"))
+                    error = self.describe_failure(e)
+                    # Only places that were not saved yet are retried
+                    if lead is None:
+                        self.retry_later(retries, index, error, f"Result {index + 1}", record(index))
+                    else:
+                        self.metric('error', phase='detail')
+                        self.queue.put(('status', f"Error processing result {index + 1}: {error}"))
+                    if self.stop_event.is_set():
+                        self.queue.put(('status', "Scraping stopped by user."))
+                        return leads
+                    
+                    # A crashed or killed browser is restarted and the results are restored
+                    if not self.is_browser_alive(driver):
+                        self.metric('retry', phase='browser')
+                        try:
+                            driver, wait = self.recycle_browser('browser', driver)
+                            business_cards = self.restore_results(driver, wait, result_selectors,
+                                                                  max([index, *pending, *retries.items()]) + 1, delay)
+                            card_links = self.card_links(driver, business_cards)
+                            leads_since_recycle = 0
+                        except Exception as restart_error:
+                            self.queue.put(('status', f"Could not restart browser: {str(restart_error)}"))
+                            for index in pending:
+                                self.dead_letter({'url': card_links[index] if index < len(card_links) else None,
+                                                  'results_url': self.results_url, 'position': index + 1,
+                                                  'attempts': 0, 'error': "browser could not be restarted"})
+                            return leads
+                        continue
+                        
                     # Try to recover to results page
-                    try:
-                        driver.execute_script("history.go(-1)")
-                        time.sleep(delay)
-                    except:
-                        pass
+                    if opened:
+                        try:
+                            driver.execute_script("history.go(-1)")
+                            self.pause(delay)
+                        except:
+                            pass
+                        
+                finally:
+                    self.watchdog.disarm()
+                    if self.tracer:
+                        self.tracer.end_lead()
                     
         except Exception as e:
             self.queue.put(('status', f"Error in extraction process: {str(e)}"))
             
+        finally:
+            # Places still waiting for a retry when the run ends are not lost either
+            if retries is not None:
+                self.dead_letter_waiting(retries)
+                
+        return leads
+    
+    def scrape_place_urls(self, driver, urls, delay):
+        """Extract leads by opening each place URL in turn, or several at once in tabs"""
+        leads = []
+        if (self.params.get('tabs') or 1) > 1:
+            entries = {url: {'url': url, 'label': url, 'record': {'url': url}} for url in urls}
+            self.visit_in_tabs(driver, entries, leads, delay, len(urls))
+            return leads
+        self.browser_state('visiting')
+        # Failed places are retried after the others, with a backoff
+        pending = deque(urls)
+        retries = RetryQueue(backoff=self.params.get('retry_backoff'))
+        visited = 0
+        try:
+            while pending or retries:
+                if self.stop_event.is_set():
+                    self.queue.put(('status', "Scraping stopped by user."))
+                    break
+                if self.out_of_time():
+                    self.queue.put(('status', f"Time budget used up, {len(pending) + len(retries)} places were not visited."))
+                    break
+                if pending:
+                    url = pending.popleft()
+                else:
+                    url = retries.pop_ready()
+                    if url is None:
+                        self.pause(min(retries.wait_time(), 1))
+                        continue
+                visited += 1
+                total = visited + len(pending) + len(retries)
+                lead = None
+                if self.tracer:
+                    self.tracer.begin_lead(url)
+                try:
+                    self.watchdog.arm()
+                    started = time.perf_counter()
+                    driver.get(url)
+                    self.pause(delay)
+                    lead = self.extract_lead_details(driver, url)
+                    self.metric('phase', phase='detail', seconds=time.perf_counter() - started)
+                    self.emit_lead(lead, leads)
+                    self.queue.put(('status', f"Scraped {len(leads)}/{len(urls)}: {lead.name or Lead.MISSING}"))
+                    self.harvest_reviews(driver, lead)
+                    self.queue.put(('progress', int(visited / total * 100)))
+                except Exception as e:
+                    error = self.describe_failure(e)
+                    if lead is None:
+                        self.retry_later(retries, url, error, url, {'url': url})
+                    else:
+                        self.metric('error', phase='detail')
+                        self.queue.put(('status', f"Error processing {url}: {error}"))
+                    # A crashed or killed browser is restarted
+                    if not self.stop_event.is_set() and not self.is_browser_alive(driver):
+                        self.metric('retry', phase='browser')
+                        try:
+                            driver, wait = self.recycle_browser('browser', driver)
+                        except Exception as restart_error:
+                            self.queue.put(('status', f"Could not restart browser: {str(restart_error)}"))
+                            for url in pending:
+                                self.dead_letter({'url': url, 'attempts': 0, 'error': "browser could not be restarted"})
+                            break
+                finally:
+                    self.watchdog.disarm()
+                    if self.tracer:
+                        self.tracer.end_lead()
+        finally:
+            self.dead_letter_waiting(retries)
         return leads
     
-    def extract_element_text(self, driver, selectors):
-        """Extract text from an element using multiple selectors with fallbacks"""
-        for by, selector in selectors:
+    def visit_in_tabs(self, driver, entries, leads, delay, total, accept=None):
+        """Visit places in several tabs of one browser, extracting whichever tab renders first
+        
+        entries maps each item to its 'url', a 'label' for messages and the
+        'record' kept if it is dead-lettered. accept(item, lead) can reject a
+        lead once its details are known. Returns the driver, which is a new
+        one if the browser had to be restarted.
+        """
+        pending = deque(entries)
+        retries = RetryQueue(backoff=self.params.get('retry_backoff'))
+        pool = None
+        visited = 0
+        leads_since_recycle = 0
+        self.browser_state('visiting')
+        try:
+            while pending or retries or pool:
+                if self.stop_event.is_set():
+                    self.queue.put(('status', "Scraping stopped by user."))
+                    break
+                if self.out_of_time():
+                    waiting = len(pending) + len(retries) + (len(pool) if pool else 0)
+                    self.queue.put(('status', f"Time budget used up, {waiting} places were not visited."))
+                    break
+                item = None
+                handle = None
+                lead = None
+                self.watchdog.arm()
+                try:
+                    if pool is None:
+                        pool = TabPool(driver, self.params.get('tabs') or TabPool.TABS, self.selectors.place_ready,
+                                       max(TabPool.LOAD_TIMEOUT, delay * 5))
+                    # Keep every tab loading a place
+                    while pool.free():
+                        item = pending.popleft() if pending else retries.pop_ready()
+                        if item is None:
+                            break
+                        pool.load(item, entries[item]['url'])
+                        item = None
+                    if not len(pool):
+                        if not pending and not retries:
+                            break
+                        self.pause(min(retries.wait_time(), 1))
+                        continue
+                    
+                    ready = pool.next_ready()
+                    if ready is None:
+                        self.pause(TabPool.POLL_INTERVAL)
+                        continue
+                    handle, item, started, error = ready
+                    visited += 1
+                    if error:
+                        raise error
+                    if self.tracer:
+                        self.tracer.begin_lead(entries[item]['label'])
+                    lead = self.extract_lead_details(driver, entries[item]['url'])
+                    self.metric('phase', phase='detail', seconds=time.monotonic() - started)
+                    if accept is None or accept(item, lead):
+                        self.emit_lead(lead, leads)
+                        self.queue.put(('status', f"Scraped {len(leads)}/{total}: {lead.name or Lead.MISSING}"))
+                        self.harvest_reviews(driver, lead)
+                    self.queue.put(('progress', int(visited / (visited + len(pending) + len(retries) + len(pool)) * 100)))
+                    
+                    # Replace the tab or restart the browser before memory growth slows the run down
+                    leads_since_recycle += 1
+                    action = self.memory_watchdog.check(driver, leads_since_recycle)
+                    if action == 'browser':
+                        pending.extendleft(reversed(pool.drain()))
+                        pool = None
+                        driver, wait = self.recycle_browser('browser', driver)
+                        leads_since_recycle = 0
+                    elif action == 'tab':
+                        pool.replace(handle)
+                        self.memory_watchdog.reset()
+                        leads_since_recycle = 0
+                    else:
+                        pool.release(handle)
+                
+                except Exception as e:
+                    error = self.describe_failure(e)
+                    if item is not None and lead is None:
+                        self.retry_later(retries, item, error, entries[item]['label'], entries[item]['record'])
+                    elif item is not None:
+                        self.metric('error', phase='detail')
+                        self.queue.put(('status', f"Error processing {entries[item]['label']}: {error}"))
+                    if self.stop_event.is_set():
+                        self.queue.put(('status', "Scraping stopped by user."))
+                        break
+                    
+                    # A crashed or killed browser is restarted, places that were loading start again
+                    if not self.is_browser_alive(driver):
+                        self.metric('retry', phase='browser')
+                        if pool is not None:
+                            pending.extendleft(reversed(pool.drain()))
+                            pool = None
+                        try:
+                            driver, wait = self.recycle_browser('browser', driver)
+                        except Exception as restart_error:
+                            self.queue.put(('status', f"Could not restart browser: {str(restart_error)}"))
+                            for item in pending:
+                                self.dead_letter(dict(entries[item]['record'], attempts=0,
+                                                      error="browser could not be restarted"))
+                            pending.clear()
+                            break
+                    elif pool is not None and handle is not None:
+                        # The tab may be broken, give the next place a fresh one
+                        try:
+                            pool.replace(handle)
+                        except Exception:
+                            pass
+                finally:
+                    self.watchdog.disarm()
+                    if self.tracer:
+                        self.tracer.end_lead()
+        finally:
+            # Places still loading when the run stops count as not visited, like the pending ones
+            if pool is not None:
+                try:
+                    pool.close()
+                except Exception:
+                    pass
+            self.dead_letter_waiting(retries)
+        return driver
+    
+    def fetch_place_pages(self, urls, leads, accept=None):
+        """Read place pages over HTTP, returning the URLs that still need the browser
+        
+        accept(url, lead) can reject a lead once its details are known.
+        """
+        if not urls:
+            return []
+        fetcher = PlaceFetcher(self.selectors.place_json, concurrency=self.params.get('http_concurrency'),
+                               stop_event=self.stop_event, metrics=self.metric)
+        done = []
+        
+        def on_lead(url, lead):
+            done.append(lead)
+            if accept is None or accept(url, lead):
+                self.emit_lead(lead, leads)
+                self.queue.put(('status', f"Fetched {len(done)}/{len(urls)}: {lead.name or Lead.MISSING}"))
+            self.queue.put(('progress', int(len(done) / len(urls) * 100)))
+            
+        self.queue.put(('status', f"Fetching {len(urls)} place pages over HTTP..."))
+        self.browser_state('fetching over HTTP')
+        try:
+            failed = fetcher.fetch(urls, on_lead)
+        except ImportError as e:
+            self.queue.put(('status', f"HTTP fetch mode needs aiohttp, install it with 'pip install aiohttp'. "
+                                      f"Using the browser instead. ({str(e)})"))
+            return urls
+        self.queue.put(('status', f"Read {len(done)} of {len(urls)} places over HTTP, "
+                                  f"{len(failed)} left for the browser"))
+        return failed
+        
+    def report_skipped(self, skipped):
+        """Report how many places the filters rejected, by reason"""
+        if not skipped:
+            return
+        reasons = ", ".join(f"{count} by {reason}" for reason, count in sorted(skipped.items()))
+        self.queue.put(('status', f"Filters skipped {sum(skipped.values())} places ({reasons})"))
+        
+    def card_links(self, driver, cards):
+        """Return the place URL of each result card, read in a single script call"""
+        try:
+            return driver.execute_script(
+                "return arguments[0].map(function (card) {"
+                "  var link = card.matches('a[href]') ? card : card.querySelector('a[href*=\"/maps/place/\"]');"
+                "  return link ? link.href : null;"
+                "});", cards) or []
+        except Exception:
+            return []
+            
+    def extract_lead_details(self, driver, url=None):
+        """Extract a lead from the place details panel that is currently open
+        
+        Coordinates and IDs are parsed from the place URL, the card link or the
+        URL that was opened, and only read from the browser when neither
+        carries a feature ID.
+        """
+        values = {field: self.extract_field(driver, field) for field in Lead.CORE_FIELDS}
+        if self.tracer:
+            self.tracer.field = None
+        self.selectors.end_lead()
+        place = Lead.fields_from_url(url)
+        if "feature_id" not in place:
+            try:
+                place = Lead.fields_from_url(driver.current_url) or place
+            except Exception:
+                pass
+        values.update(place)
+        # The Lead record parses rating and review counts
+        return Lead(**values)
+        
+    def emit_lead(self, lead, leads):
+        """Record a scraped lead and pass it on, through website enrichment when enabled"""
+        leads.append(lead)
+        self.metric('lead')
+        for field, hit_rate, lifetime_rate in self.selectors.collapsed_fields():
+            self.queue.put(('status', f"Warning: '{field}' was found for only {hit_rate:.0%} of recent leads "
+                                      f"(previously {lifetime_rate:.0%}). Google Maps may have changed, "
+                                      f"check {SelectorRegistry.DATA_FILE}."))
+        if self.enricher and lead.website:
+            self.enricher.submit(lead)
+        else:
+            self.commit_lead(lead)
+            
+    def harvest_reviews(self, driver, lead):
+        """Stream the reviews of the open place to the review sink, when reviews are enabled"""
+        if not self.review_sink:
+            return
+        # Each scroll pass that finds new reviews gets a fresh budget, so only a stuck pane is killed
+        harvester = ReviewHarvester(driver, self.selectors.reviews, self.params['reviews_per_place'],
+                                    stop_event=self.stop_event, on_progress=self.watchdog.arm)
+        count = 0
+        started = time.perf_counter()
+        if self.tracer:
+            self.tracer.field = 'reviews'
+        self.watchdog.arm()
+        try:
+            for review in harvester.harvest(lead.key()):
+                self.review_sink.write(review)
+                count += 1
+        except Exception as e:
+            self.metric('error', phase='reviews')
+            self.queue.put(('status', f"Error reading reviews for {lead.name or Lead.MISSING}: {str(e)}"))
+        # Navigating back to the results gets the normal lead budget, unless the browser was already killed
+        if self.watchdog.fired is None:
+            self.watchdog.arm()
+        self.metric('phase', phase='reviews', seconds=time.perf_counter() - started)
+        if self.tracer:
+            self.tracer.field = None
+        self.queue.put(('status', f"Saved {count} reviews for {lead.name or Lead.MISSING}"))
+        
+    def commit_lead(self, lead):
+        """Write a finished lead to the output sink and stream it to the UI
+        
+        In a delta run only new and changed places are written. The lead is
+        kept once enrichment is done, so the store holds its final values.
+        """
+        if self.sink and (not self.delta or self.delta.compare(lead)):
+            self.sink.write(lead)
+        # The enrichment thread commits leads too
+        with self.leads_lock:
+            self.leads.append(lead)
+        self.queue.put(('lead', lead))
+        
+    def finish_delta(self):
+        """Close the delta run, reporting gone places only when every listed place was seen
+        
+        Filtered out places count as seen, and a results list cut at
+        num_results leaves the run incomplete.
+        """
+        seen = self.delta.counts['new'] + self.delta.counts['changed'] + self.delta.counts['unchanged']
+        # A run that found nothing more likely failed than saw every place close
+        complete = (seen and not self.stop_event.is_set() and not self.out_of_time() and not self.gave_up
+                    and not self.results_cut)
+        self.delta.finish(complete)
+        counts = self.delta.counts
+        gone = f"{counts['gone']} gone" if complete else "gone places not checked as the run was incomplete"
+        self.queue.put(('status', f"Delta: {counts['new']} new, {counts['changed']} changed, "
+                                  f"{counts['unchanged']} unchanged, {gone}"))
+        
+    def start_enricher(self):
+        """Start the website enrichment stage, or carry on without it if aiohttp is missing"""
+        enricher = WebsiteEnricher(
+            self.commit_lead,
+            concurrency=self.params.get('enrich_concurrency'),
+            per_host=self.params.get('enrich_per_host'),
+            timeout=self.params.get('enrich_timeout'),
+            cache_path=os.path.join(self.locator.config.directory, WebsiteEnricher.CACHE_FILE),
+            metrics=self.metric)
+        try:
+            enricher.start()
+        except ImportError as e:
+            self.queue.put(('status', f"Website enrichment needs aiohttp, install it with 'pip install aiohttp'. "
+                                      f"Continuing without it. ({str(e)})"))
+            return
+        self.enricher = enricher
+        self.queue.put(('status', "Website enrichment enabled"))
+        
+    def close_enricher(self, timeout=None):
+        """Wait for website checks in flight, leads not finished within timeout are saved without them"""
+        if not self.enricher:
+            return
+        enricher, self.enricher = self.enricher, None
+        if enricher.pending:
+            self.queue.put(('status', f"Waiting for {enricher.pending} website checks to finish..."))
+        enricher.close(timeout)
+        stats = enricher.stats
+        self.queue.put(('status', f"Website enrichment: {stats['checked']} checked, {stats['cached']} from cache, "
+                                  f"{stats['failed']} unreachable, {stats['emails']} emails and "
+                                  f"{stats['socials']} social profiles found"))
+        
+    def extract_field(self, driver, field):
+        """Extract a field using its selectors, best performing first"""
+        if self.tracer:
+            self.tracer.field = field
+        attribute = self.selectors.attribute(field)
+        for by, selector in self.selectors.ordered(field):
+            start = time.perf_counter()
+            value = None
             try:
-                element = driver.find_element(by, selector)
-                if element and element.text.strip():
+                # find_elements returns an empty list on a miss instead of raising
+                for element in driver.find_elements(by, selector):
+                    value = element.get_attribute(attribute) if attribute else element.text.strip()
+                    if value:
+                        break
+            except Exception:
+                value = None
+            self.selectors.record(field, by, selector, bool(value), time.perf_counter() - start)
+            if value:
+                return value
+                
+        # If all selectors fail, try a more generic approach
+        fallback_tag = self.selectors.fallback_tag(field)
+        if fallback_tag:
+            for element in driver.find_elements(By.TAG_NAME, fallback_tag):
+                if element.text.strip():
                     return element.text.strip()
-            except:
-                continue
+                    
+        return None
+        
+    def stop(self):
+        """Stop the scraping thread"""
+        self.stop_event.set()
+
+
+class BrowserMemoryWatchdog:
+    """Samples browser memory and decides when the tab or browser should be recycled
+    
+    The RSS of the whole Chrome process tree is read with psutil when it is
+    installed. The JS heap of the current tab is read over CDP with
+    Performance.getMetrics. Crossing the browser limit restarts Chrome.
+    Crossing the heap limit, or processing recycle_every leads, replaces the tab.
+    """
+    MAX_BROWSER_MB = 2048
+    MAX_HEAP_MB = 768
+    RECYCLE_EVERY = 200
+    # Memory is only sampled every few leads to keep the overhead low
+    SAMPLE_EVERY = 10
+    
+    def __init__(self, max_browser_mb=None, max_heap_mb=None, recycle_every=None):
+        self.max_browser_mb = max_browser_mb or 0
+        self.max_heap_mb = max_heap_mb or 0
+        self.recycle_every = recycle_every or 0
+        self.last_sample = {}
+        self.reset()
+        
+    def reset(self):
+        """Forget per-tab state after a tab or browser has been replaced"""
+        self.metrics_enabled = False
+        
+    def sample(self, driver):
+        """Return the browser RSS and tab JS heap in MB, where available"""
+        sample = {}
+        try:
+            import psutil
+            process = psutil.Process(driver.service.process.pid)
+            processes = [process] + process.children(recursive=True)
+            sample['browser_mb'] = sum(p.memory_info().rss for p in processes if p.is_running()) / 2 ** 20
+        except Exception:
+            pass
+        try:
+            if not self.metrics_enabled:
+                driver.execute_cdp_cmd('Performance.enable', {})
+                self.metrics_enabled = True
+            metrics = driver.execute_cdp_cmd('Performance.getMetrics', {})['metrics']
+            values = {metric['name']: metric['value'] for metric in metrics}
+            if 'JSHeapUsedSize' in values:
+                sample['heap_mb'] = values['JSHeapUsedSize'] / 2 ** 20
+        except Exception:
+            pass
+        self.last_sample = sample
+        return sample
+        
+    def check(self, driver, leads_since_recycle):
+        """Return 'browser', 'tab' or None depending on memory use and leads processed"""
+        if leads_since_recycle % self.SAMPLE_EVERY == 0:
+            sample = self.sample(driver)
+            if self.max_browser_mb and sample.get('browser_mb', 0) > self.max_browser_mb:
+                return 'browser'
+            if self.max_heap_mb and sample.get('heap_mb', 0) > self.max_heap_mb:
+                return 'tab'
+        if self.recycle_every and leads_since_recycle >= self.recycle_every:
+            return 'tab'
+        return None
+
+
+class CommandWatchdog:
+    """Kills the browser when a WebDriver command hangs, so the blocked call raises
+    
+    A background thread checks the deadline of the lead or phase being
+    processed. A command stuck past the deadline, or still running a few
+    seconds after Stop was pressed, cannot be interrupted from Python. The
+    watched driver's commands are tracked so Stop also reaches commands
+    issued while no deadline is armed. Killing ChromeDriver
+    and its Chrome processes makes the pending call fail, and the scraper
+    then restarts the browser. fired tells the scraper why its call failed.
+    """
+    LEAD_TIMEOUT = 90
+    # Seconds between deadline checks
+    POLL_INTERVAL = 0.5
+    # Seconds a running command gets to finish after Stop is pressed
+    STOP_GRACE = 3
+    
+    def __init__(self, stop_event, timeout=None):
+        self.stop_event = stop_event
+        self.timeout = self.LEAD_TIMEOUT if timeout is None else timeout
+        self.lock = threading.Lock()
+        self.driver = None
+        self.deadline = None
+        # When the WebDriver command in flight started, or None
+        self.command_started = None
+        self.stop_seen = None
+        self.fired = None
+        self.closed = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        
+    def start(self):
+        self.thread.start()
+        
+    def watch(self, driver):
+        """Watch a newly started browser, or stop watching with None"""
+        if driver is not None:
+            self.track(driver)
+        with self.lock:
+            self.driver = driver
+            
+    def track(self, driver):
+        """Wrap the command executor of a browser to know when a command is in flight"""
+        execute = driver.execute
+        
+        def tracked(command, params=None):
+            with self.lock:
+                self.command_started = time.monotonic()
+            try:
+                return execute(command, params)
+            finally:
+                with self.lock:
+                    self.command_started = None
+                    
+        driver.execute = tracked
+        
+    def arm(self, seconds=None):
+        """Start the time budget of a lead"""
+        seconds = self.timeout if seconds is None else seconds
+        with self.lock:
+            self.deadline = time.monotonic() + seconds if seconds else None
+            self.fired = None
+            
+    def disarm(self):
+        with self.lock:
+            self.deadline = None
+            
+    def close(self):
+        self.closed.set()
+        
+    def _run(self):
+        while not self.closed.wait(self.POLL_INTERVAL):
+            now = time.monotonic()
+            with self.lock:
+                if self.driver is None:
+                    continue
+                if self.stop_event.is_set():
+                    self.stop_seen = self.stop_seen or now
+                    # Only a command that is still running after the grace period is killed
+                    running = self.command_started is not None
+                    reason = 'stop' if running and now - max(self.stop_seen, self.command_started) > self.STOP_GRACE else None
+                else:
+                    reason = 'timeout' if self.deadline is not None and now > self.deadline else None
+                if not reason:
+                    continue
+                driver, self.driver, self.deadline, self.fired = self.driver, None, None, reason
+            self.kill_browser(driver)
+            
+    @staticmethod
+    def kill_browser(driver):
+        """Kill ChromeDriver and the Chrome processes it started"""
+        try:
+            process = driver.service.process
+        except AttributeError:
+            return
+        try:
+            import psutil
+            for child in psutil.Process(process.pid).children(recursive=True):
+                try:
+                    child.kill()
+                except psutil.Error:
+                    pass
+        except Exception:
+            pass
+        try:
+            process.kill()
+        except Exception:
+            pass
+
+
+class CommandTracer:
+    """Records every WebDriver command with its selector, duration and outcome
+    
+    WebDriver.execute is the one call that finds, clicks, attribute reads and
+    scripts all go through, so it is wrapped on the driver instance. Each
+    command is tagged with the lead and field being extracted, streamed to a
+    JSON Lines trace and totalled per command, field, selector and lead.
+    Errors are counted even when the scraper catches them, which shows how
+    often the selector fallbacks fail.
+    """
+    # Rows kept in each table of the report
+    TOP = 25
+    
+    def __init__(self, trace_path=None):
+        self.trace_path = trace_path
+        self.file = None
+        self.lead = None
+        self.field = None
+        self.total = self.totals()
+        self.by_command = {}
+        self.by_field = {}
+        self.by_selector = {}
+        self.by_lead = {}
+    
+    @staticmethod
+    def totals():
+        return {"count": 0, "seconds": 0.0, "errors": 0, "empty": 0}
+    
+    @staticmethod
+    def filename_for(output_file, suffix):
+        """Return a diagnostics file beside a leads output file"""
+        return os.path.splitext(output_file)[0] + suffix
+    
+    def attach(self, driver):
+        """Wrap the command executor of a newly started browser"""
+        execute = driver.execute
+        
+        def traced(command, params=None):
+            started = time.perf_counter()
+            outcome = "ok"
+            try:
+                response = execute(command, params)
+                if isinstance(response, dict) and response.get("value") == []:
+                    outcome = "empty"
+                return response
+            except Exception as e:
+                outcome = type(e).__name__
+                raise
+            finally:
+                self.record(command, params, time.perf_counter() - started, outcome)
+        
+        driver.execute = traced
+    
+    def begin_lead(self, label):
+        """Attribute the following commands to a lead"""
+        self.lead = label
+        self.field = None
+    
+    def end_lead(self):
+        self.lead = None
+        self.field = None
+    
+    def record(self, command, params, seconds, outcome):
+        """Add one command to the trace and the totals"""
+        selector = f"{params['using']}={params.get('value')}" if params and "using" in params else None
+        if self.trace_path:
+            if self.file is None:
+                self.file = open(self.trace_path, "w", encoding="utf-8")
+            self.file.write(json.dumps({"command": command, "selector": selector, "seconds": round(seconds, 6),
+                                        "outcome": outcome, "lead": self.lead, "field": self.field}) + "\n")
+        tables = [self.total, self.by_command.setdefault(command, self.totals()),
+                  self.by_field.setdefault(self.field or "(none)", self.totals())]
+        if selector:
+            tables.append(self.by_selector.setdefault(selector, self.totals()))
+        if self.lead is not None:
+            tables.append(self.by_lead.setdefault(str(self.lead), self.totals()))
+        for totals in tables:
+            totals["count"] += 1
+            totals["seconds"] += seconds
+            if outcome == "empty":
+                totals["empty"] += 1
+            elif outcome != "ok":
+                totals["errors"] += 1
+    
+    def top(self, table):
+        """Return the rows of a table, most time spent first"""
+        rows = [dict(totals, name=name, seconds=round(totals["seconds"], 4)) for name, totals in table.items()]
+        rows.sort(key=lambda row: row["seconds"], reverse=True)
+        return rows[:self.TOP]
+    
+    def report(self):
+        """Return the aggregated trace as a JSON serialisable dict"""
+        leads = len(self.by_lead)
+        return {
+            "commands": self.total["count"],
+            "seconds": round(self.total["seconds"], 4),
+            "errors": self.total["errors"],
+            "leads": leads,
+            "commands_per_lead": round(sum(t["count"] for t in self.by_lead.values()) / leads, 1) if leads else None,
+            "by_command": self.top(self.by_command),
+            "by_field": self.top(self.by_field),
+            "by_selector": self.top(self.by_selector),
+            "slowest_leads": self.top(self.by_lead),
+        }
+    
+    def summary(self):
+        """Return a one line summary for the status log"""
+        report = self.report()
+        per_lead = f", {report['commands_per_lead']} per lead" if report["leads"] else ""
+        return (f"Traced {report['commands']} WebDriver commands{per_lead}, {report['seconds']:.1f} s in total, "
+                f"{report['errors']} raised errors")
+    
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+
+class BrowserProfile:
+    """Gives each browser session a copy of a warm profile and a disk cache it can reuse
+    
+    A fresh profile makes Chrome download the Maps scripts and styles again
+    and lose the consent cookies. The first session saves its profile, minus
+    caches and lock files, as a template that later sessions copy, onto tmpfs
+    when asked. Chrome cannot share one disk cache between running browsers,
+    so caches live in numbered slots. A session locks a free slot, and the
+    next session or a parallel worker finds it warm.
+    """
+    DIRECTORY = "browser_profile"
+    # Days before the template is rebuilt, so cookies do not go stale
+    TEMPLATE_DAYS = 7
+    CACHE_MB = 512
+    MAX_SLOTS = 16
+    # Hours after which a slot lock is considered abandoned when psutil is missing
+    STALE_HOURS = 12
+    TMPFS = "/dev/shm"
+    STAMP = "template.json"
+    # Profile entries not worth copying between sessions
+    SKIP = {"SingletonLock", "SingletonSocket", "SingletonCookie", "lockfile", "Cache", "Code Cache",
+            "GPUCache", "GrShaderCache", "ShaderCache", "DawnCache", "Crashpad", "BrowserMetrics"}
+    
+    def __init__(self, directory, tmpfs=False):
+        self.root = os.path.join(directory, self.DIRECTORY)
+        self.template = os.path.join(self.root, "template")
+        self.tmpfs = tmpfs
+        self.profile_dir = None
+        self.cache_dir = None
+        self.warm = False
+    
+    def template_ready(self):
+        """Return True if a template exists and is recent enough to copy"""
+        try:
+            age = time.time() - os.path.getmtime(os.path.join(self.template, self.STAMP))
+        except OSError:
+            return False
+        return age < self.TEMPLATE_DAYS * 86400
+    
+    def prepare(self):
+        """Create the session profile and return the Chrome arguments that use it"""
+        os.makedirs(self.root, exist_ok=True)
+        base = self.TMPFS if self.tmpfs and os.path.isdir(self.TMPFS) else None
+        self.profile_dir = tempfile.mkdtemp(prefix="gms-profile-", dir=base)
+        self.warm = self.template_ready()
+        if self.warm:
+            try:
+                shutil.copytree(self.template, self.profile_dir, ignore=self.ignore, dirs_exist_ok=True)
+            except (OSError, shutil.Error):
+                # A partial copy is still a usable profile
+                pass
+        arguments = [f"--user-data-dir={self.profile_dir}"]
+        self.cache_dir = self.claim_slot()
+        if self.cache_dir:
+            arguments.append(f"--disk-cache-dir={self.cache_dir}")
+            arguments.append(f"--disk-cache-size={self.CACHE_MB * 2 ** 20}")
+        return arguments
+    
+    def ignore(self, directory, names):
+        return [name for name in names if name in self.SKIP]
+    
+    def claim_slot(self):
+        """Lock the first free cache slot and return its directory, or None if all are taken"""
+        for slot in range(self.MAX_SLOTS):
+            path = os.path.join(self.root, f"cache{slot}")
+            for attempt in range(2):
+                try:
+                    fd = os.open(path + ".lock", os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                except FileExistsError:
+                    if attempt == 0 and self.lock_abandoned(path + ".lock"):
+                        try:
+                            os.remove(path + ".lock")
+                        except OSError:
+                            pass
+                        continue
+                    break
+                with os.fdopen(fd, "w") as f:
+                    f.write(str(os.getpid()))
+                os.makedirs(path, exist_ok=True)
+                return path
+        return None
+    
+    def lock_abandoned(self, lock_path):
+        """Return True if the process holding a slot lock is gone"""
+        try:
+            with open(lock_path) as f:
+                pid = int(f.read().strip() or 0)
+            age = time.time() - os.path.getmtime(lock_path)
+        except (OSError, ValueError):
+            return False
+        try:
+            import psutil
+            return not psutil.pid_exists(pid)
+        except ImportError:
+            return age > self.STALE_HOURS * 3600
+    
+    def save_template(self):
+        """Copy the session profile over the template, after the browser has exited"""
+        staging = tempfile.mkdtemp(prefix="template-", dir=self.root)
+        try:
+            shutil.copytree(self.profile_dir, staging, ignore=self.ignore, dirs_exist_ok=True)
+            with open(os.path.join(staging, self.STAMP), "w", encoding="utf-8") as f:
+                json.dump({"saved": time.time()}, f)
+            # Swap the directories, another worker may be doing the same
+            retired = None
+            if os.path.exists(self.template):
+                retired = tempfile.mkdtemp(prefix="retired-", dir=self.root)
+                os.replace(self.template, os.path.join(retired, "template"))
+            os.replace(staging, self.template)
+            if retired:
+                shutil.rmtree(retired, ignore_errors=True)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+    
+    def close(self, save=False):
+        """Remove the session profile and free the cache slot, saving the profile as template first if asked"""
+        if not self.profile_dir:
+            return
+        try:
+            if save and not self.template_ready():
+                self.save_template()
+        finally:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+            if self.cache_dir:
+                try:
+                    os.remove(self.cache_dir + ".lock")
+                except OSError:
+                    pass
+            self.profile_dir = self.cache_dir = None
+
+
+class TabPool:
+    """Loads several place pages at once in the tabs of one browser
+    
+    Navigations are started from a script so they do not block. The loading
+    tabs are then polled round-robin, and the first one whose place panel
+    has rendered is handed out for extraction. Network waits overlap while
+    one Chrome process, profile and cache are shared, so K tabs cost far less
+    memory than K browsers. A page that has not rendered within load_timeout
+    is handed out with a TimeoutError, so its place is retried rather than
+    extracted from a stale or blank tab.
+    """
+    TABS = 4
+    # Seconds a page may take to render before its place is failed
+    LOAD_TIMEOUT = 30
+    POLL_INTERVAL = 0.2
+    # Keeps tabs that are not in front loading at full speed
+    CHROME_FLAGS = ("--disable-background-timer-throttling", "--disable-renderer-backgrounding",
+                    "--disable-backgrounding-occluded-windows")
+    # The old page is marked so it is not mistaken for the new one before the navigation commits
+    LOAD_SCRIPT = "window.__gmsStale = true; window.location.href = arguments[0];"
+    READY_SCRIPT = ("return !window.__gmsStale && document.readyState === 'complete' && "
+                    "!!document.querySelector(arguments[0]);")
+    
+    def __init__(self, driver, size, ready_selector, load_timeout=None):
+        self.driver = driver
+        self.ready_selector = ready_selector
+        self.load_timeout = load_timeout or self.LOAD_TIMEOUT
+        self.home = driver.current_window_handle
+        self.idle = []
+        # Loading tabs, handle -> (item, time the navigation started)
+        self.loading = {}
+        self.cursor = 0
+        for _ in range(size):
+            self.idle.append(self.new_tab())
+        driver.switch_to.window(self.home)
+    
+    def __len__(self):
+        return len(self.loading)
+    
+    def new_tab(self):
+        self.driver.switch_to.new_window('tab')
+        return self.driver.current_window_handle
+    
+    def free(self):
+        """Return the number of tabs with nothing to load"""
+        return len(self.idle)
+    
+    def load(self, item, url):
+        """Start loading a place page in an idle tab"""
+        handle = self.idle.pop()
+        self.loading[handle] = (item, time.monotonic())
+        self.driver.switch_to.window(handle)
+        self.driver.execute_script(self.LOAD_SCRIPT, url)
+    
+    def next_ready(self):
+        """Switch to the next tab that has rendered and return (handle, item, started, error), or None
+        
+        error is the exception raised while checking a broken tab, or a
+        TimeoutError for a page that did not render in time, so its place
+        can be failed rather than polled forever.
+        """
+        handles = list(self.loading)
+        for offset in range(len(handles)):
+            handle = handles[(self.cursor + offset) % len(handles)]
+            item, started = self.loading[handle]
+            error = None
+            try:
+                self.driver.switch_to.window(handle)
+                ready = self.driver.execute_script(self.READY_SCRIPT, self.ready_selector)
+                if not ready and time.monotonic() - started > self.load_timeout:
+                    ready, error = True, TimeoutError(f"page did not render within {self.load_timeout:g} seconds")
+            except Exception as e:
+                ready, error = True, e
+            if ready:
+                # Start the next poll after this tab so no tab is starved
+                self.cursor = self.cursor + offset
+                del self.loading[handle]
+                return handle, item, started, error
+        return None
+    
+    def release(self, handle):
+        """Return a tab to the idle list after its page was extracted"""
+        self.idle.append(handle)
+    
+    def replace(self, handle):
+        """Close a tab and open a fresh one in its place, releasing its memory"""
+        self.loading.pop(handle, None)
+        try:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        except Exception:
+            pass
+        self.idle.append(self.new_tab())
+    
+    def drain(self):
+        """Forget the tabs still loading and return their items"""
+        items = [item for item, started in self.loading.values()]
+        self.idle.extend(self.loading)
+        self.loading.clear()
+        return items
+    
+    def close(self):
+        """Close the pool's tabs and switch back to the tab that was in front"""
+        for handle in self.idle + list(self.loading):
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except Exception:
+                pass
+        self.idle, self.loading = [], {}
+        self.driver.switch_to.window(self.home)
+
+
+class RetryQueue:
+    """Holds failed items until their backoff has passed, giving up after a number of attempts
+    
+    The delay doubles with every failure and gets some jitter so retries of
+    places that failed together do not all land at once.
+    """
+    MAX_ATTEMPTS = 3
+    # Seconds before the first retry
+    BACKOFF = 5
+    
+    def __init__(self, max_attempts=None, backoff=None):
+        self.max_attempts = max_attempts or self.MAX_ATTEMPTS
+        self.backoff = self.BACKOFF if backoff is None else backoff
+        self.attempts = {}
+        self.errors = {}
+        self.records = {}
+        self.waiting = []
+        
+    def __len__(self):
+        return len(self.waiting)
+        
+    def items(self):
+        """Return the items waiting for a retry"""
+        return [item for ready_at, item in self.waiting]
+        
+    def fail(self, item, error, record=None):
+        """Record a failed attempt, returning True if the item will be retried
+        
+        The record describes the item for the dead-letter file.
+        """
+        attempts = self.attempts.get(item, 0) + 1
+        self.attempts[item] = attempts
+        self.errors[item] = error
+        if record is not None:
+            self.records[item] = record
+        if attempts >= self.max_attempts:
+            return False
+        delay = self.backoff * 2 ** (attempts - 1) * random.uniform(0.8, 1.2)
+        self.waiting.append((time.monotonic() + delay, item))
+        self.waiting.sort(key=lambda entry: entry[0])
+        return True
+        
+    def pop_ready(self):
+        """Return the next item whose backoff has passed, or None"""
+        if self.waiting and self.waiting[0][0] <= time.monotonic():
+            return self.waiting.pop(0)[1]
+        return None
+        
+    def wait_time(self):
+        """Return the seconds until the next item is ready"""
+        return max(0.0, self.waiting[0][0] - time.monotonic()) if self.waiting else 0.0
+
+
+class SelectorRegistry:
+    """Per-field selector lists, loaded from a versioned data file, that reorder by performance
+    
+    Every lookup records whether the selector found a value and how long it
+    took. Selectors are tried in order of smoothed hit rate, then average
+    latency, so after a DOM change the selector that still works moves to the
+    front. Statistics are persisted between runs and reset when the data file
+    version changes. A field is flagged when its recent hit rate collapses
+    compared with its long-run rate.
+    """
+    DATA_FILE = "selectors.json"
+    # Number of recent leads used to detect a collapsing field
+    WINDOW = 50
+    COLLAPSE_RATE = 0.2
+    
+    def __init__(self, data_path=None, stats_path=None):
+        data_path = data_path or os.path.join(application_dir(), self.DATA_FILE)
+        with open(data_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self.version = data["version"]
+        self.fields = data["fields"]
+        # Selectors for the reviews pane, tried in order without statistics
+        self.reviews = data.get("reviews_pane", {})
+        self.place_json = data.get("place_json", {})
+        self.card_preview = data.get("card_preview", {})
+        # Shown once a place page has rendered, used to tell which tab finished loading
+        self.place_ready = data.get("place_ready", "h1")
+        self.stats_path = stats_path
+        self.stats, self.field_stats = self.load_stats()
+        self.recent = {field: deque(maxlen=self.WINDOW) for field in self.fields}
+        self.lead_hits = {}
+        self.flagged = set()
+        self._order = {}
+        
+    def load_stats(self):
+        """Load selector statistics saved for the current data file version"""
+        try:
+            with open(self.stats_path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            if stored.get("version") == self.version:
+                return stored["selectors"], stored["fields"]
+        except (OSError, ValueError, TypeError, KeyError):
+            pass
+        return {}, {}
+        
+    def save(self):
+        """Persist selector statistics"""
+        if not self.stats_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.stats_path), exist_ok=True)
+            temp_path = self.stats_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": self.version, "selectors": self.stats, "fields": self.field_stats}, f)
+            os.replace(temp_path, self.stats_path)
+        except OSError:
+            pass
+            
+    def attribute(self, field):
+        """Return the attribute to read for a field, or None to read its text"""
+        return self.fields[field].get("attribute")
+        
+    def fallback_tag(self, field):
+        """Return a tag name to fall back to when no selector matches"""
+        return self.fields[field].get("fallback_tag")
+        
+    def _score(self, field, by, selector):
+        entry = self.stats.get(field, {}).get(f"{by}|{selector}")
+        if not entry:
+            # Untried selectors rank as a coin flip
+            return (-0.5, 0.0)
+        tries = entry["hits"] + entry["misses"]
+        return (-(entry["hits"] + 1) / (tries + 2), entry["seconds"] / max(tries, 1))
+        
+    def ordered(self, field):
+        """Return the field's selectors, best performing first"""
+        order = self._order.get(field)
+        if order is None:
+            selectors = [tuple(item) for item in self.fields[field]["selectors"]]
+            # A stable sort keeps the data file order for ties
+            order = sorted(selectors, key=lambda item: self._score(field, *item))
+            self._order[field] = order
+        return order
+        
+    def record(self, field, by, selector, hit, seconds):
+        """Record the outcome of one selector lookup"""
+        entry = self.stats.setdefault(field, {}).setdefault(f"{by}|{selector}", {"hits": 0, "misses": 0, "seconds": 0.0})
+        entry["hits" if hit else "misses"] += 1
+        entry["seconds"] += seconds
+        self.lead_hits[field] = self.lead_hits.get(field, False) or hit
+        # Re-sort lazily the next time the field is looked up
+        self._order.pop(field, None)
+        
+    def end_lead(self):
+        """Close the current lead, updating the per-field recent hit windows"""
+        for field in self.fields:
+            found = self.lead_hits.get(field, False)
+            self.recent[field].append(found)
+            counts = self.field_stats.setdefault(field, {"found": 0, "leads": 0})
+            counts["found"] += found
+            counts["leads"] += 1
+        self.lead_hits = {}
+        
+    def collapsed_fields(self):
+        """Return newly collapsed fields as (field, recent rate, lifetime rate) tuples"""
+        collapsed = []
+        for field, recent in self.recent.items():
+            if field in self.flagged or len(recent) < self.WINDOW:
+                continue
+            counts = self.field_stats.get(field, {"found": 0, "leads": 0})
+            lifetime_rate = counts["found"] / counts["leads"] if counts["leads"] else 0
+            recent_rate = sum(recent) / len(recent)
+            if recent_rate < self.COLLAPSE_RATE and lifetime_rate >= 2 * self.COLLAPSE_RATE:
+                self.flagged.add(field)
+                collapsed.append((field, recent_rate, lifetime_rate))
+        return collapsed
+
+
+class Lead:
+    """Compact typed record for a single business"""
+    # Fields read from the place details panel
+    CORE_FIELDS = ("name", "address", "phone", "website", "rating", "reviews", "categories")
+    # Fields filled in by the website enrichment stage
+    EXTRA_FIELDS = ("email", "socials", "http_status")
+    # Fields derived by LeadNormalizer
+    NORMALIZED_FIELDS = ("phone_e164", "street", "city", "postcode", "country", "category_id")
+    # Fields parsed from the place URL
+    URL_FIELDS = ("latitude", "longitude", "cid", "feature_id", "place_id")
+    FIELDS = CORE_FIELDS + EXTRA_FIELDS + NORMALIZED_FIELDS + URL_FIELDS
+    HEADERS = ["Name", "Address", "Phone", "Website", "Rating", "Reviews", "Categories", "Email", "Socials", "HTTP Status",
+               "Phone (E.164)", "Street", "City", "Postcode", "Country", "Category ID",
+               "Latitude", "Longitude", "CID", "Feature ID", "Place ID"]
+    # Place URL fragments: the pinned coordinates, the map centre, the feature ID and the place ID
+    COORDINATES_PATTERN = re.compile(r'!3d(-?\d+(?:\.\d+)?)!4d(-?\d+(?:\.\d+)?)')
+    CENTRE_PATTERN = re.compile(r'/@(-?\d+(?:\.\d+)?),(-?\d+(?:\.\d+)?)')
+    FEATURE_ID_PATTERN = re.compile(r'!1s(0x[0-9a-f]+:0x[0-9a-f]+)', re.IGNORECASE)
+    PLACE_ID_PATTERN = re.compile(r'(?:!19s|place_id[:=]|query_place_id=)(ChIJ[\w-]+)')
+    CID_PATTERN = re.compile(r'[?&](?:ludo)?cid=(\d+)')
+    # A review count with a thousands or millions suffix, the suffix must not start a word
+    ABBREVIATED_COUNT_PATTERN = re.compile(r'(\d+(?:[.,]\d+)?)\s?([KkMm])(?![A-Za-z])')
+    __slots__ = FIELDS
+    # Placeholder shown for missing values in the UI and in CSV files
+    MISSING = "N/A"
+    
+    def __init__(self, name=None, address=None, phone=None, website=None, rating=None, reviews=None, categories=None,
+                 email=None, socials=None, http_status=None, phone_e164=None, street=None, city=None, postcode=None,
+                 country=None, category_id=None, latitude=None, longitude=None, cid=None, feature_id=None,
+                 place_id=None):
+        self.place_id = place_id
+        self.name = self.clean_text(name)
+        self.address = self.clean_text(address)
+        self.phone = self.clean_text(phone)
+        self.website = self.clean_text(website)
+        self.rating = self.parse_rating(rating)
+        self.reviews = self.parse_reviews(reviews)
+        # Categories repeat across a run, so share one string object per value
+        self.categories = self.intern_text(categories)
+        self.email = self.clean_text(email)
+        self.socials = self.clean_text(socials)
+        self.http_status = self.parse_status(http_status)
+        self.phone_e164 = self.clean_text(phone_e164)
+        self.street = self.clean_text(street)
+        self.postcode = self.clean_text(postcode)
+        # Like categories, these repeat across a run
+        self.city = self.intern_text(city)
+        self.country = self.intern_text(country)
+        self.category_id = self.intern_text(category_id)
+        self.latitude = self.parse_float(latitude)
+        self.longitude = self.parse_float(longitude)
+        self.cid = self.clean_text(cid)
+        self.feature_id = self.clean_text(feature_id)
+        
+    @classmethod
+    def clean_text(cls, value):
+        """Return stripped text, or None for empty values and the missing placeholder"""
+        if value is None:
+            return None
+        value = str(value).strip()
+        if not value or value == cls.MISSING:
+            return None
+        return value
+        
+    @classmethod
+    def intern_text(cls, value):
+        """Return cleaned text as an interned string"""
+        value = cls.clean_text(value)
+        return sys.intern(value) if value else None
+        
+    @classmethod
+    def parse_rating(cls, value):
+        """Convert a rating such as '4.5' to a float, or None if missing"""
+        if isinstance(value, float):
+            return None if math.isnan(value) else value
+        value = cls.clean_text(value)
+        if value is None:
+            return None
+        match = re.search(r'(\d+(?:[.,]\d+)?)', value)
+        return float(match.group(1).replace(",", ".")) if match else None
+        
+    @classmethod
+    def parse_reviews(cls, value):
+        """Convert a review count such as '(1,234)' to an int, or None if missing"""
+        if isinstance(value, int):
+            return None if value < 0 else value
+        value = cls.clean_text(value)
+        if value is None:
+            return None
+        # Prefer a count in parentheses, as in '4.5(1,234)', over the first number
+        parenthesised = re.search(r'\(([^()]*\d[^()]*)\)', value)
+        if parenthesised:
+            value = parenthesised.group(1)
+        # Counts above 999 are abbreviated, as in '1.2K' or '1,2 k'
+        match = cls.ABBREVIATED_COUNT_PATTERN.search(value)
+        if match:
+            number = float(match.group(1).replace(",", "."))
+            return int(round(number * (1000 if match.group(2) in "Kk" else 1000000)))
+        match = re.search(r'(\d+(?:[,.\s]\d{3})*)', value)
+        if not match:
+            return None
+        digits = re.sub(r'\D', '', match.group(1))
+        return int(digits) if digits else None
+        
+    @classmethod
+    def parse_float(cls, value):
+        """Convert a signed number such as a coordinate to a float, or None if missing"""
+        if isinstance(value, float):
+            return None if math.isnan(value) else value
+        value = cls.clean_text(value)
+        try:
+            return float(value) if value else None
+        except ValueError:
+            return None
+            
+    @classmethod
+    def parse_status(cls, value):
+        """Convert an HTTP status code to an int, or None if missing"""
+        if isinstance(value, int):
+            return None if value < 0 else value
+        value = cls.clean_text(value)
+        return int(value) if value and value.isdigit() else None
+        
+    @classmethod
+    def from_row(cls, row):
+        """Create a lead from a row of strings as stored in CSV files
+        
+        Files written by older versions have fewer columns, the missing
+        fields are left empty.
+        """
+        return cls(*list(row)[:len(cls.FIELDS)])
+        
+    def to_row(self):
+        """Return the lead as a row of display strings"""
+        return [self.MISSING if value is None else str(value)
+                for value in (getattr(self, field) for field in self.FIELDS)]
+                
+    def as_dict(self):
+        """Return the lead as a dict of typed values"""
+        return {field: getattr(self, field) for field in self.FIELDS}
+        
+    def to_record(self):
+        """Return a JSON-serialisable record"""
+        return self.as_dict()
+        
+    @classmethod
+    def from_record(cls, record):
+        """Create a lead from a record produced by to_record"""
+        return cls(**{key: record.get(key) for key in cls.FIELDS})
+        
+    @classmethod
+    def fields_from_url(cls, url):
+        """Parse the coordinates, CID, feature ID and place ID encoded in a place URL
+        
+        Only the fields found in the URL are returned. The pinned !3d/!4d
+        coordinates are preferred over the map centre after the @, which is
+        only used for /maps/place/ URLs. The CID is the second half of the
+        feature ID, as a decimal number.
+        """
+        fields = {}
+        if not url:
+            return fields
+        match = cls.COORDINATES_PATTERN.search(url)
+        if not match and "/maps/place/" in url:
+            match = cls.CENTRE_PATTERN.search(url)
+        if match:
+            fields["latitude"], fields["longitude"] = float(match.group(1)), float(match.group(2))
+        match = cls.FEATURE_ID_PATTERN.search(url)
+        if match:
+            fields["feature_id"] = match.group(1).lower()
+            fields["cid"] = cls.cid_from_feature_id(match.group(1))
+        else:
+            match = cls.CID_PATTERN.search(url)
+            if match:
+                fields["cid"] = match.group(1)
+        match = cls.PLACE_ID_PATTERN.search(url)
+        if match:
+            fields["place_id"] = match.group(1)
+        return fields
+        
+    def missing(self, fields):
+        """Return the given fields that have no value"""
+        return [field for field in fields if getattr(self, field) is None]
+        
+    def merge(self, other):
+        """Fill the fields that have no value with those of another lead"""
+        for field in self.missing(self.__slots__):
+            setattr(self, field, getattr(other, field))
+            
+    @staticmethod
+    def cid_from_feature_id(feature_id):
+        """Return the CID encoded in the second half of a 0x...:0x... feature ID, or None"""
+        try:
+            return str(int(feature_id.split(":")[1], 16))
+        except (AttributeError, IndexError, ValueError):
+            return None
+            
+    def key(self):
+        """Return a stable identifier: the place ID, the CID or a hash of name and address"""
+        if self.place_id:
+            return self.place_id
+        if self.cid:
+            return "cid:" + self.cid
+        text = f"{(self.name or '').lower()}|{(self.address or '').lower()}"
+        return "h:" + hashlib.sha1(text.encode("utf-8")).hexdigest()[:20]
+        
+    def __repr__(self):
+        return f"Lead(name={self.name!r}, rating={self.rating!r}, reviews={self.reviews!r})"
+
+
+class LeadColumnStore:
+    """Array-backed columnar store for large runs
+    
+    Each lead field is a column. Text columns are kept in lists that share
+    the interned strings of repeating values such as categories and cities,
+    while ratings, coordinates, review counts and HTTP status codes live in
+    typed arrays using NaN and -1 for missing values. No Lead object is kept
+    per row; leads are materialised on access, so the store can be used
+    anywhere a list of leads is expected.
+    """
+    # Typed array columns: field -> (array type code, missing value)
+    TYPED_COLUMNS = {"rating": ('d', math.nan), "reviews": ('q', -1), "http_status": ('h', -1),
+                     "latitude": ('d', math.nan), "longitude": ('d', math.nan)}
+    
+    def __init__(self, leads=None):
+        self.columns = {field: array(self.TYPED_COLUMNS[field][0]) if field in self.TYPED_COLUMNS else []
+                        for field in Lead.FIELDS}
+        if leads:
+            self.extend(leads)
+            
+    def append(self, lead):
+        """Append a lead to the store"""
+        for field, column in self.columns.items():
+            value = getattr(lead, field)
+            if value is None and field in self.TYPED_COLUMNS:
+                value = self.TYPED_COLUMNS[field][1]
+            column.append(value)
+            
+    def extend(self, leads):
+        """Append several leads to the store"""
+        for lead in leads:
+            self.append(lead)
+            
+    def __len__(self):
+        return len(self.columns["name"])
+        
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        # Columns are in Lead.FIELDS order, which matches the Lead constructor
+        return Lead(*(column[index] for column in self.columns.values()))
+        
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+            
+    def column(self, field):
+        """Return the raw column for a lead field"""
+        return self.columns[field]
+        
+    def is_missing(self, field, value):
+        """Check whether a raw column value stands for a missing value"""
+        if field not in self.TYPED_COLUMNS:
+            return value is None
+        if self.TYPED_COLUMNS[field][0] == 'd':
+            return math.isnan(value)
+        return value < 0
+        
+    def argsort(self, field, reverse=False):
+        """Return row indices ordered by a field, with missing values last"""
+        column = self.column(field)
+        present = [i for i, value in enumerate(column) if not self.is_missing(field, value)]
+        missing = sorted(set(range(len(self))) - set(present))
+        present.sort(key=column.__getitem__, reverse=reverse)
+        return present + missing
+        
+    def category_counts(self):
+        """Count leads per category"""
+        counts = {}
+        for category in self.columns["categories"]:
+            if category is not None:
+                counts[category] = counts.get(category, 0) + 1
+        return counts
+        
+    def mean_rating(self):
+        """Return the mean rating over leads that have one, or None"""
+        values = [rating for rating in self.columns["rating"] if not math.isnan(rating)]
+        return sum(values) / len(values) if values else None
+
+
+class LeadNormalizer:
+    """Batched normalisation of phones, addresses and categories
+    
+    A batch is normalised column by column. Each distinct value in a column
+    is converted once and the result is looked up for every row. The
+    conversions are memoised across batches, so repeated cities, categories
+    and phone formats cost one dict lookup each. Phones are formatted as
+    E.164, using the phonenumbers package when it is installed and a
+    built-in parser for common formats otherwise.
+    """
+    # Calling codes by ISO country code
+    CALLING_CODES = {
+        "US": "1", "CA": "1", "GB": "44", "IE": "353", "DE": "49", "FR": "33", "ES": "34", "IT": "39",
+        "NL": "31", "BE": "32", "CH": "41", "AT": "43", "PT": "351", "SE": "46", "NO": "47", "DK": "45",
+        "FI": "358", "PL": "48", "AU": "61", "NZ": "64", "IN": "91", "SG": "65", "AE": "971", "ZA": "27",
+        "BR": "55", "MX": "52", "JP": "81", "PH": "63", "ID": "62", "TR": "90",
+    }
+    # Country names as they appear at the end of Google Maps addresses
+    COUNTRY_NAMES = {
+        "united states": "US", "usa": "US", "canada": "CA", "united kingdom": "GB", "uk": "GB", "ireland": "IE",
+        "germany": "DE", "deutschland": "DE", "france": "FR", "spain": "ES", "españa": "ES", "italy": "IT",
+        "italia": "IT", "netherlands": "NL", "nederland": "NL", "belgium": "BE", "belgië": "BE",
+        "switzerland": "CH", "schweiz": "CH", "austria": "AT", "österreich": "AT", "portugal": "PT",
+        "sweden": "SE", "sverige": "SE", "norway": "NO", "norge": "NO", "denmark": "DK", "danmark": "DK",
+        "finland": "FI", "poland": "PL", "polska": "PL", "australia": "AU", "new zealand": "NZ", "india": "IN",
+        "singapore": "SG", "united arab emirates": "AE", "south africa": "ZA", "brazil": "BR", "brasil": "BR",
+        "mexico": "MX", "méxico": "MX", "japan": "JP", "philippines": "PH", "indonesia": "ID", "turkey": "TR",
+        "türkiye": "TR",
+    }
+    # Countries whose national numbers keep their leading zero after the calling code
+    KEEP_TRUNK_ZERO = ("IT",)
+    # Postcode formats, most specific first
+    POSTCODE_PATTERNS = [
+        re.compile(r'\b[A-Z]{1,2}\d[A-Z\d]?\s*\d[A-Z]{2}\b'),  # United Kingdom
+        re.compile(r'\b[A-Z]\d[A-Z]\s?\d[A-Z]\d\b'),  # Canada
+        re.compile(r'\b\d{4}\s?[A-Z]{2}\b'),  # Netherlands
+        re.compile(r'\b\d{2,4}-\d{3}\b'),  # Portugal and Poland
+        re.compile(r'\b\d{5}(?:-\d{4})?\b'),  # United States and most of Europe
+        re.compile(r'\b\d{4,6}\b'),
+    ]
+    # Memoised values per column before the memo is reset
+    MAX_CACHE = 500000
+    
+    def __init__(self, default_country=None):
+        self.default_country = default_country or self.locale_country()
+        self.phone_cache = {}
+        self.address_cache = {}
+        self.category_cache = {}
+        try:
+            import phonenumbers
+            self.phonenumbers = phonenumbers
+        except ImportError:
+            self.phonenumbers = None
+            
+    @classmethod
+    def locale_country(cls):
+        """Guess the default phone country from the system locale"""
+        import locale
+        
+        name = locale.getlocale()[0] or ""
+        country = name.split("_")[-1].upper() if "_" in name else ""
+        return country if country in cls.CALLING_CODES else "US"
+        
+    def _convert(self, cache, values, convert):
+        """Convert each distinct value once and look up the memoised result for every row"""
+        distinct = set(values)
+        if len(cache) + len(distinct) > self.MAX_CACHE:
+            cache.clear()
+        for value in distinct:
+            if value not in cache:
+                cache[value] = convert(value)
+        return list(map(cache.__getitem__, values))
+        
+    def normalize_columns(self, phones, addresses, categories):
+        """Normalise whole columns of raw values into columns of the normalised fields
+        
+        The columns can be any sequences of equal length, such as the lists
+        of a LeadColumnStore or DataFrame columns.
+        """
+        addresses = list(addresses)
+        parts = self._convert(self.address_cache, addresses, self.parse_address)
+        countries = [part[3] for part in parts]
+        # The address country picks the calling code for national numbers
+        phone_keys = list(zip(phones, countries))
+        return {
+            "phone_e164": self._convert(self.phone_cache, phone_keys, self._phone_key_to_e164),
+            "street": [part[0] for part in parts],
+            "city": [part[1] for part in parts],
+            "postcode": [part[2] for part in parts],
+            "country": countries,
+            "category_id": self._convert(self.category_cache, list(categories), self.category_id),
+        }
+        
+    def normalize(self, leads):
+        """Fill in the normalised fields of a batch of leads and return them"""
+        leads = list(leads)
+        if not leads:
+            return leads
+        columns = self.normalize_columns([lead.phone for lead in leads], [lead.address for lead in leads],
+                                         [lead.categories for lead in leads])
+        for field, values in columns.items():
+            for lead, value in zip(leads, values):
+                setattr(lead, field, value)
+        return leads
+        
+    def normalize_store(self, store):
+        """Normalise the columns of a LeadColumnStore in place"""
+        store.columns.update(self.normalize_columns(store.column("phone"), store.column("address"),
+                                                    store.column("categories")))
+        
+    def _phone_key_to_e164(self, key):
+        return self.phone_to_e164(*key)
+        
+    def phone_to_e164(self, phone, country=None):
+        """Convert a displayed phone number to E.164, or None if it cannot be read"""
+        if not phone:
+            return None
+        country = country if country in self.CALLING_CODES else self.default_country
+        if self.phonenumbers:
+            try:
+                number = self.phonenumbers.parse(phone, country)
+            except self.phonenumbers.NumberParseException:
+                return None
+            if not self.phonenumbers.is_possible_number(number):
+                return None
+            return self.phonenumbers.format_number(number, self.phonenumbers.PhoneNumberFormat.E164)
+            
+        digits = re.sub(r'\D', '', phone)
+        if phone.lstrip().startswith("+"):
+            number = digits
+        elif digits.startswith("00"):
+            number = digits[2:]
+        else:
+            code = self.CALLING_CODES[country]
+            if code == "1" and len(digits) == 11 and digits.startswith("1"):
+                digits = digits[1:]
+            elif digits.startswith("0") and country not in self.KEEP_TRUNK_ZERO:
+                digits = digits[1:]
+            number = code + digits
+        # E.164 numbers have at most 15 digits, anything much shorter is not a full number
+        return "+" + number if 8 <= len(number) <= 15 else None
+        
+    @classmethod
+    def parse_address(cls, address):
+        """Split a comma separated address into (street, city, postcode, country)"""
+        if not address:
+            return (None, None, None, None)
+        parts = [part.strip() for part in address.split(",") if part.strip()]
+        country = None
+        if len(parts) > 1 and parts[-1].lower() in cls.COUNTRY_NAMES:
+            country = cls.COUNTRY_NAMES[parts.pop().lower()]
+        if len(parts) < 2:
+            return (parts[0] if parts else None, None, None, country)
+            
+        # Working back from the end, the first postcode found and the first part
+        # left over once postcodes and state codes are removed give the city
+        city = postcode = None
+        for part in reversed(parts[1:]):
+            if postcode is None:
+                for pattern in cls.POSTCODE_PATTERNS:
+                    match = pattern.search(part)
+                    if match:
+                        postcode = match.group(0)
+                        part = part[:match.start()] + part[match.end():]
+                        break
+            remainder = re.sub(r'\b[A-Z]{2,3}\b|\S*\d\S*', '', part).strip(" -")
+            if remainder:
+                city = remainder
+                break
+        return (parts[0], city, postcode, country)
+        
+    @staticmethod
+    def category_id(label):
+        """Return a canonical identifier for a category label, such as 'italian_restaurant'"""
+        import unicodedata
+        
+        if not label:
+            return None
+        primary = re.split(r'[,·|]', label)[0].strip()
+        ascii_text = unicodedata.normalize("NFKD", primary).encode("ascii", "ignore").decode("ascii")
+        slug = re.sub(r'[^a-z0-9]+', '_', ascii_text.lower()).strip("_")
+        # Labels without any Latin letters keep their own characters
+        return slug or re.sub(r'\W+', '_', primary.lower()).strip("_") or None
+
+
+class LeadExporter:
+    """Streaming writers that export leads row by row without building intermediate copies"""
+    # Number of rows per Parquet row group
+    BATCH_SIZE = 10000
+    
+    def __init__(self, filename, progress_callback=None, stop_event=None):
+        self.filename = filename
+        self.progress_callback = progress_callback
+        self.stop_event = stop_event
+        self.normalizer = LeadNormalizer()
+        
+    @classmethod
+    def supported_extensions(cls):
+        """Return the file extensions that can be exported"""
+        return ['.csv', '.xlsx', '.parquet', '.jsonl']
+        
+    def export(self, leads):
+        """Export leads to the file, choosing the writer from the file extension"""
+        extension = os.path.splitext(self.filename)[1].lower()
+        if extension == '.xlsx':
+            return self.write_xlsx(leads)
+        elif extension == '.parquet':
+            return self.write_parquet(leads)
+        elif extension in ('.jsonl', '.ndjson'):
+            return self.write_jsonl(leads)
+        return self.write_csv(leads)
+        
+    def _rows(self, leads):
+        """Yield normalised leads while reporting progress and honouring cancellation"""
+        total = len(leads) or 1
+        step = max(1, total // 100)
+        batch = []
+        for index, lead in enumerate(leads):
+            if self.stop_event is not None and self.stop_event.is_set():
+                return
+            if self.progress_callback and index % step == 0:
+                self.progress_callback(int(index / total * 100))
+            batch.append(lead)
+            if len(batch) >= self.BATCH_SIZE:
+                yield from self.normalizer.normalize(batch)
+                batch = []
+        yield from self.normalizer.normalize(batch)
+        if self.progress_callback:
+            self.progress_callback(100)
+            
+    def write_csv(self, leads):
+        """Write leads to a CSV file"""
+        count = 0
+        with open(self.filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(Lead.HEADERS)
+            for lead in self._rows(leads):
+                writer.writerow(lead.to_row())
+                count += 1
+        return count
+        
+    def write_jsonl(self, leads):
+        """Write leads to a JSON Lines file with typed values and nulls for missing fields"""
+        count = 0
+        with open(self.filename, 'w', encoding='utf-8') as f:
+            for lead in self._rows(leads):
+                f.write(json.dumps(lead.as_dict(), ensure_ascii=False) + "\n")
+                count += 1
+        return count
+        
+    def write_xlsx(self, leads):
+        """Write leads to an Excel file using openpyxl's write-only mode"""
+        from openpyxl import Workbook
+        
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Leads")
+        sheet.append(Lead.HEADERS)
+        count = 0
+        for lead in self._rows(leads):
+            sheet.append(lead.to_row())
+            count += 1
+        workbook.save(self.filename)
+        return count
+        
+    def write_parquet(self, leads):
+        """Write leads to a Parquet file in row groups with typed columns"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        # Every other field is a string column
+        types = {"rating": pa.float64(), "reviews": pa.int64(), "http_status": pa.int32(),
+                 "latitude": pa.float64(), "longitude": pa.float64()}
+        schema = pa.schema([(field, types.get(field, pa.string())) for field in Lead.FIELDS])
+        count = 0
+        with pq.ParquetWriter(self.filename, schema) as writer:
+            batch = []
+            for lead in self._rows(leads):
+                batch.append(lead)
+                if len(batch) >= self.BATCH_SIZE:
+                    writer.write_table(self._parquet_table(pa, schema, batch))
+                    count += len(batch)
+                    batch = []
+            if batch:
+                writer.write_table(self._parquet_table(pa, schema, batch))
+                count += len(batch)
+        return count
+        
+    def _parquet_table(self, pa, schema, batch):
+        """Build a typed Arrow table from a batch of lead rows"""
+        columns = [[getattr(lead, field.name) for lead in batch] for field in schema]
+        return pa.Table.from_arrays([pa.array(column, type=field.type) for column, field in zip(columns, schema)], schema=schema)
+
+
+class ExportThread(threading.Thread):
+    """Thread class for exporting results in the background"""
+    def __init__(self, filename, leads):
+        threading.Thread.__init__(self)
+        self.filename = filename
+        self.leads = leads
+        self.queue = queue.Queue()
+        self.stop_event = threading.Event()
+        self.daemon = True
+        
+    def run(self):
+        try:
+            exporter = LeadExporter(self.filename, lambda percent: self.queue.put(('progress', percent)), self.stop_event)
+            count = exporter.export(self.leads)
+            if self.stop_event.is_set():
+                self.queue.put(('info', "Export cancelled."))
+            else:
+                self.queue.put(('success', f"Exported {count} leads to {self.filename}!"))
+        except ImportError as e:
+            self.queue.put(('error', f"Missing dependency for this export format: {str(e)}. "
+                                     "Install it with 'pip install openpyxl pyarrow'."))
+        except Exception as e:
+            self.queue.put(('error', f"Error exporting data: {str(e)}"))
+            
+    def stop(self):
+        """Stop the export thread"""
+        self.stop_event.set()
+
+
+class BatchSink:
+    """Base class for sinks that buffer records and hand them to the subclass in batches
+    
+    Writes are guarded by a lock so a sink can be shared between threads.
+    """
+    BATCH_SIZE = 25
+    
+    def __init__(self, batch_size=None):
+        self.batch_size = batch_size or self.BATCH_SIZE
+        self.buffer = []
+        self.lock = threading.Lock()
+        self.closed = False
+        
+    def write(self, record):
+        """Buffer a record, writing the batch once it is full"""
+        with self.lock:
+            self.buffer.append(record)
+            if len(self.buffer) >= self.batch_size:
+                self._flush()
+                
+    def flush(self):
+        """Write any buffered records"""
+        with self.lock:
+            self._flush()
+            
+    def _flush(self):
+        if self.buffer and not self.closed:
+            self.write_batch(self.prepare(self.buffer))
+        self.buffer = []
+        
+    def close(self):
+        """Flush buffered records and release the underlying file"""
+        with self.lock:
+            if self.closed:
+                return
+            try:
+                self._flush()
+            finally:
+                self.closed = True
+                self.release()
+                
+    def prepare(self, records):
+        """Return the batch to write, subclasses may transform it"""
+        return records
+        
+    def write_batch(self, records):
+        raise NotImplementedError
+        
+    def release(self):
+        pass
+
+
+class LeadSink(BatchSink):
+    """Base class for output sinks that receive leads while a scrape is running
+    
+    Each batch of leads is normalised before it is written.
+    """
+    def __init__(self, batch_size=None):
+        BatchSink.__init__(self, batch_size)
+        self.normalizer = LeadNormalizer()
+        
+    @staticmethod
+    def open_for(filename):
+        """Open the sink matching the output file extension"""
+        if os.path.splitext(filename)[1].lower() in SQLiteLeadSink.EXTENSIONS:
+            return SQLiteLeadSink(filename)
+        return CSVLeadSink(filename)
+        
+    def prepare(self, leads):
+        return self.normalizer.normalize(leads)
+
+
+class CSVLeadSink(LeadSink):
+    """Writes leads to a CSV file, replacing any previous contents"""
+    def __init__(self, filename, batch_size=None):
+        LeadSink.__init__(self, batch_size)
+        self.file = open(filename, "w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(Lead.HEADERS)
+        
+    def write_batch(self, leads):
+        self.writer.writerows(lead.to_row() for lead in leads)
+        self.file.flush()
+        
+    def release(self):
+        self.file.close()
+
+
+class SQLiteLeadSink(LeadSink):
+    """Writes leads to an SQLite database, upserting on the place key
+    
+    The database runs in WAL mode so several workers can write to the same
+    file while the Results tab reads from it. Each batch is one transaction.
+    first_seen is kept from the first insert and last_seen is bumped on
+    every upsert.
+    """
+    EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS leads (
+            place_id TEXT PRIMARY KEY,
+            name TEXT,
+            address TEXT,
+            phone TEXT,
+            website TEXT,
+            rating REAL,
+            reviews INTEGER,
+            categories TEXT,
+            email TEXT,
+            socials TEXT,
+            http_status INTEGER,
+            phone_e164 TEXT,
+            street TEXT,
+            city TEXT,
+            postcode TEXT,
+            country TEXT,
+            category_id TEXT,
+            latitude REAL,
+            longitude REAL,
+            cid TEXT,
+            feature_id TEXT,
+            first_seen TEXT NOT NULL,
+            last_seen TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_leads_categories ON leads (categories);
+        CREATE INDEX IF NOT EXISTS idx_leads_city ON leads (city);
+        CREATE INDEX IF NOT EXISTS idx_leads_rating ON leads (rating);
+        CREATE INDEX IF NOT EXISTS idx_leads_category_id ON leads (category_id);
+        CREATE INDEX IF NOT EXISTS idx_leads_phone_e164 ON leads (phone_e164);
+    """
+    UPSERT = """
+        INSERT INTO leads (place_id, name, address, phone, website, rating, reviews, categories,
+                           email, socials, http_status, phone_e164, street, city, postcode, country, category_id,
+                           latitude, longitude, cid, feature_id, first_seen, last_seen)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (place_id) DO UPDATE SET
+            name = COALESCE(excluded.name, leads.name),
+            address = COALESCE(excluded.address, leads.address),
+            phone = COALESCE(excluded.phone, leads.phone),
+            website = COALESCE(excluded.website, leads.website),
+            rating = COALESCE(excluded.rating, leads.rating),
+            reviews = COALESCE(excluded.reviews, leads.reviews),
+            categories = COALESCE(excluded.categories, leads.categories),
+            email = COALESCE(excluded.email, leads.email),
+            socials = COALESCE(excluded.socials, leads.socials),
+            http_status = COALESCE(excluded.http_status, leads.http_status),
+            phone_e164 = COALESCE(excluded.phone_e164, leads.phone_e164),
+            street = COALESCE(excluded.street, leads.street),
+            city = COALESCE(excluded.city, leads.city),
+            postcode = COALESCE(excluded.postcode, leads.postcode),
+            country = COALESCE(excluded.country, leads.country),
+            category_id = COALESCE(excluded.category_id, leads.category_id),
+            latitude = COALESCE(excluded.latitude, leads.latitude),
+            longitude = COALESCE(excluded.longitude, leads.longitude),
+            cid = COALESCE(excluded.cid, leads.cid),
+            feature_id = COALESCE(excluded.feature_id, leads.feature_id),
+            last_seen = excluded.last_seen
+    """
+    # Lead fields stored beside the key, the place_id column holds Lead.key()
+    COLUMNS = tuple(field for field in Lead.FIELDS if field != "place_id")
+    # Columns added after the first release, with their types, for migrating older files
+    ADDED_COLUMNS = [("email", "TEXT"), ("socials", "TEXT"), ("http_status", "INTEGER"), ("phone_e164", "TEXT"),
+                     ("street", "TEXT"), ("postcode", "TEXT"), ("country", "TEXT"), ("category_id", "TEXT"),
+                     ("latitude", "REAL"), ("longitude", "REAL"), ("cid", "TEXT"), ("feature_id", "TEXT")]
+    
+    def __init__(self, filename, batch_size=None):
+        LeadSink.__init__(self, batch_size)
+        self.conn = self.connect(filename)
+        self.migrate(self.conn)
+        self.conn.executescript(self.SCHEMA)
+        
+    @staticmethod
+    def connect(filename):
+        """Open a connection configured for concurrent writers"""
+        conn = sqlite3.connect(filename, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=30000")
+        return conn
+        
+    @classmethod
+    def migrate(cls, conn):
+        """Add columns that are missing from a database written by an older version"""
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(leads)")}
+        if not existing:
+            return
+        with conn:
+            for name, column_type in cls.ADDED_COLUMNS:
+                if name not in existing:
+                    conn.execute(f"ALTER TABLE leads ADD COLUMN {name} {column_type}")
+                    
+    def write_batch(self, leads):
+        now = datetime.now().isoformat(timespec='seconds')
+        rows = [(lead.key(), *(getattr(lead, field) for field in self.COLUMNS), now, now) for lead in leads]
+        with self.conn:
+            self.conn.executemany(self.UPSERT, rows)
+            
+    def release(self):
+        self.conn.close()
+        
+    @classmethod
+    def count(cls, filename):
+        """Return the number of leads stored in a database"""
+        conn = cls.connect(filename)
+        try:
+            cls.migrate(conn)
+            return conn.execute("SELECT COUNT(*) FROM leads").fetchone()[0]
+        finally:
+            conn.close()
+            
+    @classmethod
+    def page(cls, filename, offset=0, limit=500):
+        """Read one page of leads from a database, most recently seen first"""
+        conn = cls.connect(filename)
+        try:
+            cls.migrate(conn)
+            rows = conn.execute(
+                f"SELECT {', '.join(cls.COLUMNS)}, place_id FROM leads "
+                "ORDER BY last_seen DESC, rowid LIMIT ? OFFSET ?", (limit, offset)).fetchall()
+        finally:
+            conn.close()
+        # Hashed and CID fallback keys are not real place IDs
+        return [Lead(*row[:-1], place_id=None if row[-1].startswith(("h:", "cid:")) else row[-1]) for row in rows]
+
+
+class CardPreviewReader:
+    """Reads the fields shown on the result cards of the feed, without opening any place
+    
+    Every card is read in a single script call. The cards show the name,
+    rating, review count and a website button, and lines of text separated by
+    middle dots that usually hold the category, address and phone number.
+    Coordinates and IDs come from the card link. After read(), closed holds
+    whether each card is marked as permanently closed.
+    """
+    READ_SCRIPT = """
+        var cards = arguments[0], selectors = arguments[1];
+        var first = function (root, list) {
+            for (var i = 0; i < list.length; i++) {
+                var element = root.querySelector(list[i]);
+                if (element) return element;
+            }
+            return null;
+        };
+        return cards.map(function (card) {
+            var text = function (list) {
+                var element = first(card, list);
+                return element ? element.textContent.trim() : null;
+            };
+            var link = card.matches('a[href]') ? card : first(card, selectors.link);
+            var website = first(card, selectors.website);
+            var lines = [];
+            for (var i = 0; i < selectors.info.length && !lines.length; i++) {
+                lines = Array.prototype.slice.call(card.querySelectorAll(selectors.info[i]));
+            }
+            // Only the innermost lines, their parents repeat the same text
+            lines = lines.filter(function (line) {
+                return !lines.some(function (other) { return other !== line && line.contains(other); });
+            });
+            return {
+                url: link ? link.href : null,
+                name: text(selectors.name) || (link ? link.getAttribute('aria-label') : null),
+                rating: text(selectors.rating),
+                reviews: text(selectors.reviews),
+                website: website ? website.href : null,
+                lines: lines.map(function (line) {
+                    return line.textContent.split(/[\u00b7\u22c5]/).map(function (part) {
+                        return part.trim();
+                    }).filter(function (part) { return part; });
+                })
+            };
+        });
+    """
+    PHONE_PATTERN = re.compile(r'^\+?[\d\s().-]{7,}$')
+    CLOSED_PATTERN = re.compile(r'^permanently closed$', re.IGNORECASE)
+    # Segments that are neither a category nor an address: ratings and price levels
+    SKIP_PATTERN = re.compile(r'^(?:\d[.,]\d|[$\u20ac\u00a3\u00a5\u20b9]+)')
+    
+    def __init__(self, selectors):
+        self.selectors = selectors
+        self.closed = []
+        
+    def read(self, driver, cards):
+        """Return a Lead for each card, or None for a card that could not be read"""
+        try:
+            previews = driver.execute_script(self.READ_SCRIPT, cards, self.selectors) or []
+        except Exception:
+            previews = []
+        previews += [None] * (len(cards) - len(previews))
+        self.closed = [self.is_closed(preview) for preview in previews]
+        return [self.lead_from_preview(preview) for preview in previews]
+        
+    @classmethod
+    def is_closed(cls, preview):
+        """Check whether a card is marked as permanently closed"""
+        return any(cls.CLOSED_PATTERN.match(segment)
+                   for segments in (preview or {}).get("lines") or [] for segment in segments)
+        
+    @classmethod
+    def lead_from_preview(cls, preview):
+        """Build a Lead from the values read off one card"""
+        if not preview or not preview.get("name"):
+            return None
+        phone = category = address = None
+        for segments in preview.get("lines") or []:
+            for segment in segments:
+                if phone is None and cls.PHONE_PATTERN.match(segment):
+                    phone = segment
+            # The category comes first on its line and the address follows it
+            if category is None:
+                text = [segment for segment in segments if not cls.SKIP_PATTERN.match(segment)
+                        and not cls.PHONE_PATTERN.match(segment) and not cls.CLOSED_PATTERN.match(segment)]
+                if text and text[0][:1].isalpha():
+                    category = text[0]
+                    address = text[1] if len(text) > 1 else None
+        fields = Lead.fields_from_url(preview.get("url"))
+        return Lead(name=preview["name"], address=address, phone=phone, website=preview.get("website"),
+                    rating=preview.get("rating"), reviews=preview.get("reviews"), categories=category, **fields)
+
+
+class LeadFilter:
+    """Decides from a card preview whether a place is worth a detail visit
+    
+    Places without a rating fail a minimum rating or review count. Category
+    filters match case-insensitive parts of the category, and a place whose
+    category is unknown is kept.
+    """
+    def __init__(self, min_rating=0, min_reviews=0, include_categories=(), exclude_categories=(),
+                 require_website=False, skip_closed=False):
+        self.min_rating = min_rating or 0
+        self.min_reviews = min_reviews or 0
+        self.include_categories = [category.lower() for category in include_categories]
+        self.exclude_categories = [category.lower() for category in exclude_categories]
+        self.require_website = require_website
+        self.skip_closed = skip_closed
+        
+    @classmethod
+    def from_params(cls, options):
+        """Build a filter from the filters search option, or return None when no filter is set"""
+        if not options:
+            return None
+        lead_filter = cls(min_rating=float(options.get('min_rating') or 0),
+                          min_reviews=int(options.get('min_reviews') or 0),
+                          include_categories=cls.split(options.get('include_categories')),
+                          exclude_categories=cls.split(options.get('exclude_categories')),
+                          require_website=bool(options.get('require_website')),
+                          skip_closed=bool(options.get('skip_closed')))
+        return lead_filter if lead_filter.active() else None
+        
+    @staticmethod
+    def split(text):
+        return [part.strip() for part in (text or "").split(",") if part.strip()]
+        
+    def active(self):
+        return bool(self.min_rating or self.min_reviews or self.include_categories or self.exclude_categories
+                    or self.require_website or self.skip_closed)
+                    
+    def rejects(self, lead, closed=False):
+        """Return why the lead is rejected, or None if it passes"""
+        if self.skip_closed and closed:
+            return "closed"
+        if self.min_rating and (lead.rating or 0) < self.min_rating:
+            return "rating"
+        if self.min_reviews and (lead.reviews or 0) < self.min_reviews:
+            return "reviews"
+        if self.require_website and not lead.website:
+            return "website"
+        category = (lead.categories or "").lower()
+        if category:
+            if self.include_categories and not any(part in category for part in self.include_categories):
+                return "category"
+            if any(part in category for part in self.exclude_categories):
+                return "category"
+        return None
+
+
+class VisitPriority:
+    """Orders the cards that need a detail visit by a score computed from their preview
+    
+    Higher scores are visited first and ties keep the feed order, so a run
+    that is stopped or runs out of time has already visited the most
+    valuable places. Cards without a preview score lowest.
+    """
+    FEED = "feed"
+    SCORES = {
+        "reviews": lambda lead: lead.reviews or 0,
+        "rating": lambda lead: (lead.rating or 0, lead.reviews or 0),
+        "website": lambda lead: (lead.website is not None, lead.reviews or 0),
+        # A high rating counts for more the more reviews back it up
+        "value": lambda lead: (lead.website is not None, (lead.rating or 0) * math.log10((lead.reviews or 0) + 1)),
+    }
+    ORDERS = (FEED,) + tuple(SCORES)
+    
+    @classmethod
+    def order(cls, indexes, previews, priority):
+        """Return the card indexes in visit order"""
+        score = cls.SCORES.get(priority)
+        if score is None:
+            return list(indexes)
+        lowest = (0, 0)
+        
+        def key(index):
+            preview = previews[index] if index < len(previews) else None
+            if preview is None:
+                return (False, lowest)
+            value = score(preview)
+            return (True, value if isinstance(value, tuple) else (value, 0))
+            
+        return sorted(indexes, key=key, reverse=True)
+
+
+class Review:
+    """A single review of a place, keyed by the place and Google's review ID"""
+    FIELDS = ("place_id", "review_id", "author", "rating", "date", "text")
+    __slots__ = FIELDS
+    
+    def __init__(self, place_id, review_id, author=None, rating=None, date=None, text=None):
+        self.place_id = place_id
+        self.review_id = review_id
+        self.author = Lead.clean_text(author)
+        self.rating = Lead.parse_rating(rating)
+        self.date = Lead.clean_text(date)
+        self.text = Lead.clean_text(text)
+        
+    def to_record(self):
+        """Return the review as a JSON-serialisable record"""
+        return {field: getattr(self, field) for field in self.FIELDS}
+        
+    def __repr__(self):
+        return f"Review(place_id={self.place_id!r}, review_id={self.review_id!r}, rating={self.rating!r})"
+
+
+class ReviewHarvester:
+    """Streams the reviews of the open place from its reviews pane
+    
+    The pane is scrolled one step per pass. Each pass reads the rendered
+    reviews in a single script call and removes the nodes it has read, so the
+    page does not grow with the number of reviews. Reviews are yielded one at
+    a time, deduplicated by review ID, up to a cap per place. on_progress is
+    called after every pass that found new reviews.
+    """
+    # Scroll passes without new reviews before the end of the list is assumed
+    MAX_IDLE_PASSES = 3
+    # Seconds the pane gets to load the next reviews after each scroll
+    PAUSE = 1.5
+    # Reads the rendered reviews, removes all but the last one and scrolls the pane
+    EXTRACT_SCRIPT = """
+        var selectors = arguments[0];
+        var first = function (root, list) {
+            for (var i = 0; i < list.length; i++) {
+                var element = root.querySelector(list[i]);
+                if (element) return element;
+            }
+            return null;
+        };
+        var items = [];
+        for (var i = 0; i < selectors.item.length && !items.length; i++) {
+            items = Array.prototype.slice.call(document.querySelectorAll(selectors.item[i]));
+        }
+        var reviews = items.map(function (item) {
+            var more = first(item, selectors.more);
+            if (more) more.click();
+            var text = function (list) {
+                var element = first(item, list);
+                return element ? element.textContent.trim() : null;
+            };
+            var stars = first(item, selectors.rating);
+            return {
+                review_id: item.getAttribute('data-review-id'),
+                author: text(selectors.author),
+                rating: stars ? stars.getAttribute('aria-label') : null,
+                date: text(selectors.date),
+                text: text(selectors.text)
+            };
+        });
+        items.slice(0, -1).forEach(function (item) { item.remove(); });
+        var pane = first(document, selectors.container);
+        if (pane) pane.scrollTop = pane.scrollHeight;
+        return reviews;
+    """
+    
+    def __init__(self, driver, selectors, max_reviews, pause=None, stop_event=None, on_progress=None):
+        self.driver = driver
+        self.selectors = selectors
+        self.max_reviews = max_reviews
+        self.pause = self.PAUSE if pause is None else pause
+        self.stop_event = stop_event or threading.Event()
+        self.on_progress = on_progress or (lambda: None)
+        
+    def open_pane(self):
+        """Click the reviews tab of the open place, returning False if there is none"""
+        for selector in self.selectors["tab"]:
+            for element in self.driver.find_elements(By.CSS_SELECTOR, selector):
+                try:
+                    element.click()
+                except Exception:
+                    self.driver.execute_script("arguments[0].click();", element)
+                self.stop_event.wait(self.pause)
+                return True
+        return False
+        
+    def harvest(self, place_id):
+        """Yield the reviews of the open place until the cap or the end of the list is reached"""
+        if self.max_reviews <= 0 or not self.open_pane():
+            return
+        seen = set()
+        idle_passes = 0
+        while len(seen) < self.max_reviews and idle_passes < self.MAX_IDLE_PASSES:
+            if self.stop_event.is_set():
+                return
+            new = 0
+            for item in self.driver.execute_script(self.EXTRACT_SCRIPT, self.selectors) or []:
+                review_id = item.get("review_id")
+                if not review_id or review_id in seen:
+                    continue
+                seen.add(review_id)
+                new += 1
+                yield Review(place_id, **item)
+                if len(seen) >= self.max_reviews:
+                    return
+            if new:
+                self.on_progress()
+            idle_passes = 0 if new else idle_passes + 1
+            # Wakes up as soon as Stop is pressed
+            if self.stop_event.wait(self.pause):
+                return
+
+
+class ReviewSink(BatchSink):
+    """Base class for output sinks that receive harvested reviews"""
+    @staticmethod
+    def open_for(filename):
+        """Open the sink matching the reviews file extension"""
+        if os.path.splitext(filename)[1].lower() in SQLiteLeadSink.EXTENSIONS:
+            return SQLiteReviewSink(filename)
+        return JSONLReviewSink(filename)
+        
+    @staticmethod
+    def filename_for(output_file):
+        """Return the reviews file for a leads output file, the same database or a JSON Lines file beside it"""
+        base, extension = os.path.splitext(output_file)
+        if extension.lower() in SQLiteLeadSink.EXTENSIONS:
+            return output_file
+        return base + "_reviews.jsonl"
+
+
+class JSONLReviewSink(ReviewSink):
+    """Writes reviews to a JSON Lines file, replacing any previous contents"""
+    def __init__(self, filename, batch_size=None):
+        ReviewSink.__init__(self, batch_size)
+        self.file = open(filename, "w", encoding="utf-8")
+        
+    def write_batch(self, reviews):
+        self.file.writelines(json.dumps(review.to_record(), ensure_ascii=False) + "\n" for review in reviews)
+        self.file.flush()
+        
+    def release(self):
+        self.file.close()
+
+
+class DeadLetterSink(BatchSink):
+    """Appends places that kept failing to a JSON Lines file, so they can be inspected or queued again
+    
+    The file is only created once the first record arrives.
+    """
+    def __init__(self, filename):
+        BatchSink.__init__(self, batch_size=1)
+        self.filename = filename
+        self.file = None
+        
+    @staticmethod
+    def filename_for(output_file):
+        """Return the dead-letter file beside a leads output file"""
+        return os.path.splitext(output_file)[0] + "_failed.jsonl"
+        
+    def write_batch(self, records):
+        if self.file is None:
+            self.file = open(self.filename, "a", encoding="utf-8")
+        self.file.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        self.file.flush()
+        
+    def release(self):
+        if self.file is not None:
+            self.file.close()
+
+
+class DeltaTracker:
+    """Compares each scraped place with the previous run of the same search and records what changed
+    
+    The snapshot keeps one short hash per field and place instead of the
+    values, so it stays small however large the runs get. Places are matched
+    on Lead.key() within a search scope. New places and places with a
+    changed field are appended to a JSON Lines file, changed places with only
+    their changed fields. Places the filters left out are touched so they
+    still count as seen. After a complete run, the places of the search that
+    were not seen again are reported as gone and dropped from the snapshot.
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS places (
+            scope TEXT NOT NULL,
+            key TEXT NOT NULL,
+            name TEXT,
+            fingerprint TEXT NOT NULL,
+            run TEXT NOT NULL,
+            PRIMARY KEY (scope, key)
+        )
+    """
+    # Fields compared between runs, the derived fields follow from these
+    FIELDS = Lead.CORE_FIELDS + ("latitude", "longitude")
+    # Compared only when the run visits websites
+    ENRICHED_FIELDS = ("email", "socials")
+    # Leads between snapshot commits
+    COMMIT_EVERY = 100
+    
+    def __init__(self, snapshot_path, delta_path, scope, enriched=False):
+        self.scope = scope
+        self.fields = self.FIELDS + (self.ENRICHED_FIELDS if enriched else ())
+        # Also tells the places seen in this run from the rest
+        self.run = datetime.now().isoformat(timespec='microseconds')
+        self.lock = threading.Lock()
+        self.conn = SQLiteLeadSink.connect(snapshot_path)
+        self.conn.execute(self.SCHEMA)
+        self.delta_path = delta_path
+        self.file = None
+        self.counts = {'new': 0, 'changed': 0, 'unchanged': 0, 'gone': 0}
+        self.uncommitted = 0
+    
+    @staticmethod
+    def filenames_for(output_file):
+        """Return the snapshot database and the delta file beside a leads output file"""
+        base = os.path.splitext(output_file)[0]
+        return base + "_snapshot.db", base + "_delta.jsonl"
+    
+    @staticmethod
+    def scope_for(params):
+        """Return the scope that identifies a search between runs"""
+        if params.get('place_urls'):
+            urls = "\n".join(sorted(params['place_urls']))
+            return "urls:" + hashlib.sha1(urls.encode("utf-8")).hexdigest()[:16]
+        if params.get('method') == "Search by Keywords":
+            return f"search:{params.get('business_type', '').strip().lower()}|{params.get('location', '').strip().lower()}"
+        return "url:" + (params.get('direct_url') or '')
+    
+    @staticmethod
+    def hash_value(value):
+        return hashlib.blake2b(repr(value).encode("utf-8"), digest_size=6).hexdigest()
+    
+    def previous_count(self):
+        """Return the number of places the snapshot holds for this search"""
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM places WHERE scope = ?", (self.scope,)).fetchone()[0]
+    
+    def compare(self, lead):
+        """Compare a lead with the snapshot, returning 'new', 'changed' or None when nothing changed"""
+        key = lead.key()
+        fingerprint = {field: self.hash_value(getattr(lead, field)) for field in self.fields}
+        with self.lock:
+            row = self.conn.execute("SELECT fingerprint FROM places WHERE scope = ? AND key = ?",
+                                    (self.scope, key)).fetchone()
+            previous = json.loads(row[0]) if row else None
+            if previous is None:
+                change, fields = 'new', lead.to_record()
+            else:
+                # Fields the previous run did not collect are not compared
+                changed = [field for field in self.fields if field in previous and previous[field] != fingerprint[field]]
+                change = 'changed' if changed else None
+                fields = {field: getattr(lead, field) for field in changed}
+                fingerprint = dict(previous, **fingerprint)
+            self.conn.execute("INSERT OR REPLACE INTO places (scope, key, name, fingerprint, run) VALUES (?, ?, ?, ?, ?)",
+                              (self.scope, key, lead.name, json.dumps(fingerprint, separators=(",", ":")), self.run))
+            self.counts[change or 'unchanged'] += 1
+            if change:
+                self.write({'change': change, 'key': key, 'name': lead.name, 'fields': fields})
+            self.uncommitted += 1
+            if self.uncommitted >= self.COMMIT_EVERY:
+                self.conn.commit()
+                self.uncommitted = 0
+        return change
+    
+    def touch(self, lead):
+        """Mark a listed place as seen in this run without comparing it"""
+        with self.lock:
+            self.conn.execute("UPDATE places SET run = ? WHERE scope = ? AND key = ?",
+                              (self.run, self.scope, lead.key()))
+            
+    def finish(self, complete):
+        """Report the places not seen in a complete run as gone, and save the snapshot"""
+        with self.lock:
+            if complete:
+                gone = self.conn.execute("SELECT key, name FROM places WHERE scope = ? AND run != ?",
+                                         (self.scope, self.run)).fetchall()
+                for key, name in gone:
+                    self.write({'change': 'gone', 'key': key, 'name': name, 'fields': {}})
+                self.counts['gone'] = len(gone)
+                self.conn.execute("DELETE FROM places WHERE scope = ? AND run != ?", (self.scope, self.run))
+            self.conn.commit()
+            self.uncommitted = 0
+    
+    def write(self, record):
+        if self.file is None:
+            self.file = open(self.delta_path, "a", encoding="utf-8")
+        record = dict(record, run=self.run, scope=self.scope)
+        self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+    
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+            self.conn.commit()
+            self.conn.close()
+
+
+class SQLiteReviewSink(ReviewSink):
+    """Writes reviews to the reviews table of an SQLite database, ignoring reviews already stored"""
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS reviews (
+            place_id TEXT NOT NULL,
+            review_id TEXT NOT NULL,
+            author TEXT,
+            rating REAL,
+            date TEXT,
+            text TEXT,
+            scraped TEXT NOT NULL,
+            PRIMARY KEY (place_id, review_id)
+        );
+    """
+    INSERT = """
+        INSERT OR IGNORE INTO reviews (place_id, review_id, author, rating, date, text, scraped)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    def __init__(self, filename, batch_size=None):
+        ReviewSink.__init__(self, batch_size)
+        self.conn = SQLiteLeadSink.connect(filename)
+        self.conn.executescript(self.SCHEMA)
+        
+    def write_batch(self, reviews):
+        now = datetime.now().isoformat(timespec='seconds')
+        rows = [(review.place_id, review.review_id, review.author, review.rating, review.date, review.text, now)
+                for review in reviews]
+        with self.conn:
+            self.conn.executemany(self.INSERT, rows)
+            
+    def release(self):
+        self.conn.close()
+
+
+class WebsiteEnricher:
+    """Background stage that visits lead websites for emails, social profiles and liveness
+    
+    Requests run on an asyncio loop in a thread of their own, using one
+    aiohttp session with a keep-alive connection pool that is capped overall
+    and per host. The scraper hands leads over with submit() and never waits
+    on a slow website; each lead is passed to the callback exactly once,
+    enriched or not. robots.txt is fetched once per host and results are
+    cached on disk so repeated runs do not visit the same site again.
+    """
+    CACHE_FILE = "enrichment_cache.json"
+    # Days before a cached result is fetched again
+    CACHE_DAYS = 7
+    CONCURRENCY = 16
+    PER_HOST = 2
+    TIMEOUT = 15
+    # Only the start of each page is read, contact details are rarely further down
+    MAX_BODY_BYTES = 512 * 1024
+    USER_AGENT = "Mozilla/5.0 (compatible; GoogleMapsLeadScraper/1.0)"
+    EMAIL_PATTERN = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}')
+    MAILTO_PATTERN = re.compile(r'mailto:([^"\'?\s>]+)', re.IGNORECASE)
+    HREF_PATTERN = re.compile(r'href\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+    SOCIAL_PATTERN = re.compile(
+        r'^https?://(?:www\.|m\.|[a-z]{2}\.)?(facebook|instagram|twitter|x|linkedin|youtube|tiktok)\.com/[^\s]+',
+        re.IGNORECASE)
+    # Share buttons and image names that look like links or addresses but are not contact details
+    SOCIAL_IGNORE = ("sharer", "share?", "intent/", "/plugins/", "/dialog/")
+    EMAIL_IGNORE = (".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", "example.com", "sentry", "wixpress.com")
+    
+    def __init__(self, callback, concurrency=None, per_host=None, timeout=None, cache_path=None, metrics=None):
+        self.callback = callback
+        # Called as metrics(kind, **fields) from the enrichment thread
+        self.metrics = metrics or (lambda kind, **fields: None)
+        self.concurrency = concurrency or self.CONCURRENCY
+        self.per_host = per_host or self.PER_HOST
+        self.timeout = timeout or self.TIMEOUT
+        self.cache_path = cache_path
+        self.cache = self.load_cache()
+        self.robots = {}
+        self.robots_locks = {}
+        self.tasks = set()
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.closed = False
+        self.loop = None
+        self.session = None
+        self.stats = {'checked': 0, 'cached': 0, 'failed': 0, 'emails': 0, 'socials': 0}
+        
+    def start(self):
+        """Start the event loop thread and open the HTTP session, raises ImportError without aiohttp"""
+        import asyncio
+        import aiohttp
+        
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self._open_session(aiohttp), self.loop).result()
+        
+    async def _open_session(self, aiohttp):
+        import asyncio
+        
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.per_host,
+                                         ttl_dns_cache=300, keepalive_timeout=30)
+        self.session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout),
+                                             headers={"User-Agent": self.USER_AGENT})
+        self.client_errors = (aiohttp.ClientError, asyncio.TimeoutError, UnicodeError, LookupError, ValueError)
+        
+    def submit(self, lead):
+        """Queue a lead for enrichment, it is passed to the callback once done"""
+        with self.lock:
+            if not self.closed:
+                self.pending += 1
+                self.loop.call_soon_threadsafe(self._spawn, lead)
+                return
+        # Leads that arrive after close are committed as they are
+        self.callback(lead)
+        
+    def _spawn(self, lead):
+        task = self.loop.create_task(self._enrich_and_commit(lead))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        
+    async def _enrich_and_commit(self, lead):
+        try:
+            await self.enrich(lead)
+        except Exception:
+            self.stats['failed'] += 1
+        finally:
+            # Runs on cancellation too, so a lead is never lost
+            with self.lock:
+                self.pending -= 1
+            self.callback(lead)
+            
+    def close(self, timeout=None):
+        """Wait up to timeout seconds for queued leads, commit the rest unenriched and stop the loop"""
+        import asyncio
+        
+        with self.lock:
+            if self.closed or self.loop is None:
+                self.closed = True
+                return
+            self.closed = True
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(timeout), self.loop).result()
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+            self.loop.close()
+            self.save_cache()
+            
+    async def _shutdown(self, timeout):
+        import asyncio
+        
+        tasks = list(self.tasks)
+        if tasks:
+            done, unfinished = await asyncio.wait(tasks, timeout=timeout)
+            for task in unfinished:
+                task.cancel()
+            await asyncio.gather(*unfinished, return_exceptions=True)
+        await self.session.close()
+        
+    async def enrich(self, lead):
+        """Fill in the email, socials and HTTP status of a lead from its website"""
+        url = self.normalize_url(lead.website)
+        if not url:
+            return
+        cached = self.cache.get(url)
+        if cached and time.time() - cached.get('time', 0) < self.CACHE_DAYS * 86400:
+            self.stats['cached'] += 1
+            self.metrics('cache', hit=True)
+        else:
+            self.metrics('cache', hit=False)
+            started = time.perf_counter()
+            cached = await self.fetch_site(url)
+            self.metrics('phase', phase='website', seconds=time.perf_counter() - started)
+            cached['time'] = time.time()
+            # Unreachable sites are tried again on the next run
+            if cached['http_status'] == 0:
+                self.stats['failed'] += 1
+                self.metrics('error', phase='website')
+            else:
+                self.cache[url] = cached
+                self.stats['checked'] += 1
+        lead.email = cached.get('email')
+        lead.socials = cached.get('socials')
+        lead.http_status = cached.get('http_status')
+        self.stats['emails'] += bool(lead.email)
+        self.stats['socials'] += bool(lead.socials)
+        
+    async def fetch_site(self, url):
+        """Fetch the home page, and a contact page if it has no email, and extract contact details"""
+        if not await self.allowed(url):
+            return {'http_status': None, 'email': None, 'socials': None}
+        status, final_url, html = await self.fetch(url)
+        emails, socials = self.extract_contacts(html, final_url)
+        if status and status < 400 and not emails:
+            contact_url = self.find_contact_link(html, final_url)
+            if contact_url and await self.allowed(contact_url):
+                contact_status, contact_final_url, contact_html = await self.fetch(contact_url)
+                if contact_status and contact_status < 400:
+                    more_emails, more_socials = self.extract_contacts(contact_html, contact_final_url)
+                    emails += more_emails
+                    socials += [link for link in more_socials if link not in socials]
+        return {
+            'http_status': status,
+            'email': emails[0] if emails else None,
+            'socials': "; ".join(socials) or None,
+        }
+        
+    async def fetch(self, url):
+        """Return the status, final URL and text of a page, status 0 if it could not be reached"""
+        try:
+            async with self.session.get(url, allow_redirects=True, max_redirects=5) as response:
+                body = await response.content.read(self.MAX_BODY_BYTES)
+                return response.status, str(response.url), body.decode(response.charset or "utf-8", errors="replace")
+        except self.client_errors:
+            return 0, url, ""
+            
+    async def allowed(self, url):
+        """Check robots.txt for a URL, fetching it once per host"""
+        import asyncio
+        from urllib import robotparser
+        from urllib.parse import urlsplit
+        
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        if origin not in self.robots:
+            lock = self.robots_locks.setdefault(origin, asyncio.Lock())
+            async with lock:
+                if origin not in self.robots:
+                    parser = robotparser.RobotFileParser()
+                    status, _, text = await self.fetch(origin + "/robots.txt")
+                    if status in (401, 403):
+                        parser.disallow_all = True
+                    elif 200 <= status < 300:
+                        parser.parse(text.splitlines())
+                    else:
+                        parser.allow_all = True
+                    self.robots[origin] = parser
+        return self.robots[origin].can_fetch(self.USER_AGENT, url)
+        
+    @staticmethod
+    def normalize_url(website):
+        """Return an absolute http(s) URL for a website, unwrapping Google redirect links"""
+        from urllib.parse import urlsplit, parse_qs
+        
+        if not website:
+            return None
+        website = website.strip()
+        parts = urlsplit(website)
+        if parts.path == "/url" and "google." in parts.netloc:
+            website = (parse_qs(parts.query).get("q") or [""])[0]
+        if not website.startswith(("http://", "https://")):
+            website = "http://" + website
+        return website
+        
+    @classmethod
+    def extract_contacts(cls, html, base_url):
+        """Return the email addresses and social profile links found in a page"""
+        from urllib.parse import unquote
+        
+        emails = []
+        candidates = [unquote(address) for address in cls.MAILTO_PATTERN.findall(html)]
+        candidates += cls.EMAIL_PATTERN.findall(html)
+        for address in candidates:
+            address = address.strip().lower()
+            if cls.EMAIL_PATTERN.fullmatch(address) and address not in emails and \
+                    not any(marker in address for marker in cls.EMAIL_IGNORE):
+                emails.append(address)
+                
+        # Keep the first profile per network
+        socials = {}
+        for link in cls.HREF_PATTERN.findall(html):
+            match = cls.SOCIAL_PATTERN.match(link)
+            if match and not any(marker in link.lower() for marker in cls.SOCIAL_IGNORE):
+                socials.setdefault(match.group(1).lower(), link)
+        return emails, list(socials.values())
+        
+    @classmethod
+    def find_contact_link(cls, html, base_url):
+        """Return the first link to a contact page on the same host, if any"""
+        from urllib.parse import urljoin, urlsplit
+        
+        host = urlsplit(base_url).netloc
+        for link in cls.HREF_PATTERN.findall(html):
+            if "contact" in link.lower() and not link.lower().startswith("mailto:"):
+                url = urljoin(base_url, link)
+                if urlsplit(url).netloc == host:
+                    return url
+        return None
+        
+    def load_cache(self):
+        """Load cached results, dropping expired entries"""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        cutoff = time.time() - self.CACHE_DAYS * 86400
+        return {url: entry for url, entry in cache.items() if entry.get('time', 0) >= cutoff}
+        
+    def save_cache(self):
+        """Write the result cache atomically"""
+        if not self.cache_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            temp_path = self.cache_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self.cache, f)
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            pass
+
+
+class PlaceFetcher:
+    """Reads place pages over plain HTTP instead of through the browser
+    
+    A place page embeds its data as JSON in window.APP_INITIALIZATION_STATE.
+    The pages are fetched with one pooled aiohttp session over many concurrent
+    connections and the JSON is read into the same fields the browser
+    scrape produces. The positions of the fields in that JSON are not
+    documented, so they live in the place_json section of selectors.json.
+    URLs whose page cannot be fetched or parsed are returned to the caller
+    for the browser to visit. A request that is slower than most gets a
+    hedged duplicate, and whichever answers first is used.
+    """
+    CONCURRENCY = 16
+    TIMEOUT = 20
+    # Seconds before a duplicate request is sent, until enough latencies are known
+    HEDGE_AFTER = 4
+    # Latency percentile past which a request is hedged, and the samples needed to use it
+    HEDGE_PERCENTILE = 0.9
+    HEDGE_MIN_SAMPLES = 20
+    STATE_MARKER = "window.APP_INITIALIZATION_STATE="
+    # Prefix Google puts in front of JSON responses to stop them being run as scripts
+    JSON_PREFIX = ")]}'"
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+                      "Chrome/124.0 Safari/537.36",
+        "Accept-Language": "en-US,en;q=0.9",
+        # Skips the cookie consent interstitial served to EU visitors
+        "Cookie": "CONSENT=YES+",
+    }
+    
+    def __init__(self, paths, concurrency=None, timeout=None, stop_event=None, metrics=None):
+        self.paths = paths
+        self.concurrency = concurrency or self.CONCURRENCY
+        self.timeout = timeout or self.TIMEOUT
+        self.stop_event = stop_event or threading.Event()
+        self.metrics = metrics or (lambda kind, **fields: None)
+        self.latencies = deque(maxlen=200)
+        
+    def fetch(self, urls, callback):
+        """Fetch and parse the place pages, calling callback(url, lead) for each one
+        
+        Blocks until every page has been handled and returns the URLs that
+        could not be read. Raises ImportError when aiohttp is not installed.
+        """
+        import aiohttp  # noqa: F401 - fail early rather than inside the loop
+        import asyncio
+        return asyncio.run(self.fetch_all(urls, callback))
+        
+    async def fetch_all(self, urls, callback):
+        import aiohttp
+        import asyncio
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.concurrency)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        failed = []
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=self.HEADERS) as session:
+            tasks = [asyncio.ensure_future(self.fetch_one(session, url)) for url in urls]
+            try:
+                for task in asyncio.as_completed(tasks):
+                    url, lead = await task
+                    if lead is None:
+                        failed.append(url)
+                    else:
+                        callback(url, lead)
+                    if self.stop_event.is_set():
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
+        return failed
+        
+    async def fetch_one(self, session, url):
+        import asyncio
+        started = time.perf_counter()
+        tasks = {asyncio.ensure_future(self.get_page(session, url))}
+        done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay())
+        if not done:
+            self.metrics('retry', phase='hedge')
+            tasks.add(asyncio.ensure_future(self.get_page(session, url)))
+        html = None
+        try:
+            while tasks and html is None:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                html = next((task.result() for task in done if task.result() is not None), None)
+        finally:
+            for task in tasks:
+                task.cancel()
+        seconds = time.perf_counter() - started
+        if html is not None:
+            self.latencies.append(seconds)
+        self.metrics('phase', phase='http', seconds=seconds)
+        lead = self.parse_place_page(html, url) if html is not None else None
+        if lead is None:
+            self.metrics('error', phase='http')
+        return url, lead
+        
+    async def get_page(self, session, url):
+        """Return the page HTML, or None when it could not be fetched"""
+        try:
+            async with session.get(url) as response:
+                return await response.text(errors="replace") if response.status == 200 else None
+        except Exception:
+            # Timeouts and client errors, the browser gets another try
+            return None
+            
+    def hedge_delay(self):
+        """Return the seconds after which a request is duplicated"""
+        if len(self.latencies) < self.HEDGE_MIN_SAMPLES:
+            return self.HEDGE_AFTER
+        ordered = sorted(self.latencies)
+        return max(0.5, ordered[int(len(ordered) * self.HEDGE_PERCENTILE)])
+        
+    def parse_place_page(self, html, url=None):
+        """Return a Lead from the JSON embedded in a place page, or None if it cannot be read"""
+        place = self.place_data(html)
+        if place is None:
+            return None
+        fields = {field: self.first(place, field) for field in
+                  ("name", "address", "phone", "website", "rating", "reviews", "categories",
+                   "latitude", "longitude", "place_id", "feature_id")}
+        if not isinstance(fields["name"], str) or not fields["name"]:
+            return None
+        address = fields["address"]
+        if isinstance(address, list):
+            address = ", ".join(part for part in address if isinstance(part, str))
+        # The fallback address field starts with the business name
+        if isinstance(address, str) and address.startswith(fields["name"] + ", "):
+            address = address[len(fields["name"]) + 2:]
+        categories = fields["categories"]
+        if isinstance(categories, list):
+            categories = ", ".join(category for category in categories if isinstance(category, str))
+        # Coordinates, CID and IDs in the URL are used when the JSON lacks them
+        from_url = Lead.fields_from_url(url)
+        feature_id = fields["feature_id"] if isinstance(fields["feature_id"], str) else None
+        feature_id = feature_id.lower() if feature_id else from_url.get("feature_id")
+        cid = Lead.cid_from_feature_id(feature_id) if feature_id else None
+        latitude, longitude = fields["latitude"], fields["longitude"]
+        if not isinstance(latitude, (int, float)) or not isinstance(longitude, (int, float)):
+            latitude, longitude = from_url.get("latitude"), from_url.get("longitude")
+        return Lead(name=fields["name"], address=self.text(address), phone=self.text(fields["phone"]),
+                    website=self.text(fields["website"]), rating=fields["rating"], reviews=fields["reviews"],
+                    categories=self.text(categories), latitude=latitude, longitude=longitude,
+                    cid=cid or from_url.get("cid"), feature_id=feature_id,
+                    place_id=self.text(fields["place_id"]) or from_url.get("place_id"))
+                    
+    def place_data(self, html):
+        """Return the place array from APP_INITIALIZATION_STATE, or None"""
+        start = html.find(self.STATE_MARKER)
+        if start < 0:
+            return None
+        try:
+            state, _ = json.JSONDecoder().raw_decode(html, start + len(self.STATE_MARKER))
+        except ValueError:
+            return None
+        for path in self.paths.get("state", []):
+            payload = self.lookup(state, path)
+            if not isinstance(payload, str):
+                continue
+            if payload.startswith(self.JSON_PREFIX):
+                payload = payload[len(self.JSON_PREFIX):]
+            try:
+                data = json.loads(payload)
+            except ValueError:
+                continue
+            for place_path in self.paths.get("place", [[]]):
+                place = self.lookup(data, place_path)
+                if isinstance(place, list):
+                    return place
+        return None
+        
+    def first(self, place, field):
+        """Return the value at the first path configured for the field that holds one"""
+        for path in self.paths.get(field, []):
+            value = self.lookup(place, path)
+            if value not in (None, "", []):
+                return value
+        return None
+        
+    @staticmethod
+    def lookup(data, path):
+        """Follow a list of indexes into nested lists, returning None when one is missing"""
+        for index in path:
+            if not isinstance(data, list) or not -len(data) <= index < len(data):
+                return None
+            data = data[index]
+        return data
+        
+    @staticmethod
+    def text(value):
+        return value if isinstance(value, str) and value else None
+
+
+class AppConfig:
+    """Persistent JSON configuration for settings, search presets and cached browser discovery
+    
+    Discovered Chrome and ChromeDriver paths are cached together with the
+    file's mtime and reported version. A cached entry is trusted as long as
+    the file still exists with the same mtime, so the slow platform probes
+    only run again after an install or upgrade.
+    """
+    VERSION = 1
+    APP_NAME = "GoogleMapsScraper"
+    
+    def __init__(self, path=None):
+        self.path = path or os.path.join(self.default_dir(), "config.json")
+        self.lock = threading.Lock()
+        self.data = self.load()
+        
+    @classmethod
+    def default_dir(cls):
+        """Return the per-user configuration directory for the application"""
+        system = platform.system()
+        if system == "Windows":
+            base = os.environ.get("APPDATA", os.path.expanduser("~"))
+        elif system == "Darwin":
+            base = os.path.expanduser("~/Library/Application Support")
+        else:
+            base = os.environ.get("XDG_CONFIG_HOME", os.path.expanduser("~/.config"))
+        return os.path.join(base, cls.APP_NAME)
+        
+    @property
+    def directory(self):
+        """Directory holding the configuration file and other per-user state"""
+        return os.path.dirname(self.path)
+        
+    def load(self):
+        """Load the configuration file, falling back to defaults if it is missing or unreadable"""
+        data = {"version": self.VERSION, "settings": {}, "presets": {}, "discovery": {}}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            if isinstance(stored, dict) and stored.get("version") == self.VERSION:
+                for section in ("settings", "presets", "discovery"):
+                    if isinstance(stored.get(section), dict):
+                        data[section] = stored[section]
+        except (OSError, ValueError):
+            pass
+        return data
+        
+    def save(self):
+        """Write the configuration atomically"""
+        with self.lock:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                temp_path = self.path + ".tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(self.data, f, indent=2)
+                os.replace(temp_path, self.path)
+            except OSError:
+                pass
+                
+    def get(self, name, default=None):
+        """Get a saved setting"""
+        return self.data["settings"].get(name, default)
+        
+    def update(self, settings):
+        """Update saved settings and write them to disk"""
+        with self.lock:
+            self.data["settings"].update(settings)
+        self.save()
+        
+    def presets(self):
+        """Return the saved search presets by name"""
+        return self.data["presets"]
+        
+    def save_preset(self, name, params):
+        """Save a named search preset"""
+        with self.lock:
+            self.data["presets"][name] = params
+        self.save()
+        
+    def delete_preset(self, name):
+        """Delete a named search preset"""
+        with self.lock:
+            self.data["presets"].pop(name, None)
+        self.save()
+        
+    def cached_discovery(self, kind):
+        """Return the cached discovery entry if the file is unchanged, otherwise None"""
+        entry = self.data["discovery"].get(kind)
+        if not entry:
+            return None
+        try:
+            if os.path.getmtime(entry["path"]) == entry["mtime"]:
+                return entry
+        except (OSError, KeyError):
+            pass
+        return None
+        
+    def cache_discovery(self, kind, path):
+        """Cache a discovered executable with its mtime and version"""
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return
+        with self.lock:
+            self.data["discovery"][kind] = {"path": path, "mtime": mtime, "version": self.executable_version(path)}
+        self.save()
+        
+    @staticmethod
+    def executable_version(path):
+        """Ask an executable for its version string"""
+        # chrome.exe does not print a version on Windows and would open a window instead
+        if platform.system() == "Windows" and os.path.basename(path).lower() == "chrome.exe":
+            return None
+        try:
+            result = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10)
+            return result.stdout.strip() or None
+        except (OSError, subprocess.SubprocessError):
+            return None
+
+
+class BrowserLocator:
+    """Finds the Chrome and ChromeDriver executables, caching results in the app config"""
+    def __init__(self, config):
+        self.config = config
+        
+    def get_chromedriver_path(self, custom_path=None):
+        """Get the path to chromedriver executable"""
+        # Check if user specified a custom path
+        if custom_path and os.path.exists(custom_path):
+            return custom_path
+            
+        # Reuse the last discovered driver while it is unchanged on disk
+        cached = self.config.cached_discovery('chromedriver')
+        if cached:
+            return cached['path']
+            
+        driver_path = self.probe_chromedriver_path()
+        if driver_path:
+            self.config.cache_discovery('chromedriver', driver_path)
+        return driver_path
+        
+    def probe_chromedriver_path(self):
+        """Look for a chromedriver executable bundled with the application"""
+        # Otherwise use bundled or system path
+        application_path = application_dir()
+        driver_name = "chromedriver.exe" if platform.system() == "Windows" else "chromedriver"
+        driver_path = os.path.join(application_path, driver_name)
+        
+        # Check if driver exists at the expected path
+        if not os.path.exists(driver_path):
+            return None
+            
+        return driver_path
+    
+    def find_chrome_binary(self, custom_path=None):
+        """Find Chrome binary across different systems"""
+        # Check if user specified a custom path
+        if custom_path and os.path.exists(custom_path):
+            return custom_path
+            
+        # Reuse the last discovered binary while it is unchanged on disk
+        cached = self.config.cached_discovery('chrome')
+        if cached:
+            return cached['path']
+            
+        chrome_path = self.probe_chrome_binary()
+        if chrome_path:
+            self.config.cache_discovery('chrome', chrome_path)
+        return chrome_path
+        
+    def probe_chrome_binary(self):
+        """Search the system for a Chrome binary, this can be slow"""
+        system = platform.system()
+        chrome_path = None
+        
+        if system == "Windows":
+            # Method 1: Registry lookup
+            try:
+                import winreg
+                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
+                                   r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths\chrome.exe") as key:
+                    chrome_path, _ = winreg.QueryValueEx(key, "")
+                    if os.path.exists(chrome_path):
+                        return chrome_path
+            except:
+                pass
+                
+            # Method 2: Common installation paths
+            paths = [
+                os.path.join(os.environ.get('PROGRAMFILES', 'C:\\Program Files'), 'Google\\Chrome\\Application\\chrome.exe'),
+                os.path.join(os.environ.get('PROGRAMFILES(X86)', 'C:\\Program Files (x86)'), 'Google\\Chrome\\Application\\chrome.exe'),
+                # Add additional common paths
+                "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe",
+                "C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe"
+            ]
+            
+            # Method 3: Check for Chrome Enterprise paths
+            program_dirs = [os.environ.get('PROGRAMFILES', 'C:\\Program Files'), 
+                           os.environ.get('PROGRAMFILES(X86)', 'C:\\Program Files (x86)')]
+            for program_dir in program_dirs:
+                if os.path.exists(program_dir):
+                    for root, dirs, files in os.walk(program_dir):
+                        if 'chrome.exe' in files and 'Google' in root:
+                            chrome_path = os.path.join(root, 'chrome.exe')
+                            return chrome_path
+            
+        elif system == "Darwin":  # macOS
+            paths = [
+                "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+                "/Applications/Chrome.app/Contents/MacOS/Chrome",
+                # Add user-specific paths
+                os.path.expanduser("~/Applications/Google Chrome.app/Contents/MacOS/Google Chrome")
+            ]
+            
+            # Try to find Chrome using 'mdfind' command
+            try:
+                mdfind_process = subprocess.Popen(
+                    ["mdfind", "kMDItemDisplayName == 'Google Chrome' && kMDItemKind == 'Application'"],
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+                )
+                mdfind_output, _ = mdfind_process.communicate()
+                
+                if mdfind_output.strip():
+                    chrome_path = os.path.join(mdfind_output.split('\n')[0], 
+                                             "Contents/MacOS/Google Chrome")
+                    if os.path.exists(chrome_path):
+                        return chrome_path
+            except:
+                pass
+                
+        elif system == "Linux":
+            paths = [
+                "/usr/bin/google-chrome",
+                "/usr/bin/chrome",
+                "/usr/bin/chromium",
+                "/usr/bin/chromium-browser",
+                "/snap/bin/chromium",
+                # Add user-specific paths
+                os.path.expanduser("~/.local/bin/chrome")
+            ]
+            
+            # Try using 'which' command
+            try:
+                which_process = subprocess.Popen(
+                    ["which", "google-chrome", "chromium", "chromium-browser"],
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+                )
+                which_output, _ = which_process.communicate()
+                
+                if which_output.strip():
+                    chrome_path = which_output.split('\n')[0]
+                    if os.path.exists(chrome_path):
+                        return chrome_path
+            except:
+                pass
+        
+        # Check all potential paths
+        for path in paths:
+            if os.path.exists(path):
+                return path
+                
+        return None
+
+
+class WorkQueue:
+    """Lease-based job queue stored in an SQLite file
+    
+    Workers claim a job together with a lease and renew it with heartbeats
+    while they work on it. When a lease expires, for example because the
+    worker died, the job goes back to pending for the next worker. A job that
+    has been attempted MAX_ATTEMPTS times is marked failed instead.
+    """
+    LEASE_SECONDS = 120
+    MAX_ATTEMPTS = 3
+    # Number of place URLs handed out per 'places' job
+    PLACE_BATCH_SIZE = 25
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            owner TEXT,
+            lease_expires REAL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            error TEXT,
+            updated REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, lease_expires);
+    """
+    
+    def __init__(self, filename):
+        self.filename = filename
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(filename, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA busy_timeout=30000")
+        self.conn.executescript(self.SCHEMA)
+        
+    def _transaction(self, operation):
+        """Run an operation inside an immediate transaction"""
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = operation()
+                self.conn.execute("COMMIT")
+                return result
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+                
+    def enqueue(self, kind, payload):
+        """Add a job to the queue and return its ID"""
+        def insert():
+            cursor = self.conn.execute("INSERT INTO jobs (kind, payload, updated) VALUES (?, ?, ?)",
+                                       (kind, json.dumps(payload), time.time()))
+            return cursor.lastrowid
+        return self._transaction(insert)
+        
+    def enqueue_jobs_file(self, filename):
+        """Enqueue the jobs listed in a text file and return how many were added
+        
+        Each line is either 'business type | location', a Google Maps search
+        URL, or a place URL. Place URLs are grouped into batches.
+        """
+        count = 0
+        places = []
+        with open(filename, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if "/maps/place/" in line:
+                    places.append(line)
+                    if len(places) >= self.PLACE_BATCH_SIZE:
+                        self.enqueue("places", {"place_urls": places})
+                        places = []
+                        count += 1
+                elif line.startswith("http"):
+                    self.enqueue("search", {"method": "Use Direct URL", "direct_url": line})
+                    count += 1
+                elif "|" in line:
+                    business_type, location = [part.strip() for part in line.split("|", 1)]
+                    self.enqueue("search", {"method": "Search by Keywords", "business_type": business_type,
+                                            "location": location})
+                    count += 1
+        if places:
+            self.enqueue("places", {"place_urls": places})
+            count += 1
+        return count
+        
+    def _requeue_expired(self, now):
+        self.conn.execute(
+            "UPDATE jobs SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "owner = NULL, error = 'lease expired', updated = ? "
+            "WHERE status = 'leased' AND lease_expires < ?", (self.MAX_ATTEMPTS, now, now))
+            
+    def requeue_expired(self):
+        """Return jobs with expired leases to the queue"""
+        self._transaction(lambda: self._requeue_expired(time.time()))
+        
+    def claim(self, worker_id, lease_seconds=None):
+        """Lease the next pending job to a worker, or return None if there is none"""
+        lease_seconds = lease_seconds or self.LEASE_SECONDS
+        
+        def lease():
+            now = time.time()
+            self._requeue_expired(now)
+            row = self.conn.execute("SELECT id, kind, payload FROM jobs WHERE status = 'pending' "
+                                    "ORDER BY id LIMIT 1").fetchone()
+            if not row:
+                return None
+            self.conn.execute("UPDATE jobs SET status = 'leased', owner = ?, lease_expires = ?, "
+                              "attempts = attempts + 1, updated = ? WHERE id = ?",
+                              (worker_id, now + lease_seconds, now, row[0]))
+            return {"id": row[0], "kind": row[1], "payload": json.loads(row[2])}
+        return self._transaction(lease)
+        
+    def heartbeat(self, job_id, worker_id, lease_seconds=None):
+        """Extend a lease, returning False if the worker no longer holds it"""
+        lease_seconds = lease_seconds or self.LEASE_SECONDS
+        now = time.time()
+        return self._transaction(lambda: self.conn.execute(
+            "UPDATE jobs SET lease_expires = ?, updated = ? WHERE id = ? AND owner = ? AND status = 'leased'",
+            (now + lease_seconds, now, job_id, worker_id)).rowcount == 1)
+            
+    def complete(self, job_id, worker_id):
+        """Mark a leased job as done"""
+        return self._transaction(lambda: self.conn.execute(
+            "UPDATE jobs SET status = 'done', lease_expires = NULL, updated = ? "
+            "WHERE id = ? AND owner = ? AND status = 'leased'", (time.time(), job_id, worker_id)).rowcount == 1)
+            
+    def fail(self, job_id, worker_id, error):
+        """Give a leased job back, marking it failed once it has used all attempts"""
+        return self._transaction(lambda: self.conn.execute(
+            "UPDATE jobs SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "owner = NULL, lease_expires = NULL, error = ?, updated = ? "
+            "WHERE id = ? AND owner = ? AND status = 'leased'",
+            (self.MAX_ATTEMPTS, str(error), time.time(), job_id, worker_id)).rowcount == 1)
+            
+    def stats(self):
+        """Return the number of jobs per status"""
+        with self.lock:
+            rows = self.conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return dict(rows)
+        
+    def has_open_jobs(self):
+        """Check whether any job is still pending or leased"""
+        stats = self.stats()
+        return stats.get("pending", 0) + stats.get("leased", 0) > 0
+
+
+class WorkQueueRequestHandler(socketserver.StreamRequestHandler):
+    """Handles JSON line requests from remote workers"""
+    OPERATIONS = ("claim", "heartbeat", "complete", "fail", "enqueue", "stats", "has_open_jobs")
+    
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                if self.server.token and request.get("token") != self.server.token:
+                    raise PermissionError("Invalid token")
+                operation = request.get("op")
+                args = request.get("args", {})
+                if operation == "submit":
+                    # Leads from all workers are merged into the coordinator's sink
+                    for record in args["leads"]:
+                        self.server.sink.write(Lead.from_record(record))
+                    self.server.sink.flush()
+                    result = len(args["leads"])
+                elif operation in self.OPERATIONS:
+                    result = getattr(self.server.work_queue, operation)(**args)
+                else:
+                    raise ValueError(f"Unknown operation: {operation}")
+                response = {"ok": True, "result": result}
+            except Exception as e:
+                response = {"ok": False, "error": str(e)}
+            self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+
+class WorkQueueServer(socketserver.ThreadingTCPServer):
+    """Small TCP front end so worker nodes on other machines can share a WorkQueue
+    
+    The protocol is one JSON object per line in each direction. Workers call
+    the queue methods remotely and submit the leads they scrape, which are
+    written to a single merged sink on the coordinator.
+    """
+    allow_reuse_address = True
+    daemon_threads = True
+    
+    def __init__(self, address, work_queue, sink, token=None):
+        socketserver.ThreadingTCPServer.__init__(self, address, WorkQueueRequestHandler)
+        self.work_queue = work_queue
+        self.sink = sink
+        self.token = token
+
+
+class RemoteWorkQueue:
+    """Client for a WorkQueueServer with the same interface as WorkQueue"""
+    def __init__(self, address, token=None):
+        host, port = address.replace("tcp://", "").rsplit(":", 1)
+        self.address = (host, int(port))
+        self.token = token
+        self.lock = threading.Lock()
+        self.connection = None
+        
+    def _call(self, operation, **args):
+        request = (json.dumps({"op": operation, "args": args, "token": self.token}) + "\n").encode("utf-8")
+        with self.lock:
+            for attempt in range(2):
+                try:
+                    if self.connection is None:
+                        sock = socket.create_connection(self.address, timeout=60)
+                        self.connection = (sock, sock.makefile("rb"))
+                    sock, reader = self.connection
+                    sock.sendall(request)
+                    line = reader.readline()
+                    if not line:
+                        raise ConnectionError("Coordinator closed the connection")
+                    break
+                except OSError:
+                    # Reconnect once, the coordinator may have restarted
+                    self.close()
+                    if attempt:
+                        raise
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise RuntimeError(response.get("error"))
+        return response.get("result")
+        
+    def claim(self, worker_id, lease_seconds=None):
+        return self._call("claim", worker_id=worker_id, lease_seconds=lease_seconds)
+        
+    def heartbeat(self, job_id, worker_id, lease_seconds=None):
+        return self._call("heartbeat", job_id=job_id, worker_id=worker_id, lease_seconds=lease_seconds)
+        
+    def complete(self, job_id, worker_id):
+        return self._call("complete", job_id=job_id, worker_id=worker_id)
+        
+    def fail(self, job_id, worker_id, error):
+        return self._call("fail", job_id=job_id, worker_id=worker_id, error=error)
+        
+    def enqueue(self, kind, payload):
+        return self._call("enqueue", kind=kind, payload=payload)
+        
+    def stats(self):
+        return self._call("stats")
+        
+    def has_open_jobs(self):
+        return self._call("has_open_jobs")
+        
+    def submit(self, leads):
+        """Send scraped leads to the coordinator's merged store"""
+        return self._call("submit", leads=[lead.to_record() for lead in leads])
+        
+    def close(self):
+        if self.connection:
+            try:
+                self.connection[1].close()
+                self.connection[0].close()
+            except OSError:
+                pass
+            self.connection = None
+
+
+class RemoteLeadSink(LeadSink):
+    """Sends leads to a coordinator in batches"""
+    def __init__(self, remote, batch_size=None):
+        LeadSink.__init__(self, batch_size)
+        self.remote = remote
+        
+    def write_batch(self, leads):
+        self.remote.submit(leads)
+
+
+class QueueWorker:
+    """Headless worker that claims jobs from a work queue and scrapes them one at a time"""
+    # Seconds to wait before asking again when the queue is momentarily empty
+    IDLE_WAIT = 5
+    
+    def __init__(self, work_queue, params, worker_id=None, lease_seconds=None):
+        self.work_queue = work_queue
+        self.params = params
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.lease_seconds = lease_seconds or WorkQueue.LEASE_SECONDS
+        self.locator = BrowserLocator(AppConfig())
+        
+    def log(self, message):
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] [{self.worker_id}] {message}", flush=True)
+        
+    def run(self):
+        """Process jobs until the queue has no pending or leased jobs left"""
+        while True:
+            job = self.work_queue.claim(self.worker_id, self.lease_seconds)
+            if job:
+                self.run_job(job)
+            elif self.work_queue.has_open_jobs():
+                time.sleep(self.IDLE_WAIT)
+            else:
+                self.log("No jobs left, exiting.")
+                return
+                
+    def run_job(self, job):
+        """Scrape a single job while keeping its lease alive"""
+        self.log(f"Claimed job {job['id']} ({job['kind']})")
+        params = dict(self.params)
+        params.update(job["payload"])
+        # Places that keep failing here are handed to another worker once, then dead-lettered
+        params['handoff_failed'] = not job["payload"].get("handed_off")
+        sink = RemoteLeadSink(self.work_queue) if isinstance(self.work_queue, RemoteWorkQueue) else None
+        
+        thread = ScraperThread(self.locator, params, sink=sink)
+        thread.start()
+        errors = []
+        failed_places = []
+        last_heartbeat = time.time()
+        while thread.is_alive() or not thread.queue.empty():
+            try:
+                message_type, message = thread.queue.get(timeout=1)
+                if message_type == 'status':
+                    self.log(message)
+                elif message_type == 'error':
+                    errors.append(message)
+                elif message_type == 'dead':
+                    failed_places.append(message['url'])
+            except queue.Empty:
+                pass
                 
-        # If all selectors fail, try a more generic approach
-        if "h1" in str(selectors):
-            h1_elements = driver.find_elements(By.TAG_NAME, "h1")
-            if h1_elements:
-                for h1 in h1_elements:
-                    if h1.text.strip():
-                        return h1.text.strip()
-        
-        return "N/A"
-    
-    def extract_element_attribute(self, driver, selectors, attribute):
-        """Extract an attribute from an element using multiple selectors with fallbacks"""
-        for by, selector in selectors:
-            try:
-                element = driver.find_element(by, selector)
-                if element:
-                    attr_value = element.get_attribute(attribute)
-                    if attr_value:
-                        return attr_value
-            except:
-                continue
+            # Renew the lease well before it runs out
+            if time.time() - last_heartbeat > self.lease_seconds / 3:
+                last_heartbeat = time.time()
+                if not self.work_queue.heartbeat(job["id"], self.worker_id, self.lease_seconds):
+                    self.log(f"Lost the lease on job {job['id']}, stopping it.")
+                    thread.stop()
+                    
+        if failed_places:
+            self.work_queue.enqueue("places", {"place_urls": failed_places, "handed_off": True})
+            self.log(f"Queued {len(failed_places)} failed places for another worker.")
+        if errors:
+            self.work_queue.fail(job["id"], self.worker_id, "; ".join(errors))
+            self.log(f"Job {job['id']} failed: {errors[-1]}")
+        else:
+            self.work_queue.complete(job["id"], self.worker_id)
+            self.log(f"Job {job['id']} done.")
+
+
+class StatusLog:
+    """Bounded ring buffer of status lines that spills evicted lines to disk"""
+    def __init__(self, max_lines=500, spill_path=None):
+        self.lines = deque(maxlen=max_lines)
+        self.spill_path = spill_path or os.path.join(tempfile.gettempdir(), "google_maps_scraper_status.log")
+        self._spill_file = None
         
-        return "N/A"
+    def append(self, lines):
+        """Append lines, writing any that fall out of the buffer to the spill file"""
+        overflow = len(self.lines) + len(lines) - self.lines.maxlen
+        if overflow > 0:
+            evicted = list(self.lines)[:overflow] if overflow <= len(self.lines) else list(self.lines)
+            # Lines that would be evicted straight away never enter the buffer
+            evicted.extend(lines[:max(0, overflow - len(self.lines))])
+            self._spill(evicted)
+        self.lines.extend(lines)
+        
+    def _spill(self, lines):
+        """Write evicted lines to the spill file"""
+        try:
+            if self._spill_file is None:
+                self._spill_file = open(self.spill_path, "a", encoding="utf-8")
+            self._spill_file.write("\n".join(lines) + "\n")
+            self._spill_file.flush()
+        except OSError:
+            pass
+            
+    def clear(self):
+        """Clear the buffer and truncate the spill file for a new run"""
+        self.lines.clear()
+        try:
+            if self._spill_file is not None:
+                self._spill_file.close()
+            self._spill_file = open(self.spill_path, "w", encoding="utf-8")
+        except OSError:
+            self._spill_file = None
+
+
+class RunMetrics:
+    """Aggregates the structured metric events of a run for the dashboard
     
-    def stop(self):
-        """Stop the scraping thread"""
-        self.stop_event.set()
+    The scraper thread sends ('metric', event) messages where event is a dict
+    with a kind and a time: 'lead', 'skip', 'target', 'phase' (with a phase
+    name and seconds), 'error', 'retry', 'cache' (hit or miss) and 'browser'
+    (a browser name and its state). Rates are computed over a rolling window.
+    """
+    # Seconds of history used for the rolling rates
+    WINDOW = 120
+    # Latency samples kept per phase for the sparklines
+    SPARK_POINTS = 60
+    
+    def __init__(self):
+        self.started = time.time()
+        self.target = None
+        self.leads = 0
+        self.skipped = 0
+        self.errors = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.cache_lookups = 0
+        self.lead_times = deque()
+        self.latency = {}
+        self.browsers = {}
+        
+    def record(self, event):
+        """Apply one metric event"""
+        kind = event.get('kind')
+        when = event.get('time', time.time())
+        if kind == 'lead':
+            self.leads += 1
+            self.lead_times.append(when)
+        elif kind == 'skip':
+            self.skipped += event.get('count', 1)
+        elif kind == 'target':
+            self.target = event['total']
+        elif kind == 'phase':
+            self.latency.setdefault(event['phase'], deque(maxlen=self.SPARK_POINTS)).append(event['seconds'])
+        elif kind == 'error':
+            self.errors += 1
+        elif kind == 'retry':
+            self.retries += 1
+        elif kind == 'cache':
+            self.cache_lookups += 1
+            self.cache_hits += bool(event.get('hit'))
+        elif kind == 'browser':
+            self.browsers[event['browser']] = (event['state'], when)
+            
+    def leads_per_minute(self, now=None):
+        """Return the lead rate over the rolling window"""
+        now = now or time.time()
+        while self.lead_times and self.lead_times[0] < now - self.WINDOW:
+            self.lead_times.popleft()
+        span = min(self.WINDOW, now - self.started)
+        return len(self.lead_times) / span * 60 if span > 0 else 0.0
+        
+    def eta(self, now=None):
+        """Return the estimated seconds until the target is reached, or None if unknown"""
+        rate = self.leads_per_minute(now)
+        if not self.target or not rate:
+            return None
+        remaining = max(0, self.target - self.leads - self.skipped)
+        return remaining / rate * 60
+        
+    def error_rate(self):
+        """Return the share of attempts that failed"""
+        attempts = self.leads + self.errors
+        return self.errors / attempts if attempts else 0.0
+        
+    def retry_rate(self):
+        """Return the number of retries per attempt"""
+        attempts = self.leads + self.errors
+        return self.retries / attempts if attempts else 0.0
+        
+    def cache_hit_rate(self):
+        """Return the share of website cache lookups that hit, or None before the first lookup"""
+        return self.cache_hits / self.cache_lookups if self.cache_lookups else None
 
 
 class ModernTheme:
@@ -604,6 +4690,33 @@ class ModernTheme:
 
 
 class GoogleMapsScraper:
+    # Maximum number of lines kept in the status log widget
+    MAX_STATUS_LINES = 500
+    # Maximum number of queue messages handled per polling tick
+    MAX_EVENTS_PER_TICK = 2000
+    # Queue polling interval bounds in milliseconds
+    MIN_POLL_INTERVAL = 20
+    MAX_POLL_INTERVAL = 500
+    # Minimum seconds between dashboard redraws
+    DASHBOARD_INTERVAL = 0.5
+    # Number of rows per page when reading results from an SQLite file
+    RESULTS_PAGE_SIZE = 500
+    # Engine settings shown in the settings tab: (name, label, default, minimum, maximum)
+    ENGINE_SETTINGS = [
+        ('max_browser_mb', "Restart browser above (MB, 0 = off)", BrowserMemoryWatchdog.MAX_BROWSER_MB, 0, 65536),
+        ('max_heap_mb', "Recycle tab above JS heap (MB, 0 = off)", BrowserMemoryWatchdog.MAX_HEAP_MB, 0, 16384),
+        ('recycle_every', "Recycle tab every N leads (0 = off)", BrowserMemoryWatchdog.RECYCLE_EVERY, 0, 10000),
+        ('enrich_concurrency', "Website checks in parallel", WebsiteEnricher.CONCURRENCY, 1, 256),
+        ('enrich_per_host', "Website connections per host", WebsiteEnricher.PER_HOST, 1, 16),
+        ('enrich_timeout', "Website timeout (seconds)", WebsiteEnricher.TIMEOUT, 1, 120),
+        ('reviews_per_place', "Reviews per place (0 = off)", 0, 0, 10000),
+        ('http_concurrency', "Place pages fetched in parallel", PlaceFetcher.CONCURRENCY, 1, 128),
+        ('time_budget', "Time budget (minutes, 0 = off)", 0, 0, 1440),
+        ('lead_timeout', "Time limit per place (seconds, 0 = off)", CommandWatchdog.LEAD_TIMEOUT, 0, 3600),
+        ('retry_backoff', "Retry failed places after (seconds)", RetryQueue.BACKOFF, 0, 600),
+        ('tabs', "Places loaded at once, in tabs", 1, 1, 16),
+    ]
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Google Maps Lead Scraper")
@@ -624,11 +4737,28 @@ class GoogleMapsScraper:
         # Initialize theme
         self.theme = ModernTheme(self.root)
         
+        # Load persisted settings, presets and cached browser discovery
+        self.config = AppConfig()
+        self.locator = BrowserLocator(self.config)
+        
         # Initialize variables
         self.driver = None
         self.wait = None
         self.scraper_thread = None
         self.is_scraping = False
+        # Set from Stop until the worker has closed its files
+        self.stopping = False
+        self.metrics = RunMetrics()
+        self.dashboard_drawn = 0
+        self._all_items = []
+        self.leads_by_item = {}
+        self._sort_state = (None, False)
+        self.results_page = 0
+        self.export_thread = None
+        
+        # Status log and queue polling state
+        self.status_log = StatusLog(max_lines=self.MAX_STATUS_LINES)
+        self.poll_interval = self.MIN_POLL_INTERVAL
         
         # Create custom fonts
         self.title_font = font.Font(family="Helvetica", size=16, weight="bold")
@@ -692,20 +4822,26 @@ class GoogleMapsScraper:
         # Create tabs
         self.search_tab = ttk.Frame(self.notebook, padding=10)
         self.results_tab = ttk.Frame(self.notebook, padding=10)
+        self.dashboard_tab = ttk.Frame(self.notebook, padding=10)
         self.settings_tab = ttk.Frame(self.notebook, padding=10)
         self.about_tab = ttk.Frame(self.notebook, padding=10)
         
         # Add tabs to notebook
         self.notebook.add(self.search_tab, text="Search")
         self.notebook.add(self.results_tab, text="Results")
+        self.notebook.add(self.dashboard_tab, text="Dashboard")
         self.notebook.add(self.settings_tab, text="Settings")
         self.notebook.add(self.about_tab, text="About")
         
-        # Setup each tab
+        # Only the search tab is built up front, the others are built on first view
+        self._tab_builders = {
+            str(self.results_tab): self.setup_results_tab,
+            str(self.dashboard_tab): self.setup_dashboard_tab,
+            str(self.settings_tab): self.setup_settings_tab,
+            str(self.about_tab): self.setup_about_tab,
+        }
         self.setup_search_tab()
-        self.setup_results_tab()
-        self.setup_settings_tab()
-        self.setup_about_tab()
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
         
         # Status bar at bottom
         status_bar = ttk.Frame(self.main_frame)
@@ -730,6 +4866,16 @@ class GoogleMapsScraper:
         self.search_method.current(0)
         self.search_method.bind("<<ComboboxSelected>>", self.toggle_search_method)
         
+        # Saved search presets
+        preset_frame = ttk.Frame(input_frame)
+        preset_frame.grid(row=0, column=2, sticky=tk.W, padx=(20, 0), pady=5)
+        ttk.Label(preset_frame, text="Preset:").pack(side=tk.LEFT)
+        self.preset_combo = ttk.Combobox(preset_frame, width=18, values=sorted(self.config.presets()))
+        self.preset_combo.pack(side=tk.LEFT, padx=5)
+        self.preset_combo.bind("<<ComboboxSelected>>", self.load_preset)
+        ttk.Button(preset_frame, text="Save", command=self.save_preset).pack(side=tk.LEFT)
+        ttk.Button(preset_frame, text="Delete", command=self.delete_preset).pack(side=tk.LEFT, padx=5)
+        
         # Keywords Frame
         self.keywords_frame = ttk.Frame(input_frame)
         self.keywords_frame.grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=5)
@@ -766,7 +4912,15 @@ class GoogleMapsScraper:
         
         # Headless mode
         self.headless_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(common_options, text="Run in Headless Mode", variable=self.headless_var).grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=5)
+        ttk.Checkbutton(common_options, text="Run in Headless Mode", variable=self.headless_var).grid(row=1, column=0, sticky=tk.W, pady=5)
+        
+        # Visit business websites for emails and social profiles
+        self.enrich_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(common_options, text="Enrich websites (emails, socials)", variable=self.enrich_var).grid(row=1, column=1, sticky=tk.W, pady=5)
+        
+        # Read place details from the page JSON over HTTP, the browser only handles what fails
+        self.http_fetch_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(common_options, text="Fetch details over HTTP", variable=self.http_fetch_var).grid(row=1, column=2, sticky=tk.W, pady=5)
         
         # Delay between requests
         ttk.Label(common_options, text="Delay (seconds):").grid(row=2, column=0, sticky=tk.W, pady=5)
@@ -774,6 +4928,10 @@ class GoogleMapsScraper:
         self.delay.grid(row=2, column=1, sticky=tk.W, pady=5)
         self.delay.set(3)
         
+        # Fast mode takes leads from the result cards, only opening places missing a required field
+        self.card_preview_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(common_options, text="Fast mode (read result cards)", variable=self.card_preview_var).grid(row=2, column=2, sticky=tk.W, pady=5)
+        
         # Output file
         ttk.Label(common_options, text="Output File:").grid(row=3, column=0, sticky=tk.W, pady=5)
         output_file_frame = ttk.Frame(common_options)
@@ -785,6 +4943,50 @@ class GoogleMapsScraper:
         
         ttk.Button(output_file_frame, text="Browse", command=self.browse_file).pack(side=tk.LEFT, padx=5)
         
+        # Delta runs only save places that are new or changed since the last run of the same search
+        self.delta_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(common_options, text="Delta run (changes only)", variable=self.delta_var).grid(row=3, column=2, sticky=tk.W, pady=5)
+        
+        # Fields a fast mode lead must have, otherwise its place is opened
+        ttk.Label(common_options, text="Required Fields:").grid(row=4, column=0, sticky=tk.W, pady=5)
+        self.required_fields = ttk.Entry(common_options, width=30)
+        self.required_fields.grid(row=4, column=1, columnspan=2, sticky=tk.W, pady=5)
+        self.required_fields.insert(0, "phone, website")
+        
+        # Order of the detail visits, scored from the result cards
+        ttk.Label(common_options, text="Visit Order:").grid(row=5, column=0, sticky=tk.W, pady=5)
+        self.visit_order = ttk.Combobox(common_options, width=12, state="readonly", values=VisitPriority.ORDERS)
+        self.visit_order.grid(row=5, column=1, sticky=tk.W, pady=5)
+        self.visit_order.set(VisitPriority.FEED)
+        
+        # Filters checked against the result cards, rejected places are never opened
+        filter_frame = ttk.LabelFrame(self.search_tab, text="Filters", padding="10")
+        filter_frame.pack(fill=tk.X)
+        
+        ttk.Label(filter_frame, text="Min Rating:").grid(row=0, column=0, sticky=tk.W, pady=5)
+        self.min_rating = ttk.Spinbox(filter_frame, from_=0, to=5, increment=0.5, width=5)
+        self.min_rating.grid(row=0, column=1, sticky=tk.W, pady=5)
+        self.min_rating.set(0)
+        
+        ttk.Label(filter_frame, text="Min Reviews:").grid(row=0, column=2, sticky=tk.W, padx=(10, 0), pady=5)
+        self.min_reviews = ttk.Spinbox(filter_frame, from_=0, to=100000, width=7)
+        self.min_reviews.grid(row=0, column=3, sticky=tk.W, pady=5)
+        self.min_reviews.set(0)
+        
+        ttk.Label(filter_frame, text="Include Categories:").grid(row=1, column=0, sticky=tk.W, pady=5)
+        self.include_categories = ttk.Entry(filter_frame, width=20)
+        self.include_categories.grid(row=1, column=1, sticky=tk.W, pady=5)
+        
+        ttk.Label(filter_frame, text="Exclude Categories:").grid(row=1, column=2, sticky=tk.W, padx=(10, 0), pady=5)
+        self.exclude_categories = ttk.Entry(filter_frame, width=20)
+        self.exclude_categories.grid(row=1, column=3, sticky=tk.W, pady=5)
+        
+        self.require_website_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(filter_frame, text="Has website", variable=self.require_website_var).grid(row=2, column=0, sticky=tk.W, pady=5)
+        
+        self.skip_closed_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(filter_frame, text="Skip permanently closed", variable=self.skip_closed_var).grid(row=2, column=1, sticky=tk.W, pady=5)
+        
         # Action buttons
         button_frame = ttk.Frame(self.search_tab)
         button_frame.pack(pady=15)
@@ -824,6 +5026,12 @@ class GoogleMapsScraper:
         ttk.Button(toolbar, text="Refresh", command=self.refresh_results).pack(side=tk.LEFT, padx=5)
         ttk.Button(toolbar, text="Export", command=self.export_results).pack(side=tk.LEFT, padx=5)
         
+        # Paging for results read from an SQLite output file
+        ttk.Button(toolbar, text="▶", width=3, command=lambda: self.change_results_page(1)).pack(side=tk.RIGHT, padx=2)
+        self.page_label = ttk.Label(toolbar, text="")
+        self.page_label.pack(side=tk.RIGHT, padx=5)
+        ttk.Button(toolbar, text="◀", width=3, command=lambda: self.change_results_page(-1)).pack(side=tk.RIGHT, padx=2)
+        
         # Search filter
         ttk.Label(toolbar, text="Filter:").pack(side=tk.LEFT, padx=(20, 5))
         self.filter_entry = ttk.Entry(toolbar, width=20)
@@ -841,7 +5049,7 @@ class GoogleMapsScraper:
         hsb.pack(side=tk.BOTTOM, fill=tk.X)
         
         # Treeview
-        self.results_tree = ttk.Treeview(tree_frame, columns=("name", "address", "phone", "website", "rating", "reviews", "categories"),
+        self.results_tree = ttk.Treeview(tree_frame, columns=Lead.FIELDS, displaycolumns=Lead.CORE_FIELDS + Lead.EXTRA_FIELDS,
                                          show="headings", yscrollcommand=vsb.set, xscrollcommand=hsb.set)
         
         # Configure scrollbars
@@ -849,13 +5057,16 @@ class GoogleMapsScraper:
         hsb.config(command=self.results_tree.xview)
         
         # Define columns
-        self.results_tree.heading("name", text="Business Name")
-        self.results_tree.heading("address", text="Address")
-        self.results_tree.heading("phone", text="Phone")
-        self.results_tree.heading("website", text="Website")
-        self.results_tree.heading("rating", text="Rating")
-        self.results_tree.heading("reviews", text="Reviews")
-        self.results_tree.heading("categories", text="Categories")
+        self.results_tree.heading("name", text="Business Name", command=lambda: self.sort_results("name"))
+        self.results_tree.heading("address", text="Address", command=lambda: self.sort_results("address"))
+        self.results_tree.heading("phone", text="Phone", command=lambda: self.sort_results("phone"))
+        self.results_tree.heading("website", text="Website", command=lambda: self.sort_results("website"))
+        self.results_tree.heading("rating", text="Rating", command=lambda: self.sort_results("rating"))
+        self.results_tree.heading("reviews", text="Reviews", command=lambda: self.sort_results("reviews"))
+        self.results_tree.heading("categories", text="Categories", command=lambda: self.sort_results("categories"))
+        self.results_tree.heading("email", text="Email", command=lambda: self.sort_results("email"))
+        self.results_tree.heading("socials", text="Socials", command=lambda: self.sort_results("socials"))
+        self.results_tree.heading("http_status", text="HTTP", command=lambda: self.sort_results("http_status"))
         
         # Set column widths
         self.results_tree.column("name", width=150)
@@ -865,12 +5076,101 @@ class GoogleMapsScraper:
         self.results_tree.column("rating", width=60)
         self.results_tree.column("reviews", width=80)
         self.results_tree.column("categories", width=150)
+        self.results_tree.column("email", width=150)
+        self.results_tree.column("socials", width=200)
+        self.results_tree.column("http_status", width=50)
         
         self.results_tree.pack(fill=tk.BOTH, expand=True)
         
         # Add right-click menu
         self.create_context_menu()
         
+    def setup_dashboard_tab(self):
+        """Setup the dashboard tab with live run metrics"""
+        summary_frame = ttk.LabelFrame(self.dashboard_tab, text="Throughput", padding="10")
+        summary_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        self.dashboard_labels = {}
+        items = [('leads', "Leads:"), ('rate', "Leads/min:"), ('eta', "ETA:"),
+                 ('errors', "Error rate:"), ('retries', "Retry rate:"), ('cache', "Cache hit rate:")]
+        for position, (name, text) in enumerate(items):
+            row, column = divmod(position, 3)
+            ttk.Label(summary_frame, text=text).grid(row=row, column=column * 2, sticky=tk.W, padx=(0, 5), pady=5)
+            self.dashboard_labels[name] = ttk.Label(summary_frame, text="-", width=14)
+            self.dashboard_labels[name].grid(row=row, column=column * 2 + 1, sticky=tk.W, pady=5)
+            
+        # One sparkline per phase, added as phases report their first timing
+        self.latency_frame = ttk.LabelFrame(self.dashboard_tab, text="Latency per phase (seconds)", padding="10")
+        self.latency_frame.pack(fill=tk.X, pady=(0, 10))
+        self.sparklines = {}
+        
+        browser_frame = ttk.LabelFrame(self.dashboard_tab, text="Browsers", padding="10")
+        browser_frame.pack(fill=tk.BOTH, expand=True)
+        self.browser_tree = ttk.Treeview(browser_frame, columns=("browser", "state", "since"), show="headings", height=4)
+        for column, heading, width in (("browser", "Browser", 150), ("state", "State", 200), ("since", "For", 100)):
+            self.browser_tree.heading(column, text=heading)
+            self.browser_tree.column(column, width=width)
+        self.browser_tree.pack(fill=tk.BOTH, expand=True)
+        self.refresh_dashboard()
+        
+    def refresh_dashboard(self):
+        """Redraw the dashboard from the run metrics, if the tab has been built"""
+        if not hasattr(self, 'dashboard_labels'):
+            return
+        metrics = self.metrics
+        now = time.time()
+        self.dashboard_drawn = now
+        target = f" / {metrics.target}" if metrics.target else ""
+        eta = metrics.eta(now)
+        cache_rate = metrics.cache_hit_rate()
+        values = {
+            'leads': f"{metrics.leads}{target}",
+            'rate': f"{metrics.leads_per_minute(now):.1f}",
+            'eta': self.format_duration(eta) if eta is not None else "-",
+            'errors': f"{metrics.error_rate():.0%}",
+            'retries': f"{metrics.retry_rate():.0%}",
+            'cache': f"{cache_rate:.0%}" if cache_rate is not None else "-",
+        }
+        for name, value in values.items():
+            self.dashboard_labels[name].config(text=value)
+            
+        for phase, samples in metrics.latency.items():
+            if phase not in self.sparklines:
+                row = len(self.sparklines)
+                ttk.Label(self.latency_frame, text=phase, width=10).grid(row=row, column=0, sticky=tk.W)
+                canvas = tk.Canvas(self.latency_frame, width=360, height=28, highlightthickness=0)
+                canvas.grid(row=row, column=1, padx=5, pady=2)
+                label = ttk.Label(self.latency_frame, width=24)
+                label.grid(row=row, column=2, sticky=tk.W)
+                self.sparklines[phase] = (canvas, label)
+            canvas, label = self.sparklines[phase]
+            self.draw_sparkline(canvas, samples)
+            label.config(text=f"last {samples[-1]:.2f}  avg {sum(samples) / len(samples):.2f}")
+            
+        self.browser_tree.delete(*self.browser_tree.get_children())
+        for browser, (state, since) in sorted(metrics.browsers.items()):
+            self.browser_tree.insert("", tk.END, values=(browser, state, self.format_duration(now - since)))
+            
+    def draw_sparkline(self, canvas, samples):
+        """Draw samples as a line scaled to the canvas"""
+        canvas.delete("all")
+        width, height = int(canvas['width']), int(canvas['height'])
+        if len(samples) < 2:
+            return
+        top = max(samples) or 1
+        step = width / (RunMetrics.SPARK_POINTS - 1)
+        points = []
+        for position, value in enumerate(samples):
+            points.extend((position * step, height - 2 - value / top * (height - 4)))
+        canvas.create_line(*points, fill="#4a90d9", width=1.5)
+        
+    @staticmethod
+    def format_duration(seconds):
+        """Format seconds as h:mm:ss or m:ss"""
+        minutes, seconds = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+        
     def setup_settings_tab(self):
         """Setup the settings tab with configuration options"""
         settings_frame = ttk.LabelFrame(self.settings_tab, text="Application Settings", padding="10")
@@ -900,6 +5200,12 @@ class GoogleMapsScraper:
         
         ttk.Button(driver_path_frame, text="Browse", command=self.browse_driver).pack(side=tk.LEFT, padx=5)
         
+        # Warm profile and disk cache shared between sessions
+        self.warm_profile_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(chrome_frame, text="Reuse a warm browser profile and disk cache", variable=self.warm_profile_var).grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=5)
+        self.profile_tmpfs_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(chrome_frame, text="Keep the session profile in memory (/dev/shm, Linux)", variable=self.profile_tmpfs_var).grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=5)
+        
         # Proxy settings
         proxy_frame = ttk.LabelFrame(settings_frame, text="Proxy Settings", padding="10")
         proxy_frame.pack(fill=tk.X, pady=10)
@@ -937,9 +5243,30 @@ class GoogleMapsScraper:
         self.proxy_password = ttk.Entry(self.proxy_auth_frame, width=20, show="*")
         self.proxy_password.grid(row=0, column=3, sticky=tk.W, pady=5)
         
+        # Engine settings, laid out two per row
+        engine_frame = ttk.LabelFrame(settings_frame, text="Engine Settings", padding="10")
+        engine_frame.pack(fill=tk.X, pady=10)
+        self.engine_vars = {}
+        for position, (name, label, default, low, high) in enumerate(self.ENGINE_SETTINGS):
+            row, column = divmod(position, 2)
+            ttk.Label(engine_frame, text=f"{label}:").grid(row=row, column=column * 2, sticky=tk.W, pady=5, padx=(0 if column == 0 else 20, 0))
+            var = tk.StringVar(value=str(self.config.get(name, default)))
+            ttk.Spinbox(engine_frame, from_=low, to=high, width=8, textvariable=var).grid(row=row, column=column * 2 + 1, sticky=tk.W, pady=5, padx=5)
+            self.engine_vars[name] = var
+        
+        # Diagnostics, written beside the output file when the run ends
+        diagnostics_frame = ttk.LabelFrame(settings_frame, text="Diagnostics", padding="10")
+        diagnostics_frame.pack(fill=tk.X, pady=10)
+        self.trace_commands_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(diagnostics_frame, text="Trace WebDriver commands", variable=self.trace_commands_var).grid(row=0, column=0, sticky=tk.W, pady=5)
+        self.profile_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(diagnostics_frame, text="Profile the scraper with cProfile", variable=self.profile_var).grid(row=0, column=1, sticky=tk.W, pady=5, padx=(20, 0))
+        
         # Save settings button
         ttk.Button(settings_frame, text="Save Settings", command=self.save_settings).pack(pady=15)
         
+        self.load_settings()
+        
     def setup_about_tab(self):
         """Setup the about tab with application information"""
         about_frame = ttk.Frame(self.about_tab, padding="20")
@@ -976,6 +5303,16 @@ class GoogleMapsScraper:
         ttk.Button(links_frame, text="Report Issue", command=lambda: self.open_url("https://example.com/issues")).pack(side=tk.LEFT, padx=5)
         ttk.Button(links_frame, text="Check for Updates", command=self.check_for_updates).pack(side=tk.LEFT, padx=5)
         
+    def on_tab_changed(self, event=None):
+        """Build a tab the first time it is shown"""
+        self.ensure_tab(self.notebook.select())
+        
+    def ensure_tab(self, tab):
+        """Build a deferred tab if it has not been built yet"""
+        builder = self._tab_builders.pop(str(tab), None)
+        if builder:
+            builder()
+            
     def toggle_theme(self):
         """Toggle between light and dark mode"""
         is_dark = self.theme.toggle_theme()
@@ -1007,9 +5344,11 @@ class GoogleMapsScraper:
             
     def browse_file(self):
         """Browse for output file location"""
+        from tkinter import filedialog
+        
         filename = filedialog.asksaveasfilename(
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+            filetypes=[("CSV files", "*.csv"), ("SQLite databases", "*.db"), ("All files", "*.*")]
         )
         if filename:
             self.output_file.delete(0, tk.END)
@@ -1017,6 +5356,8 @@ class GoogleMapsScraper:
             
     def browse_chrome(self):
         """Browse for Chrome executable"""
+        from tkinter import filedialog
+        
         filename = filedialog.askopenfilename(
             title="Select Chrome Executable",
             filetypes=[
@@ -1030,6 +5371,8 @@ class GoogleMapsScraper:
             
     def browse_driver(self):
         """Browse for ChromeDriver executable"""
+        from tkinter import filedialog
+        
         filename = filedialog.askopenfilename(
             title="Select ChromeDriver Executable",
             filetypes=[
@@ -1041,10 +5384,165 @@ class GoogleMapsScraper:
             self.driver_path.delete(0, tk.END)
             self.driver_path.insert(0, filename)
             
+    def load_settings(self):
+        """Fill the settings widgets from the saved configuration"""
+        self.chrome_path.insert(0, self.config.get('chrome_path', ''))
+        self.driver_path.insert(0, self.config.get('driver_path', ''))
+        self.warm_profile_var.set(self.config.get('warm_profile', True))
+        self.profile_tmpfs_var.set(self.config.get('profile_tmpfs', False))
+        self.trace_commands_var.set(self.config.get('trace_commands', False))
+        self.profile_var.set(self.config.get('profile', False))
+        self.use_proxy_var.set(self.config.get('use_proxy', False))
+        self.proxy_address.insert(0, self.config.get('proxy_address', ''))
+        self.proxy_port.insert(0, self.config.get('proxy_port', ''))
+        self.proxy_auth_var.set(self.config.get('proxy_auth', False))
+        self.proxy_username.insert(0, self.config.get('proxy_username', ''))
+        self.toggle_proxy()
+        self.toggle_proxy_auth()
+        
     def save_settings(self):
         """Save application settings"""
-        # In a real application, you would save these to a config file
-        messagebox.showinfo("Settings", "Settings saved successfully!")
+        # The proxy password is deliberately kept out of the plain-text config file
+        self.config.update({
+            'chrome_path': self.chrome_path.get().strip(),
+            'driver_path': self.driver_path.get().strip(),
+            'warm_profile': self.warm_profile_var.get(),
+            'profile_tmpfs': self.profile_tmpfs_var.get(),
+            'trace_commands': self.trace_commands_var.get(),
+            'profile': self.profile_var.get(),
+            'use_proxy': self.use_proxy_var.get(),
+            'proxy_address': self.proxy_address.get().strip(),
+            'proxy_port': self.proxy_port.get().strip(),
+            'proxy_auth': self.proxy_auth_var.get(),
+            'proxy_username': self.proxy_username.get().strip(),
+        })
+        self.config.update(self.get_engine_settings())
+        messagebox.showinfo("Settings", f"Settings saved to {self.config.path}")
+        
+    def get_browser_overrides(self):
+        """Return the Chrome and ChromeDriver path overrides and profile options, from the settings tab once it is built"""
+        if hasattr(self, 'chrome_path'):
+            return {'chrome_path': self.chrome_path.get().strip(), 'driver_path': self.driver_path.get().strip(),
+                    'warm_profile': self.warm_profile_var.get(), 'profile_tmpfs': self.profile_tmpfs_var.get()}
+        return {'chrome_path': self.config.get('chrome_path', ''), 'driver_path': self.config.get('driver_path', ''),
+                'warm_profile': self.config.get('warm_profile', True), 'profile_tmpfs': self.config.get('profile_tmpfs', False)}
+        
+    def get_diagnostics_options(self):
+        """Return the tracing and profiling switches, from the settings tab once it is built"""
+        if hasattr(self, 'trace_commands_var'):
+            return {'trace_commands': self.trace_commands_var.get(), 'profile': self.profile_var.get()}
+        return {'trace_commands': self.config.get('trace_commands', False), 'profile': self.config.get('profile', False)}
+        
+    def get_engine_settings(self):
+        """Return the engine settings, from the settings tab once it is built"""
+        settings = {}
+        for name, label, default, low, high in self.ENGINE_SETTINGS:
+            value = self.engine_vars[name].get() if hasattr(self, 'engine_vars') else self.config.get(name, default)
+            try:
+                settings[name] = type(default)(value)
+            except (TypeError, ValueError):
+                settings[name] = default
+        return settings
+        
+    def get_search_options(self):
+        """Return the current search form values"""
+        return {
+            'method': self.search_method.get(),
+            'business_type': self.business_type.get().strip(),
+            'location': self.location.get().strip(),
+            'direct_url': self.direct_url.get().strip(),
+            'num_results': self.num_results.get(),
+            'headless': self.headless_var.get(),
+            'enrich_websites': self.enrich_var.get(),
+            'http_fetch': self.http_fetch_var.get(),
+            'card_preview': self.card_preview_var.get(),
+            'delta': self.delta_var.get(),
+            'required_fields': self.required_fields.get().strip(),
+            'priority': self.visit_order.get(),
+            'filters': self.get_filter_options(),
+            'delay': self.delay.get(),
+            'output_file': self.output_file.get().strip(),
+        }
+        
+    def get_filter_options(self):
+        """Return the current lead filter values"""
+        return {
+            'min_rating': self.min_rating.get(),
+            'min_reviews': self.min_reviews.get(),
+            'include_categories': self.include_categories.get().strip(),
+            'exclude_categories': self.exclude_categories.get().strip(),
+            'require_website': self.require_website_var.get(),
+            'skip_closed': self.skip_closed_var.get(),
+        }
+        
+    def set_filter_options(self, options):
+        """Fill the lead filters from saved values"""
+        self.min_rating.set(options.get('min_rating', 0))
+        self.min_reviews.set(options.get('min_reviews', 0))
+        for name, entry in (('include_categories', self.include_categories), ('exclude_categories', self.exclude_categories)):
+            entry.delete(0, tk.END)
+            entry.insert(0, options.get(name, ""))
+        self.require_website_var.set(options.get('require_website', False))
+        self.skip_closed_var.set(options.get('skip_closed', False))
+        
+    def set_search_options(self, options):
+        """Fill the search form from saved values"""
+        entries = {
+            'business_type': self.business_type,
+            'location': self.location,
+            'direct_url': self.direct_url,
+            'output_file': self.output_file,
+            'required_fields': self.required_fields,
+        }
+        for name, entry in entries.items():
+            if name in options:
+                entry.delete(0, tk.END)
+                entry.insert(0, options[name])
+        if 'method' in options:
+            self.search_method.set(options['method'])
+            self.toggle_search_method()
+        if 'num_results' in options:
+            self.num_results.set(options['num_results'])
+        if 'delay' in options:
+            self.delay.set(options['delay'])
+        if 'headless' in options:
+            self.headless_var.set(options['headless'])
+        if 'enrich_websites' in options:
+            self.enrich_var.set(options['enrich_websites'])
+        if 'http_fetch' in options:
+            self.http_fetch_var.set(options['http_fetch'])
+        if 'card_preview' in options:
+            self.card_preview_var.set(options['card_preview'])
+        if 'delta' in options:
+            self.delta_var.set(options['delta'])
+        if options.get('priority') in VisitPriority.ORDERS:
+            self.visit_order.set(options['priority'])
+        if 'filters' in options:
+            self.set_filter_options(options['filters'])
+            
+    def save_preset(self):
+        """Save the current search form as a named preset"""
+        name = self.preset_combo.get().strip()
+        if not name:
+            messagebox.showinfo("Presets", "Enter a name for the preset first.")
+            return
+        self.config.save_preset(name, self.get_search_options())
+        self.preset_combo.config(values=sorted(self.config.presets()))
+        self.update_status(f"Saved preset: {name}")
+        
+    def load_preset(self, event=None):
+        """Load the selected preset into the search form"""
+        options = self.config.presets().get(self.preset_combo.get())
+        if options:
+            self.set_search_options(options)
+            
+    def delete_preset(self):
+        """Delete the selected preset"""
+        name = self.preset_combo.get().strip()
+        if name in self.config.presets():
+            self.config.delete_preset(name)
+            self.preset_combo.config(values=sorted(self.config.presets()))
+            self.preset_combo.set("")
         
     def open_url(self, url):
         """Open a URL in the default web browser"""
@@ -1077,18 +5575,16 @@ class GoogleMapsScraper:
         """Copy selected item to clipboard"""
         selected = self.results_tree.selection()
         if selected:
-            item = self.results_tree.item(selected[0])
-            values = item['values']
+            values = self.leads_by_item[selected[0]].to_row()
             self.root.clipboard_clear()
-            self.root.clipboard_append("\t".join(str(v) for v in values))
+            self.root.clipboard_append("\t".join(values))
             
     def open_website(self):
         """Open website of selected business"""
         selected = self.results_tree.selection()
         if selected:
-            item = self.results_tree.item(selected[0])
-            website = item['values'][3]  # Website is at index 3
-            if website and website != "N/A":
+            website = self.leads_by_item[selected[0]].website
+            if website:
                 self.open_url(website)
             else:
                 messagebox.showinfo("Info", "No website available for this business.")
@@ -1099,65 +5595,85 @@ class GoogleMapsScraper:
         if selected:
             for item in selected:
                 self.results_tree.delete(item)
+                self._all_items.remove(item)
+                self.leads_by_item.pop(item, None)
                 
     def refresh_results(self):
-        """Refresh results from the last scrape"""
-        # In a real application, you would reload from the saved file
-        messagebox.showinfo("Refresh", "Results refreshed!")
+        """Reload results from the output file of the last scrape"""
+        filename = self.output_file.get().strip()
+        if not os.path.exists(filename):
+            messagebox.showinfo("Refresh", "No results file found yet.")
+            return
+        self.results_page = 0
+        self.load_results_from_file(filename)
+        
+    def change_results_page(self, step):
+        """Move to the previous or next page of an SQLite results file"""
+        filename = self.output_file.get().strip()
+        if not self.is_database_file(filename) or not os.path.exists(filename):
+            return
+        pages = max(1, -(-SQLiteLeadSink.count(filename) // self.RESULTS_PAGE_SIZE))
+        page = min(max(0, self.results_page + step), pages - 1)
+        if page != self.results_page:
+            self.results_page = page
+            self.load_results_from_file(filename)
+            
+    def is_database_file(self, filename):
+        """Check whether a results file is an SQLite database"""
+        return os.path.splitext(filename)[1].lower() in SQLiteLeadSink.EXTENSIONS
         
     def export_results(self):
-        """Export results to a file"""
+        """Export results to a file in a background thread"""
+        from tkinter import filedialog
+        
+        if self.export_thread and self.export_thread.is_alive():
+            messagebox.showinfo("Export", "An export is already in progress")
+            return
+            
         filename = filedialog.asksaveasfilename(
             defaultextension=".csv",
             filetypes=[
                 ("CSV files", "*.csv"),
                 ("Excel files", "*.xlsx"),
+                ("Parquet files", "*.parquet"),
+                ("JSON Lines files", "*.jsonl"),
                 ("All files", "*.*")
             ]
         )
         if not filename:
             return
             
+        # Export the rows currently shown, straight from the lead store
+        leads = [self.leads_by_item[item] for item in self.results_tree.get_children()]
+        if not leads:
+            messagebox.showinfo("Export", "No data to export!")
+            return
+            
+        self.export_thread = ExportThread(filename, leads)
+        self.export_thread.start()
+        self.status_label.config(text=f"Exporting {len(leads)} leads...")
+        self.check_export_queue()
+        
+    def check_export_queue(self):
+        """Check the queue for messages from the export thread"""
         try:
-            # Get all items from treeview
-            items = self.results_tree.get_children()
-            if not items:
-                messagebox.showinfo("Export", "No data to export!")
-                return
-                
-            # Export to CSV
-            if filename.endswith('.csv'):
-                with open(filename, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    # Write header
-                    writer.writerow(["Name", "Address", "Phone", "Website", "Rating", "Reviews", "Categories"])
-                    # Write data
-                    for item in items:
-                        values = self.results_tree.item(item)['values']
-                        writer.writerow(values)
-                        
-            # Export to Excel
-            elif filename.endswith('.xlsx'):
-                try:
-                    import pandas as pd
-                    
-                    # Create DataFrame
-                    data = []
-                    for item in items:
-                        values = self.results_tree.item(item)['values']
-                        data.append(values)
-                        
-                    df = pd.DataFrame(data, columns=["Name", "Address", "Phone", "Website", "Rating", "Reviews", "Categories"])
-                    df.to_excel(filename, index=False)
-                    
-                except ImportError:
-                    messagebox.showerror("Error", "Pandas is required for Excel export. Please install it with 'pip install pandas openpyxl'.")
-                    return
-                    
-            messagebox.showinfo("Export", f"Data exported successfully to {filename}!")
+            while True:
+                message_type, message = self.export_thread.queue.get_nowait()
+                if message_type == 'progress':
+                    self.status_label.config(text=f"Exporting... {message}%")
+                elif message_type == 'success':
+                    self.status_label.config(text="Export complete")
+                    messagebox.showinfo("Export", message)
+                elif message_type == 'info':
+                    self.status_label.config(text=message)
+                elif message_type == 'error':
+                    self.status_label.config(text="Export failed")
+                    messagebox.showerror("Export Error", message)
+        except queue.Empty:
+            pass
             
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Error exporting data: {str(e)}")
+        if self.export_thread.is_alive() or not self.export_thread.queue.empty():
+            self.root.after(100, self.check_export_queue)
             
     def filter_results(self, event=None):
         """Filter results based on search text"""
@@ -1176,141 +5692,84 @@ class GoogleMapsScraper:
         # Otherwise, show only matching items
         for item in self._all_items:
             values = self.results_tree.item(item)['values']
-            if any(search_text in str(value).lower() for value in values):
+            if self.matches_filter(values, search_text):
                 self.results_tree.reattach(item, '', 'end')
                 
-    def update_status(self, message):
-        """Update status text and label"""
-        self.status_text.insert(tk.END, f"[{datetime.now().strftime('%H:%M:%S')}] {message}\n")
-        self.status_text.see(tk.END)
-        self.status_label.config(text=message)
-        self.root.update_idletasks()
+    def sort_results(self, field):
+        """Sort results by a column using the typed lead values"""
+        reverse = self._sort_state == (field, False)
+        self._sort_state = (field, reverse)
         
-    def get_chromedriver_path(self):
-        """Get the path to chromedriver executable"""
-        # Check if user specified a custom path
-        custom_path = getattr(self, 'driver_path', None)
-        if custom_path and custom_path.get() and os.path.exists(custom_path.get()):
-            return custom_path.get()
-            
-        # Otherwise use bundled or system path
-        if getattr(sys, 'frozen', False):
-            # If the application is run as a bundle
-            application_path = sys._MEIPASS
-        else:
-            # If run as a normal Python script
-            application_path = os.path.dirname(os.path.abspath(__file__))
-            
-        driver_name = "chromedriver.exe" if platform.system() == "Windows" else "chromedriver"
-        driver_path = os.path.join(application_path, driver_name)
+        present = [item for item in self._all_items if getattr(self.leads_by_item[item], field) is not None]
+        missing = [item for item in self._all_items if getattr(self.leads_by_item[item], field) is None]
+        present.sort(key=lambda item: getattr(self.leads_by_item[item], field), reverse=reverse)
         
-        # Check if driver exists at the expected path
-        if not os.path.exists(driver_path):
-            self.update_status(f"ChromeDriver not found at: {driver_path}")
-            return None
-            
-        return driver_path
-    
-    def find_chrome_binary(self):
-        """Find Chrome binary across different systems"""
-        # Check if user specified a custom path
-        custom_path = getattr(self, 'chrome_path', None)
-        if custom_path and custom_path.get() and os.path.exists(custom_path.get()):
-            return custom_path.get()
-            
-        system = platform.system()
-        chrome_path = None
+        # Missing values always sort last, then reapply the filter in the new order
+        self._all_items = present + missing
+        self.filter_results()
         
-        if system == "Windows":
-            # Method 1: Registry lookup
-            try:
-                import winreg
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
-                                   r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths\chrome.exe") as key:
-                    chrome_path, _ = winreg.QueryValueEx(key, "")
-                    if os.path.exists(chrome_path):
-                        return chrome_path
-            except:
-                pass
-                
-            # Method 2: Common installation paths
-            paths = [
-                os.path.join(os.environ.get('PROGRAMFILES', 'C:\\Program Files'), 'Google\\Chrome\\Application\\chrome.exe'),
-                os.path.join(os.environ.get('PROGRAMFILES(X86)', 'C:\\Program Files (x86)'), 'Google\\Chrome\\Application\\chrome.exe'),
-                # Add additional common paths
-                "C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe",
-                "C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe"
-            ]
-            
-            # Method 3: Check for Chrome Enterprise paths
-            program_dirs = [os.environ.get('PROGRAMFILES', 'C:\\Program Files'), 
-                           os.environ.get('PROGRAMFILES(X86)', 'C:\\Program Files (x86)')]
-            for program_dir in program_dirs:
-                if os.path.exists(program_dir):
-                    for root, dirs, files in os.walk(program_dir):
-                        if 'chrome.exe' in files and 'Google' in root:
-                            chrome_path = os.path.join(root, 'chrome.exe')
-                            return chrome_path
-            
-        elif system == "Darwin":  # macOS
-            paths = [
-                "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-                "/Applications/Chrome.app/Contents/MacOS/Chrome",
-                # Add user-specific paths
-                os.path.expanduser("~/Applications/Google Chrome.app/Contents/MacOS/Google Chrome")
-            ]
+    def matches_filter(self, values, search_text):
+        """Check whether a row matches the filter text"""
+        return any(search_text in str(value).lower() for value in values)
+        
+    def append_results(self, leads):
+        """Append a batch of streamed leads to the results table"""
+        if not leads:
+            return
+        self.ensure_tab(self.results_tab)
+        search_text = self.filter_entry.get().lower()
+        for lead in leads:
+            row = lead.to_row()
+            item = self.results_tree.insert('', 'end', values=row)
+            self._all_items.append(item)
+            self.leads_by_item[item] = lead
             
-            # Try to find Chrome using 'mdfind' command
-            try:
-                mdfind_process = subprocess.Popen(
-                    ["mdfind", "kMDItemDisplayName == 'Google Chrome' && kMDItemKind == 'Application'"],
-                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-                )
-                mdfind_output, _ = mdfind_process.communicate()
-                
-                if mdfind_output.strip():
-                    chrome_path = os.path.join(mdfind_output.split('\n')[0], 
-                                             "Contents/MacOS/Google Chrome")
-                    if os.path.exists(chrome_path):
-                        return chrome_path
-            except:
-                pass
+            # Keep the current filter applied to rows that arrive mid-run
+            if search_text and not self.matches_filter(row, search_text):
+                self.results_tree.detach(item)
                 
-        elif system == "Linux":
-            paths = [
-                "/usr/bin/google-chrome",
-                "/usr/bin/chrome",
-                "/usr/bin/chromium",
-                "/usr/bin/chromium-browser",
-                "/snap/bin/chromium",
-                # Add user-specific paths
-                os.path.expanduser("~/.local/bin/chrome")
-            ]
+    def clear_results(self):
+        """Remove all rows from the results table"""
+        if self._all_items:
+            self.results_tree.delete(*self._all_items)
+        self._all_items = []
+        self.leads_by_item = {}
+        
+    def update_status(self, message):
+        """Update status text and label"""
+        self.append_status([message])
+        
+    def append_status(self, messages):
+        """Append a batch of status messages to the log with a single widget update"""
+        if not messages:
+            return
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        lines = [f"[{timestamp}] {message}" for message in messages]
+        self.status_log.append(lines)
+        
+        # Only the lines that survive the ring buffer are worth rendering
+        visible = lines[-self.MAX_STATUS_LINES:]
+        self.status_text.insert(tk.END, "\n".join(visible) + "\n")
+        
+        # Trim the widget to the size of the ring buffer
+        line_count = int(self.status_text.index('end-1c').split('.')[0]) - 1
+        excess = line_count - self.MAX_STATUS_LINES
+        if excess > 0:
+            self.status_text.delete('1.0', f'{excess + 1}.0')
             
-            # Try using 'which' command
-            try:
-                which_process = subprocess.Popen(
-                    ["which", "google-chrome", "chromium", "chromium-browser"],
-                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-                )
-                which_output, _ = which_process.communicate()
-                
-                if which_output.strip():
-                    chrome_path = which_output.split('\n')[0]
-                    if os.path.exists(chrome_path):
-                        return chrome_path
-            except:
-                pass
+        self.status_text.see(tk.END)
+        self.status_label.config(text=messages[-1])
         
-        # Check all potential paths
-        for path in paths:
-            if os.path.exists(path):
-                return path
-                
-        return None
+    def clear_status(self):
+        """Clear the status log for a new run"""
+        self.status_log.clear()
+        self.status_text.delete(1.0, tk.END)
         
     def start_scraping(self):
         """Start the scraping process in a separate thread"""
+        if self.stopping:
+            messagebox.showinfo("Info", "The previous run is still stopping, please wait")
+            return
         if self.is_scraping:
             messagebox.showinfo("Info", "Scraping is already in progress")
             return
@@ -1322,6 +5781,10 @@ class GoogleMapsScraper:
             output_file = self.output_file.get().strip()
             headless = self.headless_var.get()
             delay = int(self.delay.get())
+            required_fields = parse_field_list(self.required_fields.get())
+            if required_fields is None:
+                messagebox.showerror("Error", f"Required fields must be a comma separated list of: {', '.join(Lead.CORE_FIELDS)}.")
+                return
             
             # Validate inputs based on search method
             if method == "Search by Keywords":
@@ -1332,7 +5795,7 @@ class GoogleMapsScraper:
                     messagebox.showerror("Error", "Please enter both business type and location.")
                     return
                     
-                self.status_text.delete(1.0, tk.END)
+                self.clear_status()
                 self.update_status(f"Starting search for {business_type} in {location}...")
                 
                 # Store parameters
@@ -1353,7 +5816,7 @@ class GoogleMapsScraper:
                     messagebox.showerror("Error", "Please enter a valid Google Maps URL.")
                     return
                     
-                self.status_text.delete(1.0, tk.END)
+                self.clear_status()
                 self.update_status(f"Starting scraping from URL: {direct_url}")
                 
                 # Store parameters
@@ -1366,21 +5829,41 @@ class GoogleMapsScraper:
                     'delay': delay
                 }
             
+            # Browser paths are resolved in the worker thread, so pass the overrides along
+            params.update(self.get_browser_overrides())
+            params.update(self.get_engine_settings())
+            params.update(self.get_diagnostics_options())
+            params['enrich_websites'] = self.enrich_var.get()
+            params['http_fetch'] = self.http_fetch_var.get()
+            params['card_preview'] = self.card_preview_var.get()
+            params['delta'] = self.delta_var.get()
+            params['required_fields'] = required_fields
+            params['priority'] = self.visit_order.get()
+            params['filters'] = self.get_filter_options()
+            # Reject bad numbers before the run starts
+            LeadFilter.from_params(params['filters'])
+            
             # Reset progress bar
             self.progress_var.set(0)
             
             # Update UI state
             self.is_scraping = True
+            self.stopping = False
             self.start_button.config(state=tk.DISABLED)
             self.stop_button.config(state=tk.NORMAL)
             
+            # Clear results from the previous run, new leads are streamed in as they arrive
+            self.clear_results()
+            self.metrics = RunMetrics()
+            if hasattr(self, 'sparklines'):
+                for child in self.latency_frame.winfo_children():
+                    child.destroy()
+                self.sparklines = {}
+            
             # Start scraping in a separate thread
-            self.scraper_thread = ScraperThread(self, params)
+            self.scraper_thread = ScraperThread(self.locator, params)
             self.scraper_thread.start()
             
-            # Store all items for filtering
-            self._all_items = []
-            
         except Exception as e:
             self.update_status(f"Error starting scraping: {str(e)}")
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
@@ -1391,55 +5874,91 @@ class GoogleMapsScraper:
             self.update_status("Stopping scraper...")
             self.scraper_thread.stop()
             
-            # Update UI state
-            self.is_scraping = False
-            self.start_button.config(state=tk.NORMAL)
+            # Start stays disabled until the worker has closed its output files and browser
+            self.stopping = True
             self.stop_button.config(state=tk.DISABLED)
             
     def check_queue(self):
         """Check the queue for messages from the scraper thread"""
-        if self.scraper_thread and self.scraper_thread.is_alive():
+        handled = 0
+        if self.scraper_thread:
+            statuses = []
+            leads = []
+            progress = None
             try:
-                while True:
+                while handled < self.MAX_EVENTS_PER_TICK:
                     message_type, message = self.scraper_thread.queue.get_nowait()
+                    handled += 1
                     
+                    # Progress and status updates are coalesced and applied once per tick
                     if message_type == 'status':
-                        self.update_status(message)
+                        statuses.append(message)
                     elif message_type == 'progress':
-                        self.progress_var.set(message)
-                    elif message_type == 'error':
-                        messagebox.showerror("Error", message)
-                    elif message_type == 'info':
-                        messagebox.showinfo("Information", message)
-                    elif message_type == 'success':
-                        messagebox.showinfo("Success", message)
-                        
-                        # Update results tab with data
-                        self.load_results_from_file(self.output_file.get().strip())
-                        
-                        # Switch to results tab
-                        self.notebook.select(self.results_tab)
+                        progress = message
+                    elif message_type == 'lead':
+                        leads.append(message)
+                    elif message_type == 'metric':
+                        self.metrics.record(message)
+                    else:
+                        self.append_status(statuses)
+                        self.append_results(leads)
+                        statuses = []
+                        leads = []
+                        self.handle_message(message_type, message)
                         
                     self.scraper_thread.queue.task_done()
             except queue.Empty:
                 pass
                 
-            # If thread has finished, update UI
-            if not self.scraper_thread.is_alive() and self.is_scraping:
+            self.append_status(statuses)
+            self.append_results(leads)
+            if progress is not None:
+                self.progress_var.set(progress)
+            if (handled or self.is_scraping) and time.time() - self.dashboard_drawn >= self.DASHBOARD_INTERVAL:
+                self.refresh_dashboard()
+                
+            # If thread has finished and its queue is drained, update UI
+            if not self.scraper_thread.is_alive() and self.scraper_thread.queue.empty() and self.is_scraping:
                 self.is_scraping = False
                 self.start_button.config(state=tk.NORMAL)
                 self.stop_button.config(state=tk.DISABLED)
-                self.update_status("Scraping completed.")
+                self.update_status("Scraping stopped." if self.stopping else "Scraping completed.")
+                self.stopping = False
+                
+        # Poll faster while the worker is busy and back off while idle
+        if handled >= self.MAX_EVENTS_PER_TICK:
+            self.poll_interval = self.MIN_POLL_INTERVAL
+        elif handled:
+            self.poll_interval = max(self.MIN_POLL_INTERVAL, self.poll_interval // 2)
+        else:
+            self.poll_interval = min(self.MAX_POLL_INTERVAL, self.poll_interval * 2)
                 
         # Schedule next check
-        self.root.after(100, self.check_queue)
+        self.root.after(self.poll_interval, self.check_queue)
         
+    def handle_message(self, message_type, message):
+        """Handle a non-coalesced message from the scraper thread"""
+        if message_type == 'error':
+            messagebox.showerror("Error", message)
+        elif message_type == 'info':
+            messagebox.showinfo("Information", message)
+        elif message_type == 'success':
+            messagebox.showinfo("Success", message)
+            
+            # Results were already streamed into the table, just switch to results tab
+            self.notebook.select(self.results_tab)
+            
     def load_results_from_file(self, filename):
         """Load results from CSV file into the treeview"""
+        self.ensure_tab(self.results_tab)
+        if self.is_database_file(filename):
+            self.load_results_page(filename)
+            return
+            
         try:
             # Clear existing data
-            for item in self.results_tree.get_children():
-                self.results_tree.delete(item)
+            self.clear_results()
+            self.page_label.config(text="")
                 
             # Read CSV file
             with open(filename, 'r', encoding='utf-8') as f:
@@ -1448,17 +5967,194 @@ class GoogleMapsScraper:
                 
                 # Add data to treeview
                 for i, row in enumerate(reader):
-                    self.results_tree.insert('', 'end', values=row)
+                    lead = Lead.from_row(row)
+                    item = self.results_tree.insert('', 'end', values=lead.to_row())
+                    self.leads_by_item[item] = lead
                     
             # Store all items for filtering
-            self._all_items = self.results_tree.get_children()
+            self._all_items = list(self.results_tree.get_children())
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not load results: {str(e)}")
+
+
+    def load_results_page(self, filename):
+        """Load the current page of results from an SQLite database into the treeview"""
+        try:
+            total = SQLiteLeadSink.count(filename)
+            leads = SQLiteLeadSink.page(filename, self.results_page * self.RESULTS_PAGE_SIZE, self.RESULTS_PAGE_SIZE)
+            
+            self.clear_results()
+            self.append_results(leads)
+            
+            pages = max(1, -(-total // self.RESULTS_PAGE_SIZE))
+            self.page_label.config(text=f"Page {self.results_page + 1} of {pages} ({total} leads)")
             
         except Exception as e:
             messagebox.showerror("Error", f"Could not load results: {str(e)}")
 
 
 # Main entry point
+def benchmark_startup(max_ms=None):
+    """Measure the time to the first drawn window and check selenium stayed unloaded
+    
+    Exits with a non-zero status if the window took longer than max_ms or if
+    selenium was imported during start-up. Combine with `python -X importtime`
+    for a per-module breakdown of import time.
+    """
+    import_ms = (time.perf_counter() - _START_TIME) * 1000
+    root = tk.Tk()
+    GoogleMapsScraper(root)
+    root.update()
+    window_ms = (time.perf_counter() - _START_TIME) * 1000
+    root.destroy()
+    
+    selenium_loaded = any(name == "selenium" or name.startswith("selenium.") for name in sys.modules)
+    print(f"Module import: {import_ms:.1f} ms")
+    print(f"Time to first window: {window_ms:.1f} ms")
+    print(f"Selenium imported at start-up: {'yes' if selenium_loaded else 'no'}")
+    
+    if selenium_loaded or (max_ms is not None and window_ms > max_ms):
+        sys.exit(1)
+
+
+def run_coordinator(args):
+    """Serve a work queue to remote workers and merge their leads into one output file"""
+    work_queue = WorkQueue(args.queue)
+    if args.jobs:
+        print(f"Enqueued {work_queue.enqueue_jobs_file(args.jobs)} jobs from {args.jobs}")
+    sink = LeadSink.open_for(args.output)
+    host, port = args.listen.rsplit(":", 1)
+    server = WorkQueueServer((host, int(port)), work_queue, sink, args.token)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Coordinator listening on {args.listen}, writing leads to {args.output}")
+    try:
+        while work_queue.has_open_jobs():
+            time.sleep(10)
+            work_queue.requeue_expired()
+            print(f"Jobs: {work_queue.stats()}", flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        sink.close()
+    print(f"Finished. Jobs: {work_queue.stats()}")
+
+
+def run_worker(args):
+    """Run a headless worker against a local or remote work queue"""
+    if args.queue.startswith("tcp://"):
+        work_queue = RemoteWorkQueue(args.queue, args.token)
+    else:
+        # Every job appends to the same file, which only an SQLite output supports
+        if os.path.splitext(args.output)[1].lower() not in SQLiteLeadSink.EXTENSIONS:
+            sys.exit("Workers on a local queue need an SQLite --output file, such as leads.db")
+        work_queue = WorkQueue(args.queue)
+    required_fields = parse_field_list(args.required_fields)
+    if required_fields is None:
+        sys.exit(f"--required-fields must be a comma separated list of: {', '.join(Lead.CORE_FIELDS)}")
+    params = {
+        'num_results': args.num_results,
+        'delay': args.delay,
+        'headless': not args.show_browser,
+        'output_file': args.output,
+        'enrich_websites': args.enrich,
+        'reviews_per_place': args.reviews_per_place,
+        'http_fetch': args.http_fetch,
+        'card_preview': args.fast,
+        'delta': args.delta,
+        'required_fields': required_fields,
+        'priority': args.priority,
+        'time_budget': args.time_budget,
+        'lead_timeout': args.lead_timeout,
+        'tabs': args.tabs,
+        'warm_profile': not args.fresh_profile,
+        'profile_tmpfs': args.profile_tmpfs,
+        'trace_commands': args.trace,
+        'profile': args.profile,
+        'filters': {
+            'min_rating': args.min_rating,
+            'min_reviews': args.min_reviews,
+            'include_categories': args.include_categories,
+            'exclude_categories': args.exclude_categories,
+            'require_website': args.has_website,
+            'skip_closed': args.skip_closed,
+        },
+    }
+    QueueWorker(work_queue, params, args.worker_id).run()
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Google Maps Lead Scraper")
+    parser.add_argument("--benchmark-startup", nargs="?", type=float, const=0, metavar="MAX_MS",
+                        help="measure start-up time and exit")
+    parser.add_argument("--coordinator", action="store_true", help="serve a work queue to remote workers")
+    parser.add_argument("--worker", action="store_true", help="run headless and process jobs from a work queue")
+    parser.add_argument("--queue", help="work queue: an SQLite file, or tcp://host:port for a coordinator")
+    parser.add_argument("--jobs", help="text file of jobs to add to the queue")
+    parser.add_argument("--output", default="google_maps_leads.db", help="output file for scraped leads")
+    parser.add_argument("--listen", default="127.0.0.1:8765", help="coordinator address to listen on")
+    parser.add_argument("--token", help="shared secret between coordinator and workers")
+    parser.add_argument("--worker-id", help="name of this worker, defaults to host and process ID")
+    parser.add_argument("--num-results", type=int, default=100, help="results per search job")
+    parser.add_argument("--delay", type=int, default=3, help="delay between actions in seconds")
+    parser.add_argument("--show-browser", action="store_true", help="run Chrome with a visible window")
+    parser.add_argument("--enrich", action="store_true", help="visit lead websites for emails and social profiles")
+    parser.add_argument("--reviews-per-place", type=int, default=0, metavar="N",
+                        help="also save up to N reviews per place, next to the output file")
+    parser.add_argument("--fast", action="store_true",
+                        help="take leads from the result cards, opening only places missing a required field")
+    parser.add_argument("--required-fields", default="phone,website", metavar="FIELDS",
+                        help="comma separated fields a --fast lead must have (default: phone,website)")
+    parser.add_argument("--priority", choices=VisitPriority.ORDERS, default=VisitPriority.FEED,
+                        help="order in which places are opened, scored from the result cards")
+    parser.add_argument("--time-budget", type=int, default=0, metavar="MINUTES",
+                        help="stop opening places after this many minutes per job (default: no limit)")
+    parser.add_argument("--lead-timeout", type=int, default=CommandWatchdog.LEAD_TIMEOUT, metavar="SECONDS",
+                        help="restart the browser when one place takes longer than this (0 = no limit)")
+    parser.add_argument("--delta", action="store_true",
+                        help="save only places that are new or changed since the last run of the same job")
+    parser.add_argument("--tabs", type=int, default=1, metavar="N",
+                        help=f"load N places at once in tabs of one browser (try {TabPool.TABS})")
+    parser.add_argument("--min-rating", type=float, default=0, help="skip places rated below this")
+    parser.add_argument("--min-reviews", type=int, default=0, help="skip places with fewer reviews")
+    parser.add_argument("--include-categories", default="", metavar="TEXT",
+                        help="comma separated category words, only matching places are opened")
+    parser.add_argument("--exclude-categories", default="", metavar="TEXT",
+                        help="comma separated category words, matching places are skipped")
+    parser.add_argument("--has-website", action="store_true", help="skip places without a website")
+    parser.add_argument("--skip-closed", action="store_true", help="skip permanently closed places")
+    parser.add_argument("--http-fetch", action="store_true",
+                        help="read place details over HTTP, using the browser only for pages that fail")
+    parser.add_argument("--fresh-profile", action="store_true",
+                        help="start every browser with an empty profile instead of the warm template and disk cache")
+    parser.add_argument("--profile-tmpfs", action="store_true",
+                        help="copy the browser profile to /dev/shm for each session")
+    parser.add_argument("--trace", action="store_true",
+                        help="record every WebDriver command and report totals per command, field and lead")
+    parser.add_argument("--profile", action="store_true", help="profile each job with cProfile")
+    return parser.parse_args(argv)
+
+
 def main():
+    args = parse_args()
+    if args.benchmark_startup is not None:
+        benchmark_startup(args.benchmark_startup or None)
+        return
+    if args.coordinator or args.worker or args.jobs:
+        if not args.queue:
+            sys.exit("--queue is required for distributed runs")
+        if args.coordinator:
+            run_coordinator(args)
+        elif args.worker:
+            run_worker(args)
+        else:
+            print(f"Enqueued {WorkQueue(args.queue).enqueue_jobs_file(args.jobs)} jobs from {args.jobs}")
+        return
+        
     try:
         # Set up the root window
         root = tk.Tk()
@@ -0,0 +1,32 @@
+"""DeltaTracker only reports places missing from the results list as gone"""
+from GoogleMapsScraper import DeltaTracker, Lead
+
+
+def lead(name):
+    return Lead(name=name, address="1 Main St", place_id="id-" + name)
+
+
+def run(tmp_path, compared, touched=(), complete=True):
+    tracker = DeltaTracker(str(tmp_path / "snapshot.db"), str(tmp_path / "delta.jsonl"), "search:cafe|paris")
+    for name in compared:
+        tracker.compare(lead(name))
+    for name in touched:
+        tracker.touch(lead(name))
+    tracker.finish(complete)
+    tracker.close()
+    return tracker.counts
+
+
+def test_filtered_out_places_are_not_gone(tmp_path):
+    run(tmp_path, ["a", "b", "c"])
+    counts = run(tmp_path, ["a"], touched=["b"])
+    assert counts['unchanged'] == 1
+    assert counts['gone'] == 1
+    # The filtered out place is still in the snapshot, the missing one was dropped
+    assert run(tmp_path, ["a", "b"])['unchanged'] == 2
+
+
+def test_incomplete_run_reports_nothing_gone(tmp_path):
+    run(tmp_path, ["a", "b"])
+    assert run(tmp_path, ["a"], complete=False)['gone'] == 0
+    assert run(tmp_path, ["a", "b"])['unchanged'] == 2
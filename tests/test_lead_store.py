@@ -0,0 +1,26 @@
+"""Committed leads are kept in their final form, in the columnar store for large runs"""
+from GoogleMapsScraper import Lead, LeadColumnStore, ScraperThread
+
+
+def committed(num_results, leads):
+    thread = ScraperThread(None, {'lead_timeout': 0, 'num_results': num_results})
+    for lead in leads:
+        # Enrichment and normalisation finish before a lead is committed
+        lead.email = f"hello@{lead.name.lower()}.example"
+        lead.phone_e164 = "+33142720000"
+        thread.commit_lead(lead)
+    return thread.leads
+
+
+def test_store_rows_match_committed_leads():
+    leads = [Lead(name=f"Cafe{i}", rating="4.5", reviews="(1,234)", categories="Cafe", latitude=48.85,
+                  longitude=2.35, place_id=f"ChIJcafe{i}") for i in range(3)]
+    store = committed(ScraperThread.COLUMNAR_THRESHOLD, leads)
+    assert isinstance(store, LeadColumnStore)
+    assert [row.to_row() for row in store] == [lead.to_row() for lead in leads]
+    assert [row.key() for row in store] == [lead.key() for lead in leads]
+
+
+def test_small_runs_keep_a_list():
+    leads = [Lead(name="Cafe")]
+    assert committed(10, leads) == leads
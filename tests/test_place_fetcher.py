@@ -0,0 +1,85 @@
+"""PlaceFetcher against saved place pages, and the browser fallback for pages it cannot read"""
+import asyncio
+import os
+import threading
+
+import pytest
+
+from GoogleMapsScraper import Lead, PlaceFetcher, ScraperThread, SelectorRegistry
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.fixture
+def selectors():
+    return SelectorRegistry(stats_path=None)
+
+
+def test_parses_saved_place_page(selectors):
+    lead = PlaceFetcher(selectors.place_json).parse_place_page(fixture("place_page.html"))
+    assert lead.name == "Café Lumière"
+    # The fallback address starts with the name, the main one does not
+    assert lead.address == "12 Rue de Rivoli, 75004 Paris, France"
+    assert lead.phone == "01 42 72 00 00"
+    assert lead.website == "https://www.cafe-lumiere.fr/"
+    assert lead.rating == 4.6
+    assert lead.reviews == 1287
+    assert lead.categories == "Café, Coffee shop"
+    assert (lead.latitude, lead.longitude) == (48.8556, 2.3579)
+    assert lead.place_id == "ChIJd8BlQ2Bu5kcRcafeLumiere"
+    assert lead.feature_id == "0x47e66e1f06e2b70f:0x40b82c3688c9460"
+    # The CID is the second half of the feature ID
+    assert lead.cid == str(0x40b82c3688c9460)
+    assert lead.key() == "ChIJd8BlQ2Bu5kcRcafeLumiere"
+    # The place ID is written to the output files and read back with them
+    assert Lead.from_row(lead.to_row()).place_id == lead.place_id
+    assert Lead.from_record(lead.to_record()).key() == lead.key()
+
+
+def test_pages_without_place_data_are_not_parsed(selectors):
+    fetcher = PlaceFetcher(selectors.place_json)
+    assert fetcher.parse_place_page(fixture("consent_page.html")) is None
+    assert fetcher.parse_place_page("window.APP_INITIALIZATION_STATE=[1, 2") is None
+
+
+@pytest.fixture
+def maps():
+    """Serve the saved pages from a local stand-in for Google Maps"""
+    aiohttp = pytest.importorskip("aiohttp")
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    pages = {"/maps/place/cafe": fixture("place_page.html"), "/maps/place/consent": fixture("consent_page.html")}
+
+    async def page(request):
+        if request.path in pages:
+            return web.Response(text=pages[request.path], content_type="text/html")
+        return web.Response(status=404)
+
+    app = web.Application()
+    app.router.add_route("GET", "/{tail:.*}", page)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    server = TestServer(app, host="127.0.0.1")
+    asyncio.run_coroutine_threadsafe(server.start_server(), loop).result()
+    yield lambda path: str(server.make_url(path))
+    asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def test_unreadable_pages_are_left_for_the_browser(maps, selectors):
+    thread = ScraperThread(None, {'lead_timeout': 0})
+    thread.selectors = selectors
+    urls = [maps("/maps/place/cafe"), maps("/maps/place/consent"), maps("/maps/place/missing")]
+    leads = []
+    for_browser = thread.fetch_place_pages(urls, leads)
+    assert [lead.name for lead in leads] == ["Café Lumière"]
+    assert sorted(for_browser) == sorted(urls[1:])
@@ -0,0 +1,59 @@
+"""A long review harvest keeps its watchdog budget alive while reviews keep arriving"""
+import itertools
+import time
+
+import GoogleMapsScraper
+from GoogleMapsScraper import ReviewHarvester, ScraperThread, SelectorRegistry
+
+
+class ScrollingPane:
+    """Stands in for a place whose reviews pane loads ten new reviews per scroll"""
+    def __init__(self):
+        self.ids = itertools.count()
+
+    def find_elements(self, by, selector):
+        return [self]
+
+    def click(self):
+        pass
+
+    def execute(self, command, params=None):
+        pass
+
+    def execute_script(self, script, *args):
+        return [{'review_id': f"r{next(self.ids)}", 'author': "Ann", 'rating': "5 stars", 'date': "a week ago",
+                 'text': "Great coffee"} for _ in range(10)]
+
+
+class MemorySink:
+    def __init__(self):
+        self.reviews = []
+
+    def write(self, review):
+        self.reviews.append(review)
+
+
+def test_long_harvest_is_not_killed(monkeypatch):
+    GoogleMapsScraper.load_selenium()
+    monkeypatch.setattr(ReviewHarvester, "PAUSE", 0.05)
+    monkeypatch.setattr(GoogleMapsScraper.CommandWatchdog, "POLL_INTERVAL", 0.02)
+    killed = []
+    monkeypatch.setattr(GoogleMapsScraper.CommandWatchdog, "kill_browser", staticmethod(killed.append))
+    # The whole harvest takes several times the per-lead budget
+    thread = ScraperThread(None, {'lead_timeout': 0.2, 'reviews_per_place': 200})
+    thread.selectors = SelectorRegistry(stats_path=None)
+    thread.review_sink = MemorySink()
+    driver = ScrollingPane()
+    thread.watchdog.start()
+    thread.watchdog.watch(driver)
+    started = time.monotonic()
+    try:
+        thread.harvest_reviews(driver, GoogleMapsScraper.Lead(name="Cafe", place_id="ChIJcafe"))
+    finally:
+        thread.watchdog.close()
+    assert time.monotonic() - started > 3 * 0.2
+    assert len(thread.review_sink.reviews) == 200
+    assert not killed
+    assert thread.watchdog.fired is None
+    # Going back to the results is covered by a fresh lead budget
+    assert thread.watchdog.deadline is not None
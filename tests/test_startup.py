@@ -0,0 +1,51 @@
+"""Guards the start-up gains: selenium stays unloaded and secondary tabs are built on first view"""
+import os
+import subprocess
+import sys
+import tkinter as tk
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_import_does_not_load_selenium():
+    # A fresh interpreter, so modules imported by other tests do not count
+    script = ("import sys, GoogleMapsScraper; "
+              "print(any(name == 'selenium' or name.startswith('selenium.') for name in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    # Keep the test away from the real configuration directory
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"no display available: {e}")
+    root.withdraw()
+    import GoogleMapsScraper
+    application = GoogleMapsScraper.GoogleMapsScraper(root)
+    yield application
+    root.destroy()
+
+
+def test_secondary_tabs_are_deferred(app):
+    deferred = {str(tab) for tab in (app.results_tab, app.dashboard_tab, app.settings_tab, app.about_tab)}
+    assert set(app._tab_builders) == deferred
+    assert not app.results_tab.winfo_children()
+    assert not app.settings_tab.winfo_children()
+    assert not app.about_tab.winfo_children()
+
+
+def test_tab_is_built_on_first_view(app):
+    app.ensure_tab(app.settings_tab)
+    assert app.settings_tab.winfo_children()
+    assert str(app.settings_tab) not in app._tab_builders
+    # A second view does not build it again
+    children = len(app.settings_tab.winfo_children())
+    app.ensure_tab(app.settings_tab)
+    assert len(app.settings_tab.winfo_children()) == children
@@ -0,0 +1,49 @@
+"""Stop reaches a hung WebDriver command whether or not a deadline is armed"""
+import threading
+import time
+
+import pytest
+
+from GoogleMapsScraper import CommandWatchdog
+
+
+class HungDriver:
+    """Stands in for a browser whose next command never returns until it is killed"""
+    def __init__(self):
+        self.killed = threading.Event()
+
+    def execute(self, command, params=None):
+        if command != "idle":
+            self.killed.wait(5)
+
+
+@pytest.fixture
+def watchdog(monkeypatch):
+    monkeypatch.setattr(CommandWatchdog, "POLL_INTERVAL", 0.02)
+    monkeypatch.setattr(CommandWatchdog, "STOP_GRACE", 0.1)
+    monkeypatch.setattr(CommandWatchdog, "kill_browser", staticmethod(lambda driver: driver.killed.set()))
+    stop = threading.Event()
+    watchdog = CommandWatchdog(stop, timeout=0)
+    watchdog.start()
+    yield watchdog
+    watchdog.close()
+
+
+def test_stop_kills_a_hung_command_without_a_deadline(watchdog):
+    driver = HungDriver()
+    watchdog.watch(driver)
+    threading.Timer(0.1, watchdog.stop_event.set).start()
+    started = time.monotonic()
+    driver.execute("scroll")
+    assert time.monotonic() - started < 2
+    assert watchdog.fired == 'stop'
+
+
+def test_stop_leaves_an_idle_browser_alone(watchdog):
+    driver = HungDriver()
+    watchdog.watch(driver)
+    driver.execute("idle")
+    watchdog.stop_event.set()
+    time.sleep(0.4)
+    assert not driver.killed.is_set()
+    assert watchdog.fired is None
@@ -0,0 +1,114 @@
+"""WebsiteEnricher against a local aiohttp stand-in for lead websites"""
+import asyncio
+import threading
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from GoogleMapsScraper import Lead, WebsiteEnricher
+
+PAGES = {
+    "/shop": '<a href="mailto:Info@corner-shop.net">Mail us</a>'
+             '<a href="https://www.facebook.com/sharer/sharer.php?u=x">Share</a>'
+             '<a href="https://www.facebook.com/cornershop">Facebook</a>'
+             '<a href="https://instagram.com/cornershop">Instagram</a>',
+    "/plain": '<p>No address here</p><a href="/contact-us">Contact</a>',
+    "/contact-us": '<p>Write to hello@plain-bakery.org</p>',
+    "/private/": '<a href="mailto:secret@hidden.net">Secret</a>',
+}
+
+
+@pytest.fixture
+def site():
+    """Serve the pages on a loop of their own, as the enricher runs its loop in a thread too"""
+    hits = {}
+
+    async def page(request):
+        hits[request.path] = hits.get(request.path, 0) + 1
+        if request.path == "/robots.txt":
+            return web.Response(text="User-agent: *\nDisallow: /private")
+        if request.path == "/slow":
+            await asyncio.sleep(5)
+        if request.path in PAGES:
+            return web.Response(text=PAGES[request.path], content_type="text/html")
+        return web.Response(status=404)
+
+    app = web.Application()
+    app.router.add_route("GET", "/{tail:.*}", page)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    server = TestServer(app, host="127.0.0.1")
+    asyncio.run_coroutine_threadsafe(server.start_server(), loop).result()
+    yield lambda path: str(server.make_url(path)), hits
+    asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def enrich(leads, **options):
+    """Run leads through a fresh enricher and return the committed leads and its stats"""
+    committed = []
+    enricher = WebsiteEnricher(committed.append, **options)
+    enricher.start()
+    for lead in leads:
+        enricher.submit(lead)
+    enricher.close(timeout=10)
+    return committed, enricher.stats
+
+
+def test_emails_and_social_profiles(site):
+    url, hits = site
+    lead = Lead(name="Corner Shop", website=url("/shop"))
+    committed, stats = enrich([lead])
+    assert committed == [lead]
+    assert lead.http_status == 200
+    assert lead.email == "info@corner-shop.net"
+    # Share buttons are not profiles
+    assert lead.socials == "https://www.facebook.com/cornershop; https://instagram.com/cornershop"
+    assert stats["emails"] == 1 and stats["socials"] == 1
+
+
+def test_contact_page_is_read_when_home_page_has_no_email(site):
+    url, hits = site
+    lead = Lead(name="Plain Bakery", website=url("/plain"))
+    enrich([lead])
+    assert lead.email == "hello@plain-bakery.org"
+    assert hits["/contact-us"] == 1
+
+
+def test_robots_disallow_skips_the_site(site):
+    url, hits = site
+    lead = Lead(name="Hidden", website=url("/private/"))
+    committed, stats = enrich([lead])
+    assert committed == [lead]
+    assert lead.email is None and lead.http_status is None
+    assert "/private/" not in hits
+    assert hits["/robots.txt"] == 1
+
+
+def test_results_are_cached_on_disk(site, tmp_path):
+    url, hits = site
+    cache_path = str(tmp_path / "cache.json")
+    enrich([Lead(name="Corner Shop", website=url("/shop"))], cache_path=cache_path)
+    lead = Lead(name="Corner Shop", website=url("/shop"))
+    committed, stats = enrich([lead], cache_path=cache_path)
+    assert hits["/shop"] == 1
+    assert stats["cached"] == 1 and stats["checked"] == 0
+    assert lead.email == "info@corner-shop.net"
+
+
+def test_timeout_commits_the_lead_unenriched(site, tmp_path):
+    url, hits = site
+    cache_path = str(tmp_path / "cache.json")
+    lead = Lead(name="Slow Site", website=url("/slow"))
+    committed, stats = enrich([lead], timeout=1, cache_path=cache_path)
+    assert committed == [lead]
+    assert lead.http_status == 0 and lead.email is None
+    assert stats["failed"] == 1
+    # Unreachable sites are not cached, so the next run tries again
+    assert url("/slow") not in WebsiteEnricher(None, cache_path=cache_path).cache